@@ -0,0 +1,78 @@
+"""Measure how long importing the package takes.
+
+Run with ``python benchmarks/import_time.py`` with the package installed.
+Every measurement starts a fresh interpreter, after aiohttp and pydantic
+are imported, so only the time spent in the package is counted. With
+``--max-ms`` the script exits with status 1 when importing the package
+takes longer, so it can guard against regressions in CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+ROUNDS = 7
+
+SCENARIOS = {
+    "import nightforo": "import nightforo",
+    "import errors": "from nightforo import XenForoError",
+    "import Client": "from nightforo import Client",
+    "Client + first parse": (
+        "from nightforo import Client, ThreadsGetResponse\n"
+        "ThreadsGetResponse.model_validate_json("
+        'b\'{"threads": [], "pagination": {"current_page": 1, '
+        '"last_page": 1, "per_page": 20, "shown": 0, "total": 0}}\')'
+    ),
+}
+
+TEMPLATE = """
+import time
+import aiohttp, pydantic
+started = time.perf_counter()
+{code}
+print(time.perf_counter() - started)
+"""
+
+
+def measure(code: str) -> float:
+    """Return the median time of ``code`` in fresh interpreters, in ms."""
+    times = []
+    for _ in range(ROUNDS):
+        output = subprocess.run(
+            [sys.executable, "-c", TEMPLATE.format(code=code)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        times.append(float(output) * 1000)
+
+    return statistics.median(times)
+
+
+def main() -> int:
+    """Print the import times and check them against the budget."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        help="fail when `import nightforo` takes longer than this",
+    )
+    args = parser.parse_args()
+
+    results = {name: measure(code) for name, code in SCENARIOS.items()}
+    for name, milliseconds in results.items():
+        print(f"  {name:<24} {milliseconds:8.1f} ms")
+
+    budget = args.max_ms
+    if budget is not None and results["import nightforo"] > budget:
+        print(f"import nightforo is over the budget of {budget:.1f} ms")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""Measure how parsing large pages delays the event loop.
+
+Run with ``python benchmarks/loop_lag.py`` with the package installed.
+Large post pages are parsed one after another while a ``LoopLagMonitor``
+records how late the event loop wakes up, first in the loop itself and
+then in the executors of ``ParseOffloader``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+from parsing import page
+
+from nightforo import (
+    LoopLagMonitor,
+    OffloadData,
+    OffloadExecutor,
+    ParseOffloader,
+    ThreadPostsGetResponse,
+    ValidationMode,
+    default_codec,
+)
+from nightforo.parsing import parse
+
+PAGES = 50
+
+
+async def run(name: str, parse_page: Callable[[], Awaitable[object]]) -> None:
+    """Parse ``PAGES`` pages and print the loop lag seen meanwhile."""
+    # The first parse builds the validators and starts the workers
+    await parse_page()
+
+    async with LoopLagMonitor(interval=0.001) as monitor:
+        started = time.perf_counter()
+        for _ in range(PAGES):
+            await parse_page()
+            # Let the monitor run between pages, as other requests would
+            await asyncio.sleep(0)
+        elapsed = time.perf_counter() - started
+
+    stats = monitor.stats
+    print(
+        f"  {name:<10} {elapsed * 1000 / PAGES:7.2f} ms/page, "
+        f"loop lag max {stats.max * 1000:6.2f} ms, "
+        f"mean {stats.mean * 1000:5.2f} ms"
+    )
+
+
+async def main() -> None:
+    """Compare parsing in the loop with both executors."""
+    model = ThreadPostsGetResponse
+    body = page(model, "posts")
+    loads = default_codec().loads
+    print(f"{model.__name__} ({len(body) / 1024:.0f} KiB), {PAGES} pages")
+
+    async def inline() -> object:
+        return parse(model, body)
+
+    await run("loop", inline)
+
+    for executor in OffloadExecutor:
+        offloader = ParseOffloader(OffloadData(threshold=0, executor=executor))
+        try:
+            await run(
+                executor.value,
+                lambda: offloader.parse(  # noqa: B023
+                    model, body, ValidationMode.VALIDATE, loads
+                ),
+            )
+        finally:
+            offloader.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
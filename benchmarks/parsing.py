@@ -0,0 +1,150 @@
+"""Compare response parsing modes on synthetic list pages.
+
+Run with ``python benchmarks/parsing.py`` with the package installed. Pages
+are generated from the response models themselves, with every optional
+field and nested model filled in, so they are close to the worst case seen
+in production.
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+from enum import Enum
+from typing import Any, Callable, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from nightforo import (
+    ThreadPostsGetResponse,
+    ThreadsGetResponse,
+    ValidationMode,
+    default_codec,
+    lazy_view,
+    project_list,
+)
+from nightforo.parsing import parse
+from nightforo.types.base import model_fields
+
+PER_PAGE = 20
+ROUNDS = 200
+
+
+def sample(annotation: Any, seen: tuple[type, ...] = ()) -> Any:
+    """Build a JSON value matching ``annotation``."""
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if origin is Union or (origin is not None and type(None) in args):
+        options = [arg for arg in args if arg is not type(None)]
+        return sample(options[0], seen)
+
+    if origin in (list, tuple, set):
+        return [sample(args[0], seen)] if args else []
+
+    if origin is dict:
+        return {"1": sample(args[1], seen)} if args else {}
+
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return sample_model(annotation, seen)
+        if issubclass(annotation, Enum):
+            return next(iter(annotation)).value
+        if issubclass(annotation, bool):
+            return True
+        if issubclass(annotation, int):
+            return 123456
+        if issubclass(annotation, float):
+            return 1.5
+        if issubclass(annotation, str):
+            return "lorem ipsum dolor sit amet"
+
+    return None
+
+
+def sample_model(model: type[BaseModel], seen: tuple[type, ...] = ()) -> Any:
+    """Build a JSON object for ``model``, without recursing into itself."""
+    if model in seen:
+        return None
+
+    return {
+        field.alias or name: sample(field.annotation, (*seen, model))
+        for name, field in model_fields(model).items()
+    }
+
+
+def page(model: type[BaseModel], key: str) -> bytes:
+    """Build a page of ``PER_PAGE`` items under ``key``."""
+    document = sample_model(model)
+    document[key] = document[key] * PER_PAGE
+    # Check that the generated page is valid in the first place
+    model.model_validate(document)
+    return json.dumps(document).encode()
+
+
+def read(response: Any, key: str, fields: set[str]) -> None:
+    """Read ``fields`` of every item of a page."""
+    for item in getattr(response, key):
+        for name in fields:
+            getattr(item, name)
+
+
+def bench(name: str, run: Callable[[], Any]) -> float:
+    """Print and return milliseconds per page."""
+    seconds = min(timeit.repeat(run, number=ROUNDS, repeat=5)) / ROUNDS
+    print(f"  {name:<32} {seconds * 1000:8.3f} ms/page")
+    return seconds
+
+
+def main() -> None:
+    """Run the benchmark for thread and post pages."""
+    codec = default_codec()
+    print(f"codec: {codec.name}, {PER_PAGE} items per page")
+
+    for model, key, fields in (
+        (
+            ThreadsGetResponse,
+            "threads",
+            {"thread_id", "title", "last_post_date", "reply_count"},
+        ),
+        (ThreadPostsGetResponse, "posts", {"post_id", "user_id", "message"}),
+    ):
+        body = page(model, key)
+        print(f"{model.__name__} ({len(body) / 1024:.0f} KiB)")
+
+        baseline = bench(
+            "json.loads + model_validate",
+            lambda: model.model_validate(json.loads(body)),  # noqa: B023
+        )
+        default = bench(
+            ValidationMode.VALIDATE.value,
+            lambda: parse(model, body),  # noqa: B023
+        )
+        slim = project_list(model, key, fields)
+        projected = bench(
+            f"projection of {len(fields)} fields",
+            lambda: parse(slim, body),  # noqa: B023
+        )
+        lazy = bench(
+            f"{ValidationMode.LAZY.value}, {len(fields)} fields read",
+            lambda: read(
+                lazy_view(model, codec.loads(body)),  # noqa: B023
+                key,  # noqa: B023
+                fields,  # noqa: B023
+            ),
+        )
+        # The other modes are compared with the default one, the old path
+        # is only listed for reference
+        print(
+            f"  {ValidationMode.VALIDATE.value} over json.loads + "
+            f"model_validate: {baseline / default:.1f}x"
+        )
+        print(
+            f"  speedup over {ValidationMode.VALIDATE.value}: "
+            f"{default / projected:.1f}x projection, "
+            f"{default / lazy:.1f}x lazy"
+        )
+
+
+if __name__ == "__main__":
+    main()
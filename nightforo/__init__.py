@@ -1,38 +1,433 @@
+"""Asynchronous client of the XenForo REST API.
+
+Public names are imported from their modules on first access, so importing
+the package does not load the client and the models up front. Importing
+``Client`` still imports every model module, since the client refers to
+the response models, only their validators are built later, on first use.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "1.1.9"
 
-from .client import *  # noqa: F403
-from .errors import *  # noqa: F403
-from .types.alert import *  # noqa: F403
-from .types.api_key_type import *  # noqa: F403
-from .types.api_scopes import *  # noqa: F403
-from .types.attachment import *  # noqa: F403
-from .types.auth import *  # noqa: F403
-from .types.conversation import *  # noqa: F403
-from .types.conversation_message import *  # noqa: F403
-from .types.direction import *  # noqa: F403
-from .types.discussion_state import *  # noqa: F403
-from .types.file import *  # noqa: F403  # noqa: F403
-from .types.forum import *  # noqa: F403
-from .types.forum_type import *  # noqa: F403
-from .types.groups import *  # noqa: F403
-from .types.me import *  # noqa: F403
-from .types.node import *  # noqa: F403
-from .types.node_type import *  # noqa: F403
-from .types.page import *  # noqa: F403
-from .types.pagination import *  # noqa: F403  # noqa: F403
-from .types.post import *  # noqa: F403
-from .types.post_react_state import *  # noqa: F403
-from .types.profile_post import *  # noqa: F403
-from .types.profile_post_comment import *  # noqa: F403
-from .types.stats import *  # noqa: F403
-from .types.thread import *  # noqa: F403
-from .types.thread_type import *  # noqa: F403
-from .types.user import *  # noqa: F403
-from .types.vote_type import *  # noqa: F403
-from .utils.logger import *  # noqa: F403
-
-Post.model_rebuild()  # noqa: F405
-Thread.model_rebuild()  # noqa: F405
-UserGetResponse.model_rebuild()  # noqa: F405
-ProfilePostGetResponse.model_rebuild()  # noqa: F405
-ProfilePostCommentGetResponse.model_rebuild()  # noqa: F405
+if TYPE_CHECKING:
+    from .cache import *  # noqa: F403
+    from .client import *  # noqa: F403
+    from .codec import *  # noqa: F403
+    from .connection import *  # noqa: F403
+    from .errors import *  # noqa: F403
+    from .identity import *  # noqa: F403
+    from .instrumentation import *  # noqa: F403
+    from .lazy import *  # noqa: F403
+    from .loader import *  # noqa: F403
+    from .metrics import *  # noqa: F403
+    from .offload import *  # noqa: F403
+    from .paginator import *  # noqa: F403
+    from .parsing import *  # noqa: F403
+    from .projection import *  # noqa: F403
+    from .ratelimit import *  # noqa: F403
+    from .records import *  # noqa: F403
+    from .retry import *  # noqa: F403
+    from .singleflight import *  # noqa: F403
+    from .stream import *  # noqa: F403
+    from .timeouts import *  # noqa: F403
+    from .types.alert import *  # noqa: F403
+    from .types.api_key_type import *  # noqa: F403
+    from .types.api_scopes import *  # noqa: F403
+    from .types.attachment import *  # noqa: F403
+    from .types.auth import *  # noqa: F403
+    from .types.conversation import *  # noqa: F403
+    from .types.conversation_message import *  # noqa: F403
+    from .types.direction import *  # noqa: F403
+    from .types.discussion_state import *  # noqa: F403
+    from .types.file import *  # noqa: F403
+    from .types.forum import *  # noqa: F403
+    from .types.forum_type import *  # noqa: F403
+    from .types.groups import *  # noqa: F403
+    from .types.me import *  # noqa: F403
+    from .types.node import *  # noqa: F403
+    from .types.node_type import *  # noqa: F403
+    from .types.page import *  # noqa: F403
+    from .types.pagination import *  # noqa: F403
+    from .types.post import *  # noqa: F403
+    from .types.post_react_state import *  # noqa: F403
+    from .types.profile_post import *  # noqa: F403
+    from .types.profile_post_comment import *  # noqa: F403
+    from .types.stats import *  # noqa: F403
+    from .types.thread import *  # noqa: F403
+    from .types.thread_type import *  # noqa: F403
+    from .types.user import *  # noqa: F403
+    from .types.vote_type import *  # noqa: F403
+    from .uploads import *  # noqa: F403
+    from .utils.logger import *  # noqa: F403
+    from .utils.loop_lag import *  # noqa: F403
+    from .warmup import *  # noqa: F403
+
+# Public names by the module defining them
+_MODULES: dict[str, tuple[str, ...]] = {
+    ".cache": (
+        "CacheData",
+        "CacheStats",
+        "ResponseCache",
+    ),
+    ".client": ("Client",),
+    ".codec": (
+        "JSONCodec",
+        "default_codec",
+        "stdlib_codec",
+    ),
+    ".connection": ("ConnectionData",),
+    ".errors": (
+        "ClientClosedError",
+        "DeadlineExceededError",
+        "NightForoBaseError",
+        "NoApiKeyProvidedError",
+        "RateLimitedError",
+        "UnsupportedEndpointMethodError",
+        "XenForoError",
+    ),
+    ".identity": (
+        "IdentityData",
+        "IdentityMap",
+        "IdentityScope",
+        "identity_model",
+    ),
+    ".instrumentation": (
+        "Instrumentation",
+        "InstrumentationData",
+        "RequestTiming",
+        "RouteStats",
+    ),
+    ".lazy": (
+        "LazyView",
+        "lazy_view",
+    ),
+    ".loader": (
+        "DataLoader",
+        "LoaderData",
+    ),
+    ".metrics": (
+        "ClientMetrics",
+        "Counter",
+        "Gauge",
+        "Histogram",
+        "MetricsData",
+        "MetricsRegistry",
+        "metrics_handler",
+    ),
+    ".offload": (
+        "OffloadData",
+        "OffloadExecutor",
+        "ParseOffloader",
+    ),
+    ".paginator": ("paginate",),
+    ".parsing": (
+        "ValidationMode",
+        "parse",
+    ),
+    ".projection": (
+        "Projection",
+        "project",
+        "project_list",
+    ),
+    ".ratelimit": (
+        "RateLimit",
+        "RateLimitData",
+        "RateLimiter",
+        "TokenBucket",
+    ),
+    ".records": (
+        "ConversationRecord",
+        "NodeRecord",
+        "PostRecord",
+        "ThreadRecord",
+        "UserAlertRecord",
+        "UserRecord",
+    ),
+    ".retry": ("RetryData",),
+    ".singleflight": (
+        "SingleFlight",
+        "SingleFlightStats",
+    ),
+    ".stream": ("DataStream",),
+    ".timeouts": (
+        "TimeoutData",
+        "deadline",
+        "remaining",
+        "request_timeout",
+    ),
+    ".types.alert": (
+        "AlertActionTypeEnum",
+        "AlertGetResponse",
+        "AlertMarkParams",
+        "AlertMarkResponse",
+        "AlertSendParams",
+        "AlertSendResponse",
+        "AlertsGetParams",
+        "AlertsGetResponse",
+        "AlertsMarkAllParams",
+        "AlertsMarkAllResponse",
+        "UserAlert",
+    ),
+    ".types.api_key_type": ("ApiKeyTypeEnum",),
+    ".types.api_scopes": ("APIScopeIdsEnum",),
+    ".types.attachment": (
+        "Attachment",
+        "AttachmentDeleteResponse",
+        "AttachmentGetDataResponse",
+        "AttachmentGetResponse",
+        "AttachmentGetThumbnailResponse",
+        "AttachmentUploadParams",
+        "AttachmentUploadResponse",
+        "AttachmentsCreateNewKeyParams",
+        "AttachmentsCreateNewKeyResponse",
+        "AttachmentsGetParams",
+        "AttachmentsGetResponse",
+    ),
+    ".types.auth": (
+        "AuthFromSessionParams",
+        "AuthFromSessionResponse",
+        "AuthLoginTokenParams",
+        "AuthLoginTokenResponse",
+        "AuthTestParams",
+        "AuthTestResponse",
+    ),
+    ".types.conversation": (
+        "Conversation",
+        "ConversationCreateParams",
+        "ConversationCreateResponse",
+        "ConversationDeleteParams",
+        "ConversationDeleteResponse",
+        "ConversationGetMessagesParams",
+        "ConversationGetParams",
+        "ConversationGetResponse",
+        "ConversationInviteParams",
+        "ConversationInviteResponse",
+        "ConversationMarkReadParams",
+        "ConversationMarkReadResponse",
+        "ConversationMarkUnreadResponse",
+        "ConversationMessagesGetResponse",
+        "ConversationStarParams",
+        "ConversationStarResponse",
+        "ConversationUpdateParams",
+        "ConversationUpdateResponse",
+        "ConversationsGetParams",
+        "ConversationsGetResponse",
+    ),
+    ".types.conversation_message": (
+        "ConversationMessage",
+        "ConversationMessageGetResponse",
+        "ConversationMessageReactActionEnum",
+        "ConversationMessageReactParams",
+        "ConversationMessageReactResponse",
+        "ConversationMessageReplyParams",
+        "ConversationMessageReplyResponse",
+        "ConversationMessageUpdateParams",
+        "ConversationMessageUpdateResponse",
+    ),
+    ".types.direction": ("DirectionTypeEnum",),
+    ".types.discussion_state": ("DiscussionStateEnum",),
+    ".types.file": (
+        "FileSource",
+        "UploadProgress",
+        "XenforoFile",
+    ),
+    ".types.forum": (
+        "ForumGetParams",
+        "ForumGetResponse",
+        "ForumMarkReadParams",
+        "ForumMarkReadResponse",
+        "ForumThreadsGetParams",
+        "ForumThreadsGetResponse",
+        "ForumTypeData",
+        "SearchForumTypeData",
+    ),
+    ".types.forum_type": ("ForumTypeEnum",),
+    ".types.groups": (
+        "ArzGuardGroupsIdsEnum",
+        "ArzGuardGroupsNamesEnum",
+    ),
+    ".types.me": (
+        "MeAvatarDeleteResponse",
+        "MeAvatarUpdateResponse",
+        "MeEmailUpdateParams",
+        "MeEmailUpdateResponse",
+        "MeGetResponse",
+        "MePasswordUpdateParams",
+        "MePasswordUpdateResponse",
+        "MeUpdateParams",
+        "MeUpdateResponse",
+    ),
+    ".types.node": (
+        "AnyNodeCreateParams",
+        "Breadcrumb",
+        "CategoryNodeCreateParams",
+        "ForumNodeCreateParams",
+        "LinkForumNodeCreateParams",
+        "Node",
+        "NodeCreateResponse",
+        "NodeDeleteParams",
+        "NodeDeleteResponse",
+        "NodeGetResponse",
+        "NodeUpdateParams",
+        "NodeUpdateResponse",
+        "NodesFlattenedGetResponse",
+        "NodesGetResponse",
+        "PageNodeCreateParams",
+        "SearchForumNodeCreateParams",
+    ),
+    ".types.node_type": ("NodeTypeEnum",),
+    ".types.page": ("PageTypeData",),
+    ".types.pagination": ("Pagination",),
+    ".types.post": (
+        "Post",
+        "PostCreateParams",
+        "PostCreateResponse",
+        "PostDeleteParams",
+        "PostDeleteResponse",
+        "PostGetResponse",
+        "PostMarkSolutionResponse",
+        "PostReactParams",
+        "PostReactResponse",
+        "PostUpdateParams",
+        "PostUpdateResponse",
+        "PostVoteParams",
+        "PostVoteResponse",
+    ),
+    ".types.post_react_state": ("PostReactStateEnum",),
+    ".types.profile_post": (
+        "ProfilePost",
+        "ProfilePostCommentsGetResponse",
+        "ProfilePostCreateParams",
+        "ProfilePostCreateResponse",
+        "ProfilePostDeleteParams",
+        "ProfilePostDeleteResponse",
+        "ProfilePostGetParams",
+        "ProfilePostGetResponse",
+        "ProfilePostReactParams",
+        "ProfilePostReactResponse",
+        "ProfilePostUpdateParams",
+        "ProfilePostUpdateResponse",
+    ),
+    ".types.profile_post_comment": (
+        "ProfilePostComment",
+        "ProfilePostCommentCreateParams",
+        "ProfilePostCommentCreateResponse",
+        "ProfilePostCommentDeleteParams",
+        "ProfilePostCommentDeleteResponse",
+        "ProfilePostCommentGetResponse",
+        "ProfilePostCommentReactParams",
+        "ProfilePostCommentReactResponse",
+        "ProfilePostCommentUpdateParams",
+        "ProfilePostCommentUpdateResponse",
+        "ProfilePostCommentsGetParams",
+    ),
+    ".types.stats": (
+        "LatestUser",
+        "Online",
+        "StatsResponse",
+        "Totals",
+    ),
+    ".types.thread": (
+        "OrderField",
+        "Thread",
+        "ThreadChangeTypeParams",
+        "ThreadChangeTypeResponse",
+        "ThreadCreateParams",
+        "ThreadCreateResponse",
+        "ThreadDeleteParams",
+        "ThreadDeleteResponse",
+        "ThreadGetParams",
+        "ThreadGetResponse",
+        "ThreadMarkReadParams",
+        "ThreadMarkReadResponse",
+        "ThreadMoveParams",
+        "ThreadMoveResponse",
+        "ThreadPostsGetParams",
+        "ThreadPostsGetResponse",
+        "ThreadUpdateParams",
+        "ThreadUpdateResponse",
+        "ThreadVoteParams",
+        "ThreadVoteResponse",
+        "ThreadsGetParams",
+        "ThreadsGetResponse",
+    ),
+    ".types.thread_type": ("ThreadTypeEnum",),
+    ".types.user": (
+        "DateOfBirth",
+        "DemoteUserResponse",
+        "GetDemoteGroupsResponse",
+        "GetPromoteGroupsResponse",
+        "Option",
+        "Privacy",
+        "Profile",
+        "ProfileAvatars",
+        "ProfileBanners",
+        "ProfilePrivacyLevelEnum",
+        "PromoteUserResponse",
+        "User",
+        "UserAvatarDeleteResponse",
+        "UserAvatarUpdateResponse",
+        "UserCreateParams",
+        "UserCreateResponse",
+        "UserCustomFields",
+        "UserDeleteParams",
+        "UserDeleteResponse",
+        "UserDemoteParams",
+        "UserFindEmailResponse",
+        "UserFindNameResponse",
+        "UserGetParams",
+        "UserGetResponse",
+        "UserProfilePostsGetParams",
+        "UserProfilePostsGetResponse",
+        "UserPromoteParams",
+        "UserStateEnum",
+        "UserUpdateParams",
+        "UserUpdateResponse",
+        "UsersFindEmailParams",
+        "UsersFindNameParams",
+        "UsersGetParams",
+        "UsersGetResponse",
+    ),
+    ".types.vote_type": ("VoteTypeEnum",),
+    ".uploads": (
+        "AttachmentUploadResult",
+        "FileUploadResult",
+        "UploadData",
+    ),
+    ".utils.logger": (
+        "LoggerData",
+        "setup_logging",
+    ),
+    ".utils.loop_lag": (
+        "LoopLagMonitor",
+        "LoopLagStats",
+    ),
+    ".warmup": (
+        "SchemaWarmUp",
+        "WarmUpData",
+    ),
+}
+
+_EXPORTS = {
+    name: module for module, names in _MODULES.items() for name in names
+}
+
+__all__ = tuple(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_EXPORTS})
@@ -0,0 +1,199 @@
+"""In-memory response cache for read endpoints."""
+
+from __future__ import annotations
+
+import copy
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Tuple
+
+from .codec import JSONCodec, default_codec
+
+__all__ = ("CacheData", "CacheStats", "ResponseCache")
+
+CacheKey = Tuple[str, str, str]
+
+
+def request_key(
+    url: str, query: dict[str, Any] | None, user: int | None
+) -> CacheKey:
+    """Build a key identifying a GET request.
+
+    Args:
+        url: Endpoint URL.
+        query: Dumped query parameters.
+        user: ID of the acting user (``XF-Api-User``), if any.
+    """
+    canonical = json.dumps(query or {}, sort_keys=True, default=str)
+    return (url, canonical, "" if user is None else str(user))
+
+
+def _default_ttl() -> dict[str, float]:
+    return {
+        "forums": 60.0,
+        "index": 300.0,
+        "nodes": 300.0,
+        "promote": 300.0,
+        "demote": 300.0,
+        "threads": 30.0,
+        "users": 60.0,
+    }
+
+
+@dataclass
+class CacheData:
+    """Settings of the response cache.
+
+    Only GET responses are cached. Families missing from ``ttl`` use
+    ``default_ttl`` and are not cached when it is ``None``.
+
+    Attributes:
+        max_size: Maximum number of cached responses, the least recently
+            used one is evicted first.
+        ttl: Seconds a response stays fresh, per endpoint family.
+        default_ttl: Seconds for families missing from ``ttl``.
+    """
+
+    max_size: int = 1024
+    ttl: dict[str, float] = field(default_factory=_default_ttl)
+    default_ttl: float | None = None
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    refreshes: int = 0
+    size: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache:
+    """Size-bounded LRU cache with a TTL per endpoint family.
+
+    Entries are raw response bodies, so they are immutable and returned
+    without copying.
+    """
+
+    def __init__(
+        self, data: CacheData, codec: JSONCodec | None = None
+    ) -> None:
+        self.data = data
+        self.codec = codec or default_codec()
+        self._entries: OrderedDict[CacheKey, tuple[float, bytes]] = (
+            OrderedDict()
+        )
+        self._stats = CacheStats()
+
+    @property
+    def stats(self) -> CacheStats:
+        self._stats.size = len(self._entries)
+        return copy.copy(self._stats)
+
+    def ttl_for(self, family: str) -> float | None:
+        return self.data.ttl.get(family, self.data.default_ttl)
+
+    def get(self, key: CacheKey) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats.misses += 1
+            return None
+
+        expires_at, payload = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._stats.expirations += 1
+            self._stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return payload
+
+    def set(self, key: CacheKey, family: str, payload: bytes) -> None:
+        ttl = self.ttl_for(family)
+        if ttl is None or ttl <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, payload)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.data.max_size:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def invalidate(self, url: str, payload: bytes | None = None) -> None:
+        """Drop or refresh cached reads of an entity after it was changed.
+
+        Entries cached for ``url`` itself are refreshed in place when the
+        write response carries the same top-level keys as the cached read,
+        e.g. ``thread`` in both ``ThreadUpdateResponse`` and
+        ``ThreadGetResponse``, unless one of those keys is null, e.g.
+        ``user`` of ``UserPromoteResponse``. Every other entry of ``url``
+        or of the URLs below it is evicted. Listings of other URLs expire by TTL.
+
+        Args:
+            url: URL of the changed entity, e.g. ``.../threads/1``.
+            payload: Response body of the mutating request.
+        """
+        changes = None
+        prefix = url + "/"
+        for key in list(self._entries):
+            entry_url = key[0]
+            if entry_url != url and not entry_url.startswith(prefix):
+                continue
+
+            expires_at, cached = self._entries[key]
+            if entry_url == url and payload is not None:
+                if changes is None:
+                    changes = self._decode(payload)
+
+                refreshed = self._refresh(cached, changes)
+                if refreshed is not None:
+                    self._entries[key] = (expires_at, refreshed)
+                    self._stats.refreshes += 1
+                    continue
+
+            del self._entries[key]
+            self._stats.invalidations += 1
+
+    def _decode(self, body: bytes) -> dict[str, Any]:
+        try:
+            decoded = self.codec.loads(body)
+        except ValueError:
+            return {}
+
+        return decoded if isinstance(decoded, dict) else {}
+
+    def _refresh(self, cached: bytes, changes: dict[str, Any]) -> bytes | None:
+        """Apply shared top-level keys of a write response to an entry."""
+        names = [name for name in changes if name != "success"]
+        if not names:
+            return None
+
+        read = self._decode(cached)
+        shared = [name for name in names if name in read]
+        if not shared:
+            return None
+
+        # A null tells nothing about the entity and the cached read may
+        # not accept it, so the entry is evicted instead
+        if any(changes[name] is None for name in shared):
+            return None
+
+        for name in shared:
+            read[name] = changes[name]
+
+        return self.codec.dumps(read)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -2,10 +2,53 @@
 
 from __future__ import annotations
 
-from typing import BinaryIO
+import asyncio
+import io
+import os
+import time
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Iterable,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel
 
+from .cache import CacheData, ResponseCache
+from .codec import JSONCodec
+from .connection import ConnectionData
+from .endpoint import HTTPMethod
 from .errors import NoApiKeyProvidedError
 from .http import HTTPClient
+from .identity import CONTEXT_KEY as IDENTITY_CONTEXT_KEY
+from .identity import (
+    IdentityData,
+    IdentityMap,
+    IdentityScope,
+    identity_model,
+)
+from .instrumentation import (
+    Instrumentation,
+    InstrumentationData,
+    RequestTiming,
+)
+from .lazy import lazy_view
+from .loader import DataLoader, LoaderData
+from .metrics import ClientMetrics, MetricsData
+from .offload import OffloadData, ParseOffloader
+from .paginator import paginate
+from .parsing import ValidationMode, parse
+from .projection import Projection, project_list
+from .ratelimit import RateLimitData
+from .retry import RetryData
+from .singleflight import SingleFlightStats
+from .timeouts import TimeoutData
 from .types.alert import (
     AlertGetResponse,
     AlertMarkParams,
@@ -16,8 +59,10 @@ from .types.alert import (
     AlertsGetResponse,
     AlertsMarkAllParams,
     AlertsMarkAllResponse,
+    UserAlert,
 )
 from .types.attachment import (
+    Attachment,
     AttachmentDeleteResponse,
     AttachmentGetDataResponse,
     AttachmentGetResponse,
@@ -37,7 +82,9 @@ from .types.auth import (
     AuthTestParams,
     AuthTestResponse,
 )
+from .types.content_type import ContentTypeEnum
 from .types.conversation import (
+    Conversation,
     ConversationCreateParams,
     ConversationCreateResponse,
     ConversationDeleteParams,
@@ -59,6 +106,7 @@ from .types.conversation import (
     ConversationUpdateResponse,
 )
 from .types.conversation_message import (
+    ConversationMessage,
     ConversationMessageGetResponse,
     ConversationMessageReactParams,
     ConversationMessageReactResponse,
@@ -67,6 +115,7 @@ from .types.conversation_message import (
     ConversationMessageUpdateParams,
     ConversationMessageUpdateResponse,
 )
+from .types.file import FileSource, UploadProgress
 from .types.forum import (
     ForumGetParams,
     ForumGetResponse,
@@ -91,6 +140,7 @@ from .types.me.params import (
     MeUpdateParams,
 )
 from .types.node import (
+    Node,
     NodeCreateResponse,
     NodeDeleteParams,
     NodeDeleteResponse,
@@ -102,6 +152,7 @@ from .types.node import (
 )
 from .types.node.params import AnyNodeCreateParams
 from .types.post import (
+    Post,
     PostCreateParams,
     PostCreateResponse,
     PostDeleteParams,
@@ -116,6 +167,7 @@ from .types.post import (
     PostVoteResponse,
 )
 from .types.profile_post import (
+    ProfilePost,
     ProfilePostCommentsGetResponse,
     ProfilePostCreateParams,
     ProfilePostCreateResponse,
@@ -129,6 +181,7 @@ from .types.profile_post import (
     ProfilePostUpdateResponse,
 )
 from .types.profile_post_comment import (
+    ProfilePostComment,
     ProfilePostCommentCreateParams,
     ProfilePostCommentCreateResponse,
     ProfilePostCommentDeleteParams,
@@ -142,6 +195,7 @@ from .types.profile_post_comment import (
 )
 from .types.stats import StatsResponse
 from .types.thread import (
+    Thread,
     ThreadChangeTypeParams,
     ThreadChangeTypeResponse,
     ThreadCreateParams,
@@ -169,6 +223,7 @@ from .types.user import (
     GetDemoteGroupsResponse,
     GetPromoteGroupsResponse,
     PromoteUserResponse,
+    User,
     UserAvatarDeleteResponse,
     UserAvatarUpdateResponse,
     UserCreateParams,
@@ -191,10 +246,24 @@ from .types.user import (
     UserUpdateResponse,
 )
 from .types.vote_type import VoteTypeEnum
+from .uploads import (
+    AttachmentUploadResult,
+    FileUploadResult,
+    UploadData,
+    upload_files,
+)
 from .utils.logger import LoggerData, setup_logging
+from .warmup import SchemaWarmUp, WarmUpData
+
+if TYPE_CHECKING:
+    from types import TracebackType
 
 __all__ = ("Client",)
 
+M = TypeVar("M", bound=BaseModel)
+
+DownloadProgress = Callable[[int, Union[int, None]], Any]
+
 
 class Client:
     """XenForo API Client
@@ -209,6 +278,46 @@ class Client:
         Если вы используете ключ c правами супер пользователя
     xf_user_id: bool
         ID Пользователя, от лица которого будет выполнено действие, если вы используете ключ c правами супер пользователя
+    logger_data: LoggerData, опционален
+        Настройки логирования
+    connection_data: ConnectionData, опционален
+        Настройки пула соединений: лимиты, keep-alive, DNS кэш и количество заранее открытых соединений
+    rate_limit_data: RateLimitData, опционален
+        Настройки ограничителя частоты запросов: общий лимит и лимиты для групп эндпоинтов (threads, posts, users, alerts...). При ответе 429 скорость снижается, заголовок Retry-After учитывается, a запрос отправляется повторно
+    retry_data: RetryData, опционален
+        Политика повторов для GET запросов: количество попыток, экспоненциальная задержка co случайным разбросом и общий дедлайн. Повторяются только обрывы соединения, таймауты и ответы 5xx; ошибки вроде no_permission или not_found возвращаются сразу. По умолчанию RetryData(), RetryData(max_attempts=1) отключает повторы
+    timeout_data: TimeoutData, опционален
+        Таймауты одной попытки запроса: подключение, чтение из сокета и общий. Для отдельного вызова их можно переопределить через request_timeout(), a общий дедлайн для группы запросов задается через deadline()
+    cache_data: CacheData, опционален
+        Включает кэш GET ответов в памяти: LRU c ограничением размера и временем жизни для каждой группы эндпоинтов. Ключ кэша - URL, параметры запроса и XF-Api-User. Статистика доступна через client.cache.stats
+    coalesce_requests: bool
+        Объединять одновременные одинаковые GET запросы (тот же URL, параметры и пользователь) в один HTTP запрос. Каждый вызов получает свою копию ответа. По умолчанию True, статистика доступна через client.coalescing_stats
+    loader_data: LoaderData, опционален
+        Настройки методов load_user, load_thread, load_post и load_node: окно накопления ID и максимальное число одновременных запросов
+    codec: JSONCodec, опционален
+        JSON библиотека для разбора ответов. По умолчанию orjson или ujson, если установлены, иначе стандартный json
+    validation_mode: ValidationMode, опционален
+        Как создаются модели ответов. ValidationMode.VALIDATE (по умолчанию) проверяет каждое поле. ValidationMode.LAZY возвращает представления LazyView c теми же атрибутами, поле проверяется при первом обращении к нему. Сравнение скорости: benchmarks/parsing.py
+    upload_data: UploadData, опционален
+        Настройки методов upload_attachments, create_thread_with_attachments и create_post_with_attachments: число одновременно загружаемых файлов и политика повторов для каждого файла
+    identity_data: IdentityData, опционален
+        Включает identity map: одинаковые пользователи (user_id, last_activity и набор полей) в ответе (IdentityScope.RESPONSE) или во всех ответах сессии (IdentityScope.SESSION) проверяются один раз и возвращаются одним общим замороженным экземпляром: присваивание полям вызывает ValidationError, для изменяемой копии используйте model_copy(). Работает в режиме ValidationMode.VALIDATE
+    instrumentation_data: InstrumentationData, опционален
+        Включает замеры времени каждой фазы запроса по маршрутам (например "GET threads/{id}/posts"): ожидание ограничителя частоты, получение соединения, время до первого байта, чтение тела, декодирование JSON и создание модели, a также задержку event loop. Статистика доступна через client.instrumentation.stats, каждый замер передается в InstrumentationData.callback
+    metrics_data: MetricsData, опционален
+        Включает метрики в формате Prometheus: число запросов по маршруту, методу и статусу, гистограмма времени запросов, ошибки по кодам XenForo, повторы, ожидание ограничителя частоты, кэш и заполненность пула соединений. Текст метрик возвращает client.metrics.render(), для aiohttp приложения есть metrics_handler(client.metrics.registry). Включает instrumentation_data, если оно не передано
+    offload_data: OffloadData, опционален
+        Разбирает большие ответы (от OffloadData.threshold байт) в пуле потоков или процессов (OffloadExecutor.PROCESS), чтобы разбор не останавливал event loop. Задержку event loop можно измерить c помощью LoopLagMonitor, сравнение: benchmarks/loop_lag.py
+    warm_up: WarmUpData, опционален
+        Собирает валидаторы моделей ответов при создании клиента, по умолчанию в фоновом потоке, чтобы первые запросы после запуска не тратили на это время. Время сборки каждой модели доступно через client.warm_up.timings
+
+    Сессия создается при первом запросе. Клиент можно использовать как
+    асинхронный контекстный менеджер, тогда соединения будут открыты при
+    входе, a при выходе клиент дождется завершения текущих запросов и
+    закроет сессию::
+
+        async with Client(api_key) as client:
+            await client.get_thread(1)
 
     Ошибки:
     ------
@@ -222,6 +331,21 @@ class Client:
         is_super_user: bool = False,
         xf_user_id: int | None = None,
         logger_data: LoggerData | None = None,
+        connection_data: ConnectionData | None = None,
+        rate_limit_data: RateLimitData | None = None,
+        retry_data: RetryData | None = None,
+        timeout_data: TimeoutData | None = None,
+        cache_data: CacheData | None = None,
+        coalesce_requests: bool = True,
+        loader_data: LoaderData | None = None,
+        upload_data: UploadData | None = None,
+        codec: JSONCodec | None = None,
+        validation_mode: ValidationMode = ValidationMode.VALIDATE,
+        identity_data: IdentityData | None = None,
+        instrumentation_data: InstrumentationData | None = None,
+        metrics_data: MetricsData | None = None,
+        offload_data: OffloadData | None = None,
+        warm_up: WarmUpData | None = None,
     ) -> None:
         if api_key == "":
             raise NoApiKeyProvidedError()
@@ -233,9 +357,260 @@ class Client:
 
         setup_logging(logger_data)
 
+        # Metrics are fed by the instrumentation
+        if metrics_data is not None and instrumentation_data is None:
+            instrumentation_data = InstrumentationData()
+
         self._is_super_user = is_super_user
         self.xf_user_id = xf_user_id
-        self._http = HTTPClient(api_key, is_super_user, xf_user_id)
+        self._http = HTTPClient(
+            api_key,
+            is_super_user,
+            xf_user_id,
+            connection_data=connection_data,
+            rate_limit_data=rate_limit_data,
+            retry_data=retry_data,
+            timeout_data=timeout_data,
+            cache_data=cache_data,
+            coalesce_requests=coalesce_requests,
+            codec=codec,
+            instrumentation_data=instrumentation_data,
+        )
+
+        self._user_loader: DataLoader[int, User] = DataLoader(
+            self._fetch_user, loader_data
+        )
+        self._thread_loader: DataLoader[int, Thread] = DataLoader(
+            self._fetch_thread, loader_data
+        )
+        self._post_loader: DataLoader[int, Post] = DataLoader(
+            self._fetch_post, loader_data
+        )
+        self._node_loader: DataLoader[int, Node] = DataLoader(
+            self._fetch_node, loader_data
+        )
+        self._upload_data = upload_data or UploadData()
+        self.validation_mode = validation_mode
+        self._identity_data = identity_data
+        self._identity_map = (
+            IdentityMap(identity_data.maxsize)
+            if identity_data is not None
+            and identity_data.scope is IdentityScope.SESSION
+            else None
+        )
+        self._metrics = None
+        instrumentation = self._http.instrumentation
+        if metrics_data is not None and instrumentation is not None:
+            self._metrics = ClientMetrics(self._http, metrics_data)
+            instrumentation.add_listener(self._metrics.observe)
+
+        self._offloader = (
+            ParseOffloader(offload_data) if offload_data is not None else None
+        )
+        self._warm_up = SchemaWarmUp(warm_up) if warm_up is not None else None
+        if self._warm_up is not None:
+            self._warm_up.start()
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        """Кэш ответов или None, если он не включен"""
+
+        return self._http.cache
+
+    @property
+    def identity_map(self) -> IdentityMap | None:
+        """Общие экземпляры пользователей сессии или None"""
+
+        return self._identity_map
+
+    @property
+    def instrumentation(self) -> Instrumentation | None:
+        """Замеры времени запросов или None, если они не включены"""
+
+        return self._http.instrumentation
+
+    @property
+    def metrics(self) -> ClientMetrics | None:
+        """Метрики запросов или None, если они не включены"""
+
+        return self._metrics
+
+    @property
+    def warm_up(self) -> SchemaWarmUp | None:
+        """Сборка валидаторов моделей или None, если она не включена"""
+
+        return self._warm_up
+
+    @property
+    def coalescing_stats(self) -> SingleFlightStats | None:
+        """Сколько GET запросов выполнено и сколько объединено c уже выполняющимися"""
+
+        single_flight = self._http.single_flight
+        return single_flight.stats if single_flight else None
+
+    async def __aenter__(self) -> Client:
+        """Открыть сессию при входе в контекстный менеджер"""
+
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Закрыть сессию при выходе из контекстного менеджера"""
+
+        await self.close()
+
+    async def start(self) -> None:
+        """Открыть сессию и заранее установить соединения
+
+        Количество соединений задается параметром
+        ConnectionData.warmup_connections. Вызывать не обязательно: сессия
+        будет создана при первом запросе.
+        """
+
+        await self._http.start()
+
+    async def close(self) -> None:
+        """Закрыть сессию
+
+        Дожидается завершения текущих запросов (не дольше
+        ConnectionData.close_timeout секунд), после чего закрывает все
+        соединения. Новые запросы во время закрытия завершаются ошибкой
+        ClientClosedError.
+        """
+
+        await self._http.close()
+        if self._offloader is not None:
+            self._offloader.close()
+
+    def _list_model(
+        self, model: type[M], key: str, fields: Projection | None
+    ) -> type[M]:
+        """Return the model pages of a paginator are parsed into."""
+        if fields is None:
+            return model
+
+        return project_list(model, key, fields)  # type: ignore
+
+    async def _parse(self, model: type[M], payload: bytes) -> M:
+        instrumentation = self._http.instrumentation
+        if instrumentation is None:
+            return await self._convert(model, payload)
+
+        timing = instrumentation.pending()
+        if timing is None:
+            return await self._convert(model, payload)
+
+        started = time.perf_counter()
+        error = None
+        try:
+            return await self._convert(model, payload, timing)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            timing.validate = time.perf_counter() - started - timing.decode
+            instrumentation.finish(timing, error)
+
+    async def _convert(
+        self,
+        model: type[M],
+        payload: bytes,
+        timing: RequestTiming | None = None,
+    ) -> M:
+        offloader = self._offloader
+        if offloader is None or not offloader.should_offload(payload):
+            return self._parse_now(model, payload, timing)
+
+        if (
+            self._identity_data is None
+            and self.validation_mode is not ValidationMode.LAZY
+        ):
+            return await offloader.parse(model, payload)
+
+        # Identity maps and lazy views stay in this process
+        return await offloader.run(
+            partial(self._parse_now, model, payload, timing)
+        )
+
+    def _parse_now(
+        self,
+        model: type[M],
+        payload: bytes,
+        timing: RequestTiming | None = None,
+    ) -> M:
+        if self.validation_mode is ValidationMode.LAZY:
+            started = time.perf_counter()
+            data = self._http.codec.loads(payload)
+            if timing is not None:
+                timing.decode = time.perf_counter() - started
+
+            return lazy_view(model, data)
+
+        if self._identity_data is None:
+            return parse(model, payload)
+
+        identity = self._identity_map
+        if identity is None:
+            identity = IdentityMap()
+
+        return parse(
+            identity_model(model), payload, {IDENTITY_CONTEXT_KEY: identity}
+        )
+
+    async def request(
+        self,
+        method: HTTPMethod | str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+        raw: bool = False,
+    ) -> Any:
+        """Выполнить произвольный запрос к API без Pydantic моделей
+
+        Ответ не проверяется моделями, что экономит время на больших
+        ответах. Ограничитель частоты, повторы, дедлайны, кэш и объединение
+        одинаковых GET запросов работают как для обычных методов, в том
+        числе c raw=True.
+
+        Параметры
+        ----------
+        method : HTTPMethod | str
+            HTTP метод, например "GET"
+        path : str
+            Путь относительно корня API, например "threads/1/posts"
+        params : dict, опционален
+            Параметры строки запроса
+        data : dict, опционален
+            Поля формы, вложенные словари и списки передаются как
+            name[key] и name[]
+        raw : bool, опционален
+            Вернуть тело ответа как bytes без разбора JSON
+
+        Returns dict | bytes:
+        -------
+            Разобранный JSON ответа, или тело ответа если raw=True
+
+        Ошибки:
+        ------
+        XenForoError
+            Если API вернул ошибку
+        """
+
+        if not isinstance(path, str):  # type: ignore
+            raise TypeError("Ожидался тип str в параметре path")
+
+        return await self._http.request(
+            HTTPMethod(method.upper()) if isinstance(method, str) else method,
+            path,
+            params,
+            data,
+            raw,
+        )
 
     # ============================================================================
     # ALERTS
@@ -269,7 +644,7 @@ class Client:
             raise TypeError("Ожидался тип AlertsGetParams")
 
         payload = await self._http.get_alerts(params)
-        return AlertsGetResponse.model_validate(payload)
+        return await self._parse(AlertsGetResponse, payload)
 
     async def send_alert(self, params: AlertSendParams) -> AlertSendResponse:
         """POST alerts/ - Отправить оповещение определенному пользователю
@@ -299,7 +674,7 @@ class Client:
             raise TypeError("Ожидался тип AlertSendParams")
 
         payload = await self._http.send_alert(params)
-        return AlertSendResponse.model_validate(payload)
+        return await self._parse(AlertSendResponse, payload)
 
     async def mark_all_alerts(
         self, params: AlertsMarkAllParams
@@ -325,7 +700,7 @@ class Client:
             )
 
         payload = await self._http.mark_all_alerts(params)
-        return AlertsMarkAllResponse.model_validate(payload)
+        return await self._parse(AlertsMarkAllResponse, payload)
 
     async def get_alert(self, alert_id: int) -> AlertGetResponse:
         """GET alerts/{id}/ - Получить информацию o6 определенном оповещении
@@ -345,7 +720,7 @@ class Client:
             raise TypeError("Ожидался тип int в параметре alert_id")
 
         payload = await self._http.get_alert(alert_id)
-        return AlertGetResponse.model_validate(payload)
+        return await self._parse(AlertGetResponse, payload)
 
     async def mark_alert(
         self, alert_id: int, params: AlertMarkParams
@@ -376,7 +751,7 @@ class Client:
             raise TypeError("Ожидался тип AlertMarkParams в параметре params")
 
         payload = await self._http.mark_alert(alert_id, params)
-        return AlertMarkResponse.model_validate(payload)
+        return await self._parse(AlertMarkResponse, payload)
 
     # ============================================================================
     # ATTACHMENTS
@@ -402,10 +777,15 @@ class Client:
         params = AttachmentsGetParams(key=key)
 
         payload = await self._http.get_attachments(params)
-        return AttachmentsGetResponse.model_validate(payload)
+        return await self._parse(AttachmentsGetResponse, payload)
 
     async def upload_attachment(
-        self, key: str, attachment: BinaryIO
+        self,
+        key: str,
+        attachment: FileSource,
+        filename: str | None = None,
+        content_type: str | None = None,
+        progress: UploadProgress | None = None,
     ) -> AttachmentUploadResponse:
         """POST attachments/ - Загрузить вложение
 
@@ -413,8 +793,16 @@ class Client:
         ----------
         key : str
             Существующий ключ вложения
-        attachment : BinaryIO
-            Вложение
+        attachment : BinaryIO | str | PathLike | AsyncIterable[bytes]
+            Вложение. Файл c диска (путь) и асинхронный итератор отправляются
+            частями, без загрузки в память целиком
+        filename : str, опционален
+            Имя файла, по умолчанию берется из пути или файлового объекта
+        content_type : str, опционален
+            MIME тип, по умолчанию определяется по имени файла
+        progress : Callable[[int, int | None], Any], опционален
+            Вызывается после каждой отправленной части c числом отправленных
+            байт и полным размером файла (None, если размер неизвестен)
 
         Returns AttachmentUploadResponse:
         -------
@@ -432,13 +820,18 @@ class Client:
 
         params = AttachmentUploadParams(key=key)
 
-        payload = await self._http.upload_attachment(params, attachment)
-        return AttachmentUploadResponse.model_validate(payload)
+        payload = await self._http.upload_attachment(
+            params, attachment, filename, content_type, progress
+        )
+        return await self._parse(AttachmentUploadResponse, payload)
 
     async def create_attachment_key(
         self,
         params: AttachmentsCreateNewKeyParams,
-        attachment: BinaryIO | None = None,
+        attachment: FileSource | None = None,
+        filename: str | None = None,
+        content_type: str | None = None,
+        progress: UploadProgress | None = None,
     ) -> AttachmentsCreateNewKeyResponse:
         """POST attachments/new-key - Создать новый ключ вложения
 
@@ -448,8 +841,16 @@ class Client:
             Тип конента вложения
         context : Dict[str, Any], опционален
             Пары ключ - значения, отражающие контекст вложения
-        attachment : BinaryIO, опционален
-            Первое вложение для ассоциации c ключом
+        attachment : BinaryIO | str | PathLike | AsyncIterable[bytes], опционален
+            Первое вложение для ассоциации c ключом. Файл c диска (путь) и асинхронный итератор отправляются
+            частями, без загрузки в память целиком
+        filename : str, опционален
+            Имя файла, по умолчанию берется из пути или файлового объекта
+        content_type : str, опционален
+            MIME тип, по умолчанию определяется по имени файла
+        progress : Callable[[int, int | None], Any], опционален
+            Вызывается после каждой отправленной части c числом отправленных
+            байт и полным размером файла (None, если размер неизвестен)
 
         Returns AttachmentsCreateNewKeyResponse:
         -------
@@ -462,8 +863,10 @@ class Client:
         if not isinstance(params, AttachmentsCreateNewKeyParams):  # type: ignore
             raise TypeError("Ожидался тип AttachmentsCreateNewKeyParams")
 
-        payload = await self._http.create_attachment_key(params, attachment)
-        return AttachmentsCreateNewKeyResponse.model_validate(payload)
+        payload = await self._http.create_attachment_key(
+            params, attachment, filename, content_type, progress
+        )
+        return await self._parse(AttachmentsCreateNewKeyResponse, payload)
 
     async def get_attachment(
         self, attachment_id: int
@@ -484,7 +887,7 @@ class Client:
             raise TypeError("Ожидался тип int в параметре attachment_id")
 
         payload = await self._http.get_attachment(attachment_id)
-        return AttachmentGetResponse.model_validate(payload)
+        return await self._parse(AttachmentGetResponse, payload)
 
     async def delete_attachment(
         self, attachment_id: int
@@ -506,12 +909,15 @@ class Client:
             raise TypeError("Ожидался тип int в параметре attachment_id")
 
         payload = await self._http.delete_attachment(attachment_id)
-        return AttachmentDeleteResponse.model_validate(payload)
+        return await self._parse(AttachmentDeleteResponse, payload)
 
     async def get_attachment_data(
         self, attachment_id: int
     ) -> AttachmentGetDataResponse:
-        """GET attachments/{id}/data - Gets the data that makes up the specified attachment
+        """GET attachments/{id}/data - Получить содержимое вложения целиком
+
+        Файл загружается в память, для больших файлов используйте
+        iter_attachment_data или download_attachment.
 
         Параметры
         ----------
@@ -521,14 +927,125 @@ class Client:
         Returns AttachmentGetData:
         -------
         data : BinaryIO
-            The binary data
+            Содержимое файла
+        """
+
+        if not isinstance(attachment_id, int):  # type: ignore
+            raise TypeError("Ожидался тип int в параметре attachment_id")
+
+        buffer = io.BytesIO()
+        async for chunk in self.iter_attachment_data(attachment_id):
+            buffer.write(chunk)
+
+        buffer.seek(0)
+        return AttachmentGetDataResponse.model_construct(data=buffer)
+
+    async def iter_attachment_data(
+        self, attachment_id: int, chunk_size: int = 65536, offset: int = 0
+    ) -> AsyncIterator[bytes]:
+        """GET attachments/{id}/data - Получить содержимое вложения частями
+
+        Файл не загружается в память целиком, части отдаются по мере
+        получения.
+
+        Параметры
+        ----------
+        attachment_id : int
+            ID вложения
+        chunk_size : int, опционален
+            Максимальный размер одной части в байтах, по умолчанию 64 KiB
+        offset : int, опционален
+            C какого байта начать (заголовок Range), по умолчанию 0
+
+        Yields bytes:
+        -------
+            Части файла по порядку
+        """
+
+        if not isinstance(attachment_id, int):  # type: ignore
+            raise TypeError("Ожидался тип int в параметре attachment_id")
+
+        async with self._http.get_attachment_data(
+            attachment_id, offset
+        ) as stream:
+            async for chunk in stream.iter_chunks(chunk_size):
+                yield chunk
+
+    async def download_attachment(
+        self,
+        attachment_id: int,
+        destination: str | os.PathLike[str] | BinaryIO,
+        chunk_size: int = 65536,
+        progress: DownloadProgress | None = None,
+        resume: bool = False,
+    ) -> int:
+        """GET attachments/{id}/data - Сохранить вложение в файл
+
+        Файл пишется частями, поэтому память не зависит от размера файла.
+
+        Параметры
+        ----------
+        attachment_id : int
+            ID вложения
+        destination : str | PathLike | BinaryIO
+            Путь к файлу или открытый на запись бинарный файл
+        chunk_size : int, опционален
+            Максимальный размер одной части в байтах, по умолчанию 64 KiB
+        progress : Callable[[int, int | None], Any], опционален
+            Вызывается после каждой части c числом записанных байт и полным
+            размером файла (None, если размер неизвестен)
+        resume : bool, опционален
+            Продолжить загрузку c конца уже существующего файла (или c
+            текущей позиции файлового объекта) вместо перезаписи
+
+        Returns int:
+        -------
+            Размер файла в байтах
         """
 
         if not isinstance(attachment_id, int):  # type: ignore
             raise TypeError("Ожидался тип int в параметре attachment_id")
 
-        payload = await self._http.get_attachment_data(attachment_id)
-        return AttachmentGetDataResponse.model_validate(payload)
+        if isinstance(destination, (str, os.PathLike)):
+            mode = "r+b" if resume and os.path.exists(destination) else "wb"
+            with open(destination, mode) as file:
+                file.seek(0, os.SEEK_END)
+                return await self._download(
+                    attachment_id, file, chunk_size, progress, resume
+                )
+
+        return await self._download(
+            attachment_id, destination, chunk_size, progress, resume
+        )
+
+    async def _download(
+        self,
+        attachment_id: int,
+        file: BinaryIO,
+        chunk_size: int,
+        progress: DownloadProgress | None,
+        resume: bool,
+    ) -> int:
+        loop = asyncio.get_running_loop()
+        offset = file.tell() if resume else 0
+
+        async with self._http.get_attachment_data(
+            attachment_id, offset
+        ) as stream:
+            done = stream.offset
+            if done != offset:
+                file.seek(done)
+                await loop.run_in_executor(None, file.truncate)
+
+            # Written in the default executor, the same way uploads are
+            # read, so a slow disk does not stall the event loop
+            async for chunk in stream.iter_chunks(chunk_size):
+                await loop.run_in_executor(None, file.write, chunk)
+                done += len(chunk)
+                if progress is not None:
+                    progress(done, stream.total)
+
+        return done
 
     async def get_attachment_thumbnail(
         self, attachment_id: int
@@ -555,7 +1072,7 @@ class Client:
             raise TypeError("Ожидался тип int в параметре attachment_id")
 
         payload = await self._http.get_attachment_thumbnail(attachment_id)
-        return AttachmentGetThumbnailResponse.model_validate(payload)
+        return await self._parse(AttachmentGetThumbnailResponse, payload)
 
     # ============================================================================
     # AUTH
@@ -585,7 +1102,7 @@ class Client:
             raise TypeError("Ожидался тип AuthTestParams в параметре params")
 
         payload = await self._http.test_auth(params)
-        return AuthTestResponse.model_validate(payload)
+        return await self._parse(AuthTestResponse, payload)
 
     async def auth_from_session(
         self, params: AuthFromSessionParams
@@ -613,7 +1130,7 @@ class Client:
             )
 
         payload = await self._http.auth_from_session(params)
-        return AuthFromSessionResponse.model_validate(payload)
+        return await self._parse(AuthFromSessionResponse, payload)
 
     async def create_login_token(
         self, params: AuthLoginTokenParams
@@ -649,7 +1166,7 @@ class Client:
             )
 
         payload = await self._http.create_login_token(params)
-        return AuthLoginTokenResponse.model_validate(payload)
+        return await self._parse(AuthLoginTokenResponse, payload)
 
     # ============================================================================
     # CONVERSATION MESSAGES
@@ -683,7 +1200,7 @@ class Client:
             )
 
         payload = await self._http.reply_conversation_message(params)
-        return ConversationMessageReplyResponse.model_validate(payload)
+        return await self._parse(ConversationMessageReplyResponse, payload)
 
     async def get_conversation_message(
         self, message_id: int
@@ -702,7 +1219,7 @@ class Client:
         """
 
         payload = await self._http.get_conversation_message(message_id)
-        return ConversationMessageGetResponse.model_validate(payload)
+        return await self._parse(ConversationMessageGetResponse, payload)
 
     async def update_conversation_message(
         self, message_id: int, params: ConversationMessageUpdateParams
@@ -737,7 +1254,7 @@ class Client:
         payload = await self._http.update_conversation_message(
             message_id, params
         )
-        return ConversationMessageUpdateResponse.model_validate(payload)
+        return await self._parse(ConversationMessageUpdateResponse, payload)
 
     async def react_conversation_message(
         self, message_id: int, reaction_id: int
@@ -770,7 +1287,7 @@ class Client:
         payload = await self._http.react_conversation_message(
             message_id, params
         )
-        return ConversationMessageReactResponse.model_validate(payload)
+        return await self._parse(ConversationMessageReactResponse, payload)
 
     # ============================================================================
     # CONVERSATIONS
@@ -810,7 +1327,7 @@ class Client:
             )
 
         payload = await self._http.get_conversations(params)
-        return ConversationsGetResponse.model_validate(payload)
+        return await self._parse(ConversationsGetResponse, payload)
 
     async def create_conversation(
         self, params: ConversationCreateParams
@@ -846,7 +1363,7 @@ class Client:
             )
 
         payload = await self._http.create_conversation(params)
-        return ConversationCreateResponse.model_validate(payload)
+        return await self._parse(ConversationCreateResponse, payload)
 
     async def get_conversation(
         self,
@@ -879,7 +1396,7 @@ class Client:
             )
 
         payload = await self._http.get_conversation(conversation_id, params)
-        return ConversationGetResponse.model_validate(payload)
+        return await self._parse(ConversationGetResponse, payload)
 
     async def update_conversation(
         self, conversation_id: int, params: ConversationUpdateParams
@@ -914,7 +1431,7 @@ class Client:
             )
 
         payload = await self._http.update_conversation(conversation_id, params)
-        return ConversationUpdateResponse.model_validate(payload)
+        return await self._parse(ConversationUpdateResponse, payload)
 
     async def delete_conversation(
         self,
@@ -947,7 +1464,7 @@ class Client:
         params = ConversationDeleteParams(ignore=ignore)
 
         payload = await self._http.delete_conversation(conversation_id, params)
-        return ConversationDeleteResponse.model_validate(payload)
+        return await self._parse(ConversationDeleteResponse, payload)
 
     async def invite_conversation(
         self, conversation_id: int, params: ConversationInviteParams
@@ -977,7 +1494,7 @@ class Client:
             )
 
         payload = await self._http.invite_conversation(conversation_id, params)
-        return ConversationInviteResponse.model_validate(payload)
+        return await self._parse(ConversationInviteResponse, payload)
 
     async def mark_conversation_read(
         self,
@@ -1012,7 +1529,7 @@ class Client:
         payload = await self._http.mark_conversation_read(
             conversation_id, params
         )
-        return ConversationMarkReadResponse.model_validate(payload)
+        return await self._parse(ConversationMarkReadResponse, payload)
 
     async def mark_conversation_unread(
         self, conversation_id: int
@@ -1034,7 +1551,7 @@ class Client:
             raise TypeError("Ожидался тип int в параметре conversation_id")
 
         payload = await self._http.mark_conversation_unread(conversation_id)
-        return ConversationMarkUnreadResponse.model_validate(payload)
+        return await self._parse(ConversationMarkUnreadResponse, payload)
 
     async def get_conversation_messages(
         self,
@@ -1073,7 +1590,7 @@ class Client:
         payload = await self._http.get_conversation_messages(
             conversation_id, params
         )
-        return ConversationMessagesGetResponse.model_validate(payload)
+        return await self._parse(ConversationMessagesGetResponse, payload)
 
     async def star_conversation(
         self, conversation_id: int, params: ConversationStarParams
@@ -1102,7 +1619,7 @@ class Client:
             )
 
         payload = await self._http.star_conversation(conversation_id, params)
-        return ConversationStarResponse.model_validate(payload)
+        return await self._parse(ConversationStarResponse, payload)
 
     # ============================================================================
     # FORUMS
@@ -1155,7 +1672,7 @@ class Client:
             raise TypeError("Ожидался тип ForumGetParams в параметре params")
 
         payload = await self._http.get_forum(forum_id, params)
-        return ForumGetResponse.model_validate(payload)
+        return await self._parse(ForumGetResponse, payload)
 
     async def mark_forum_read(
         self, forum_id: int, date: int | None = None
@@ -1184,7 +1701,7 @@ class Client:
         params = ForumMarkReadParams(date=date) if date is not None else None
 
         payload = await self._http.mark_forum_read(forum_id, params)
-        return ForumMarkReadResponse.model_validate(payload)
+        return await self._parse(ForumMarkReadResponse, payload)
 
     async def get_forum_threads(
         self, forum_id: int, params: ForumThreadsGetParams | None = None
@@ -1233,7 +1750,7 @@ class Client:
             )
 
         payload = await self._http.get_forum_threads(forum_id, params)
-        return ForumThreadsGetResponse.model_validate(payload)
+        return await self._parse(ForumThreadsGetResponse, payload)
 
     # ============================================================================
     # INDEX
@@ -1257,7 +1774,7 @@ class Client:
         """
 
         payload = await self._http.get_index()
-        return IndexGetResponse.model_validate(payload)
+        return await self._parse(IndexGetResponse, payload)
 
     # ============================================================================
     # ME (Current User)
@@ -1273,7 +1790,7 @@ class Client:
         """
 
         payload = await self._http.get_me()
-        return MeGetResponse.model_validate(payload)
+        return await self._parse(MeGetResponse, payload)
 
     async def update_me(self, params: MeUpdateParams) -> MeUpdateResponse:
         """POST me/ - Обновить информацию o6 API пользователе
@@ -1299,17 +1816,29 @@ class Client:
             raise TypeError("Ожидался тип MeUpdateParams в параметре params")
 
         payload = await self._http.update_me(params)
-        return MeUpdateResponse.model_validate(payload)
+        return await self._parse(MeUpdateResponse, payload)
 
     async def update_my_avatar(
-        self, avatar: BinaryIO
+        self,
+        avatar: FileSource,
+        filename: str | None = None,
+        content_type: str | None = None,
+        progress: UploadProgress | None = None,
     ) -> MeAvatarUpdateResponse:
         """POST me/avatar - Обновить аватар API пользователя
 
         Параметры
         ----------
-        avatar : BinaryIO
-            Avatar file
+        avatar : BinaryIO | str | PathLike | AsyncIterable[bytes]
+            Файл аватара. Файл c диска (путь) и асинхронный итератор отправляются
+            частями, без загрузки в память целиком
+        filename : str, опционален
+            Имя файла, по умолчанию берется из пути или файлового объекта
+        content_type : str, опционален
+            MIME тип, по умолчанию определяется по имени файла
+        progress : Callable[[int, int | None], Any], опционален
+            Вызывается после каждой отправленной части c числом отправленных
+            байт и полным размером файла (None, если размер неизвестен)
 
         Returns MeAvatarUpdateResponse:
         -------
@@ -1317,8 +1846,10 @@ class Client:
             True если операция успешна
         """
 
-        payload = await self._http.update_my_avatar(avatar)
-        return MeAvatarUpdateResponse.model_validate(payload)
+        payload = await self._http.update_my_avatar(
+            avatar, filename, content_type, progress
+        )
+        return await self._parse(MeAvatarUpdateResponse, payload)
 
     async def delete_my_avatar(self) -> MeAvatarDeleteResponse:
         """DELETE me/avatar - Удалить аватар API пользователя
@@ -1330,7 +1861,7 @@ class Client:
         """
 
         payload = await self._http.delete_my_avatar()
-        return MeAvatarDeleteResponse.model_validate(payload)
+        return await self._parse(MeAvatarDeleteResponse, payload)
 
     async def update_my_email(
         self, params: MeEmailUpdateParams
@@ -1358,7 +1889,7 @@ class Client:
             )
 
         payload = await self._http.update_my_email(params)
-        return MeEmailUpdateResponse.model_validate(payload)
+        return await self._parse(MeEmailUpdateResponse, payload)
 
     async def update_my_password(
         self, params: MePasswordUpdateParams
@@ -1384,7 +1915,7 @@ class Client:
             )
 
         payload = await self._http.update_my_password(params)
-        return MePasswordUpdateResponse.model_validate(payload)
+        return await self._parse(MePasswordUpdateResponse, payload)
 
     # ============================================================================
     # NODES
@@ -1402,7 +1933,7 @@ class Client:
         """
 
         payload = await self._http.get_nodes()
-        return NodesGetResponse.model_validate(payload)
+        return await self._parse(NodesGetResponse, payload)
 
     async def create_node(
         self, params: AnyNodeCreateParams
@@ -1434,7 +1965,7 @@ class Client:
             )
 
         payload = await self._http.create_node(params)
-        return NodeCreateResponse.model_validate(payload)
+        return await self._parse(NodeCreateResponse, payload)
 
     async def get_nodes_flattened(self) -> NodesFlattenedGetResponse:
         """GET nodes/flattened - Получение списка нод без tree_map
@@ -1446,7 +1977,7 @@ class Client:
         """
 
         payload = await self._http.get_nodes_flattened()
-        return NodesFlattenedGetResponse.model_validate(payload)
+        return await self._parse(NodesFlattenedGetResponse, payload)
 
     async def get_node(self, node_id: int) -> NodeGetResponse:
         """GET nodes/{id}/ - Получить информацию o ноде
@@ -1466,7 +1997,7 @@ class Client:
             raise TypeError("Ожидался тип int в параметре node_id")
 
         payload = await self._http.get_node(node_id)
-        return NodeGetResponse.model_validate(payload)
+        return await self._parse(NodeGetResponse, payload)
 
     async def update_node(
         self, node_id: int, params: NodeUpdateParams
@@ -1494,7 +2025,7 @@ class Client:
             raise TypeError("Ожидался тип NodeUpdateParams в параметре params")
 
         payload = await self._http.update_node(node_id, params)
-        return NodeUpdateResponse.model_validate(payload)
+        return await self._parse(NodeUpdateResponse, payload)
 
     async def delete_node(
         self, node_id: int, delete_children: bool = False
@@ -1523,7 +2054,7 @@ class Client:
         params = NodeDeleteParams(delete_children=delete_children)
 
         payload = await self._http.delete_node(node_id, params)
-        return NodeDeleteResponse.model_validate(payload)
+        return await self._parse(NodeDeleteResponse, payload)
 
     # ============================================================================
     # POSTS
@@ -1555,7 +2086,7 @@ class Client:
             raise TypeError("Ожидался тип PostCreateParams в параметре params")
 
         payload = await self._http.create_post(params)
-        return PostCreateResponse.model_validate(payload)
+        return await self._parse(PostCreateResponse, payload)
 
     async def get_post(self, post_id: int) -> PostGetResponse:
         """GET posts/{id}/ - Получить информацию o посте
@@ -1575,7 +2106,7 @@ class Client:
             raise TypeError("Ожидался тип int в параметре post_id")
 
         payload = await self._http.get_post(post_id)
-        return PostGetResponse.model_validate(payload)
+        return await self._parse(PostGetResponse, payload)
 
     async def update_post(
         self, post_id: int, params: PostUpdateParams
@@ -1614,7 +2145,7 @@ class Client:
             raise TypeError("Ожидался тип PostUpdateParams в параметре params")
 
         payload = await self._http.update_post(post_id, params)
-        return PostUpdateResponse.model_validate(payload)
+        return await self._parse(PostUpdateResponse, payload)
 
     async def delete_post(
         self, post_id: int, params: PostDeleteParams | None = None
@@ -1647,7 +2178,7 @@ class Client:
             raise TypeError("Ожидался тип PostDeleteParams в параметре params")
 
         payload = await self._http.delete_post(post_id, params)
-        return PostDeleteResponse.model_validate(payload)
+        return await self._parse(PostDeleteResponse, payload)
 
     async def mark_post_solution(
         self, post_id: int
@@ -1673,7 +2204,7 @@ class Client:
             raise TypeError("Ожидался тип int в параметре post_id")
 
         payload = await self._http.mark_post_solution(post_id)
-        return PostMarkSolutionResponse.model_validate(payload)
+        return await self._parse(PostMarkSolutionResponse, payload)
 
     async def react_post(
         self, post_id: int, reaction_id: int
@@ -1704,7 +2235,7 @@ class Client:
         params = PostReactParams(reaction_id=reaction_id)
 
         payload = await self._http.react_post(post_id, params)
-        return PostReactResponse.model_validate(payload)
+        return await self._parse(PostReactResponse, payload)
 
     async def vote_post(
         self, post_id: int, vote_type: VoteTypeEnum
@@ -1735,7 +2266,7 @@ class Client:
         params = PostVoteParams(type=vote_type)
 
         payload = await self._http.vote_post(post_id, params)
-        return PostVoteResponse.model_validate(payload)
+        return await self._parse(PostVoteResponse, payload)
 
     # ============================================================================
     # PROFILE POST COMMENTS
@@ -1769,7 +2300,7 @@ class Client:
             )
 
         payload = await self._http.create_profile_post_comment(params)
-        return ProfilePostCommentCreateResponse.model_validate(payload)
+        return await self._parse(ProfilePostCommentCreateResponse, payload)
 
     async def get_profile_post_comment(
         self, comment_id: int
@@ -1791,7 +2322,7 @@ class Client:
             raise TypeError("Ожидался тип int в параметре comment_id")
 
         payload = await self._http.get_profile_post_comment(comment_id)
-        return ProfilePostCommentGetResponse.model_validate(payload)
+        return await self._parse(ProfilePostCommentGetResponse, payload)
 
     async def update_profile_post_comment(
         self, comment_id: int, params: ProfilePostCommentUpdateParams
@@ -1830,7 +2361,7 @@ class Client:
         payload = await self._http.update_profile_post_comment(
             comment_id, params
         )
-        return ProfilePostCommentUpdateResponse.model_validate(payload)
+        return await self._parse(ProfilePostCommentUpdateResponse, payload)
 
     async def delete_profile_post_comment(
         self,
@@ -1871,7 +2402,7 @@ class Client:
         payload = await self._http.delete_profile_post_comment(
             comment_id, params
         )
-        return ProfilePostCommentDeleteResponse.model_validate(payload)
+        return await self._parse(ProfilePostCommentDeleteResponse, payload)
 
     async def react_profile_post_comment(
         self, comment_id: int, reaction_id: int
@@ -1904,7 +2435,7 @@ class Client:
         payload = await self._http.react_profile_post_comment(
             comment_id, params
         )
-        return ProfilePostCommentReactResponse.model_validate(payload)
+        return await self._parse(ProfilePostCommentReactResponse, payload)
 
     # ============================================================================
     # PROFILE POSTS
@@ -1938,7 +2469,7 @@ class Client:
             )
 
         payload = await self._http.create_profile_post(params)
-        return ProfilePostCreateResponse.model_validate(payload)
+        return await self._parse(ProfilePostCreateResponse, payload)
 
     async def get_profile_post(
         self,
@@ -1977,7 +2508,7 @@ class Client:
             )
 
         payload = await self._http.get_profile_post(profile_post_id, params)
-        return ProfilePostGetResponse.model_validate(payload)
+        return await self._parse(ProfilePostGetResponse, payload)
 
     async def update_profile_post(
         self, profile_post_id: int, params: ProfilePostUpdateParams
@@ -2014,7 +2545,7 @@ class Client:
             )
 
         payload = await self._http.update_profile_post(profile_post_id, params)
-        return ProfilePostUpdateResponse.model_validate(payload)
+        return await self._parse(ProfilePostUpdateResponse, payload)
 
     async def delete_profile_post(
         self,
@@ -2053,7 +2584,7 @@ class Client:
             )
 
         payload = await self._http.delete_profile_post(profile_post_id, params)
-        return ProfilePostDeleteResponse.model_validate(payload)
+        return await self._parse(ProfilePostDeleteResponse, payload)
 
     async def get_profile_post_comments(
         self,
@@ -2092,7 +2623,7 @@ class Client:
         payload = await self._http.get_profile_post_comments(
             profile_post_id, params
         )
-        return ProfilePostCommentsGetResponse.model_validate(payload)
+        return await self._parse(ProfilePostCommentsGetResponse, payload)
 
     async def react_profile_post(
         self, profile_post_id: int, reaction_id: int
@@ -2123,7 +2654,7 @@ class Client:
         params = ProfilePostReactParams(reaction_id=reaction_id)
 
         payload = await self._http.react_profile_post(profile_post_id, params)
-        return ProfilePostReactResponse.model_validate(payload)
+        return await self._parse(ProfilePostReactResponse, payload)
 
     # ============================================================================
     # STATS
@@ -2143,7 +2674,7 @@ class Client:
         """
 
         payload = await self._http.get_stats()
-        return StatsResponse.model_validate(payload)
+        return await self._parse(StatsResponse, payload)
 
     # ============================================================================
     # THREADS
@@ -2185,7 +2716,7 @@ class Client:
             raise TypeError("Ожидался тип ThreadsGetParams в параметре params")
 
         payload = await self._http.get_threads(params)
-        return ThreadsGetResponse.model_validate(payload)
+        return await self._parse(ThreadsGetResponse, payload)
 
     async def create_thread(
         self, params: ThreadCreateParams
@@ -2234,7 +2765,7 @@ class Client:
             )
 
         payload = await self._http.create_thread(params)
-        return ThreadCreateResponse.model_validate(payload)
+        return await self._parse(ThreadCreateResponse, payload)
 
     async def get_thread(
         self, thread_id: int, params: ThreadGetParams | None = None
@@ -2270,7 +2801,7 @@ class Client:
             raise TypeError("Ожидался тип ThreadGetParams в параметре params")
 
         payload = await self._http.get_thread(thread_id, params)
-        return ThreadGetResponse.model_validate(payload)
+        return await self._parse(ThreadGetResponse, payload)
 
     async def update_thread(
         self, thread_id: int, params: ThreadUpdateParams
@@ -2311,7 +2842,7 @@ class Client:
             )
 
         payload = await self._http.update_thread(thread_id, params)
-        return ThreadUpdateResponse.model_validate(payload)
+        return await self._parse(ThreadUpdateResponse, payload)
 
     async def delete_thread(
         self, thread_id: int, params: ThreadDeleteParams | None = None
@@ -2350,7 +2881,7 @@ class Client:
             )
 
         payload = await self._http.delete_thread(thread_id, params)
-        return ThreadDeleteResponse.model_validate(payload)
+        return await self._parse(ThreadDeleteResponse, payload)
 
     async def change_thread_type(
         self, thread_id: int, new_thread_type: ThreadTypeEnum
@@ -2383,7 +2914,7 @@ class Client:
         params = ThreadChangeTypeParams(new_thread_type_id=new_thread_type)
 
         payload = await self._http.change_thread_type(thread_id, params)
-        return ThreadChangeTypeResponse.model_validate(payload)
+        return await self._parse(ThreadChangeTypeResponse, payload)
 
     async def mark_thread_read(
         self, thread_id: int, date: int
@@ -2412,7 +2943,7 @@ class Client:
         params = ThreadMarkReadParams(date=date)
 
         payload = await self._http.mark_thread_read(thread_id, params)
-        return ThreadMarkReadResponse.model_validate(payload)
+        return await self._parse(ThreadMarkReadResponse, payload)
 
     async def move_thread(
         self, thread_id: int, params: ThreadMoveParams
@@ -2449,7 +2980,7 @@ class Client:
             raise TypeError("Ожидался тип ThreadMoveParams в параметре params")
 
         payload = await self._http.move_thread(thread_id, params)
-        return ThreadMoveResponse.model_validate(payload)
+        return await self._parse(ThreadMoveResponse, payload)
 
     async def get_thread_posts(
         self, thread_id: int, params: ThreadPostsGetParams | None = None
@@ -2480,7 +3011,7 @@ class Client:
             )
 
         payload = await self._http.get_thread_posts(thread_id, params)
-        return ThreadPostsGetResponse.model_validate(payload)
+        return await self._parse(ThreadPostsGetResponse, payload)
 
     async def vote_thread(
         self, thread_id: int, vote_type: VoteTypeEnum
@@ -2511,7 +3042,7 @@ class Client:
         params = ThreadVoteParams(type=vote_type)
 
         payload = await self._http.vote_thread(thread_id, params)
-        return ThreadVoteResponse.model_validate(payload)
+        return await self._parse(ThreadVoteResponse, payload)
 
     # ============================================================================
     # USERS
@@ -2539,7 +3070,7 @@ class Client:
             raise TypeError("Ожидался тип UsersGetParams в параметре params")
 
         payload = await self._http.get_users(params)
-        return UsersGetResponse.model_validate(payload)
+        return await self._parse(UsersGetResponse, payload)
 
     async def create_user(
         self, params: UserCreateParams
@@ -2567,7 +3098,7 @@ class Client:
             raise TypeError("Ожидался тип UserCreateParams в параметре params")
 
         payload = await self._http.create_user(params)
-        return UserCreateResponse.model_validate(payload)
+        return await self._parse(UserCreateResponse, payload)
 
     async def find_user_by_email(self, email: str) -> UserFindEmailResponse:
         """GET users/find-email - Найти пользователя по email
@@ -2589,7 +3120,7 @@ class Client:
         params = UsersFindEmailParams(email=email)
 
         payload = await self._http.find_user_by_email(params)
-        return UserFindEmailResponse.model_validate(payload)
+        return await self._parse(UserFindEmailResponse, payload)
 
     async def find_user_by_name(self, username: str) -> UserFindNameResponse:
         """GET users/find-name - Найти пользователей по username
@@ -2613,7 +3144,7 @@ class Client:
         params = UsersFindNameParams(username=username)
 
         payload = await self._http.find_user_by_name(params)
-        return UserFindNameResponse.model_validate(payload)
+        return await self._parse(UserFindNameResponse, payload)
 
     async def get_user(
         self, user_id: int, params: UserGetParams | None = None
@@ -2642,7 +3173,7 @@ class Client:
             raise TypeError("Ожидался тип UserGetParams в параметре params")
 
         payload = await self._http.get_user(user_id, params)
-        return UserGetResponse.model_validate(payload)
+        return await self._parse(UserGetResponse, payload)
 
     async def update_user(
         self, user_id: int, params: UserUpdateParams
@@ -2683,7 +3214,7 @@ class Client:
             raise TypeError("Ожидался тип UserUpdateParams в параметре params")
 
         payload = await self._http.update_user(user_id, params)
-        return UserUpdateResponse.model_validate(payload)
+        return await self._parse(UserUpdateResponse, payload)
 
     async def delete_user(
         self, user_id: int, rename_to: str | None = None
@@ -2716,10 +3247,15 @@ class Client:
         )
 
         payload = await self._http.delete_user(user_id, params)
-        return UserDeleteResponse.model_validate(payload)
+        return await self._parse(UserDeleteResponse, payload)
 
     async def update_user_avatar(
-        self, user_id: int, avatar: BinaryIO
+        self,
+        user_id: int,
+        avatar: FileSource,
+        filename: str | None = None,
+        content_type: str | None = None,
+        progress: UploadProgress | None = None,
     ) -> UserAvatarUpdateResponse:
         """POST users/{id}/avatar - Обновить аватар пользователя
 
@@ -2727,8 +3263,16 @@ class Client:
         ----------
         user_id : int
             ID пользователя
-        avatar : BinaryIO
-            Avatar file
+        avatar : BinaryIO | str | PathLike | AsyncIterable[bytes]
+            Файл аватара. Файл c диска (путь) и асинхронный итератор отправляются
+            частями, без загрузки в память целиком
+        filename : str, опционален
+            Имя файла, по умолчанию берется из пути или файлового объекта
+        content_type : str, опционален
+            MIME тип, по умолчанию определяется по имени файла
+        progress : Callable[[int, int | None], Any], опционален
+            Вызывается после каждой отправленной части c числом отправленных
+            байт и полным размером файла (None, если размер неизвестен)
 
         Returns UserAvatarUpdateResponse:
         -------
@@ -2739,8 +3283,10 @@ class Client:
         if not isinstance(user_id, int):  # type: ignore
             raise TypeError("Ожидался тип int в параметре user_id")
 
-        payload = await self._http.update_user_avatar(user_id, avatar)
-        return UserAvatarUpdateResponse.model_validate(payload)
+        payload = await self._http.update_user_avatar(
+            user_id, avatar, filename, content_type, progress
+        )
+        return await self._parse(UserAvatarUpdateResponse, payload)
 
     async def delete_user_avatar(
         self, user_id: int
@@ -2762,7 +3308,7 @@ class Client:
             raise TypeError("Ожидался тип int в параметре user_id")
 
         payload = await self._http.delete_user_avatar(user_id)
-        return UserAvatarDeleteResponse.model_validate(payload)
+        return await self._parse(UserAvatarDeleteResponse, payload)
 
     async def get_user_profile_posts(
         self, user_id: int, page: int | None
@@ -2794,7 +3340,7 @@ class Client:
             UserProfilePostsGetParams(page=page) if page is not None else None
         )
         payload = await self._http.get_user_profile_posts(user_id, params)
-        return UserProfilePostsGetResponse.model_validate(payload)
+        return await self._parse(UserProfilePostsGetResponse, payload)
 
     # ============================================================================
     # ACTIONS
@@ -2813,7 +3359,7 @@ class Client:
         """
 
         payload = await self._http.get_demote_groups()
-        return GetDemoteGroupsResponse.model_validate(payload)
+        return await self._parse(GetDemoteGroupsResponse, payload)
 
     async def demote_user(
         self, user_id: int, group_id: ArzGuardGroupsIdsEnum
@@ -2856,7 +3402,7 @@ class Client:
 
         params = UserDemoteParams(group=group_id)
         payload = await self._http.demote_user(user_id, params)
-        return DemoteUserResponse.model_validate(payload)
+        return await self._parse(DemoteUserResponse, payload)
 
     async def get_promote_groups(self) -> GetPromoteGroupsResponse:
         """GET promote/ - Получить список групп, которые API пользователь может выдавать
@@ -2870,7 +3416,7 @@ class Client:
         """
 
         payload = await self._http.get_promote_groups()
-        return GetPromoteGroupsResponse.model_validate(payload)
+        return await self._parse(GetPromoteGroupsResponse, payload)
 
     async def promote_user(
         self, user_id: int, group_id: ArzGuardGroupsIdsEnum
@@ -2913,4 +3459,825 @@ class Client:
 
         params = UserPromoteParams(group=group_id)
         payload = await self._http.promote_user(user_id, params)
-        return PromoteUserResponse.model_validate(payload)
+        return await self._parse(PromoteUserResponse, payload)
+
+    # ============================================================================
+    # LOADERS
+    # ============================================================================
+
+    async def _fetch_user(self, user_id: int) -> User:
+        return (await self.get_user(user_id)).user
+
+    async def _fetch_thread(self, thread_id: int) -> Thread:
+        return (await self.get_thread(thread_id)).thread
+
+    async def _fetch_post(self, post_id: int) -> Post:
+        return (await self.get_post(post_id)).post
+
+    async def _fetch_node(self, node_id: int) -> Node:
+        return (await self.get_node(node_id)).node
+
+    async def load_user(self, user_id: int) -> User:
+        """Получить пользователя через общий пакетный загрузчик
+
+        ID, запрошенные в одной итерации event loop (или в окне
+        LoaderData.window), собираются вместе, повторяющиеся ID
+        запрашиваются один раз, a запросы выполняются c ограничением
+        LoaderData.max_concurrency.
+
+        Параметры
+        ----------
+        user_id : int
+            ID пользователя
+
+        Returns User:
+        -------
+            Информация o пользователе
+        """
+
+        if not isinstance(user_id, int):  # type: ignore
+            raise TypeError("Ожидался тип int в параметре user_id")
+
+        return await self._user_loader.load(user_id)
+
+    async def load_users(self, user_ids: Iterable[int]) -> list[User]:
+        """Получить несколько пользователей через пакетный загрузчик
+
+        Параметры
+        ----------
+        user_ids : Iterable[int]
+            ID пользователей, могут повторяться
+
+        Returns List[User]:
+        -------
+            Пользователи в порядке переданных ID
+        """
+
+        return await asyncio.gather(*(self.load_user(i) for i in user_ids))
+
+    async def load_thread(self, thread_id: int) -> Thread:
+        """Получить ветку через общий пакетный загрузчик
+
+        Параметры
+        ----------
+        thread_id : int
+            ID ветки
+
+        Returns Thread:
+        -------
+            Информация o ветке
+        """
+
+        if not isinstance(thread_id, int):  # type: ignore
+            raise TypeError("Ожидался тип int в параметре thread_id")
+
+        return await self._thread_loader.load(thread_id)
+
+    async def load_threads(self, thread_ids: Iterable[int]) -> list[Thread]:
+        """Получить несколько веток через пакетный загрузчик
+
+        Параметры
+        ----------
+        thread_ids : Iterable[int]
+            ID веток, могут повторяться
+
+        Returns List[Thread]:
+        -------
+            Ветки в порядке переданных ID
+        """
+
+        return await asyncio.gather(*(self.load_thread(i) for i in thread_ids))
+
+    async def load_post(self, post_id: int) -> Post:
+        """Получить пост через общий пакетный загрузчик
+
+        Параметры
+        ----------
+        post_id : int
+            ID поста
+
+        Returns Post:
+        -------
+            Информация o посте
+        """
+
+        if not isinstance(post_id, int):  # type: ignore
+            raise TypeError("Ожидался тип int в параметре post_id")
+
+        return await self._post_loader.load(post_id)
+
+    async def load_posts(self, post_ids: Iterable[int]) -> list[Post]:
+        """Получить несколько постов через пакетный загрузчик
+
+        Параметры
+        ----------
+        post_ids : Iterable[int]
+            ID постов, могут повторяться
+
+        Returns List[Post]:
+        -------
+            Посты в порядке переданных ID
+        """
+
+        return await asyncio.gather(*(self.load_post(i) for i in post_ids))
+
+    async def load_node(self, node_id: int) -> Node:
+        """Получить ноду через общий пакетный загрузчик
+
+        Параметры
+        ----------
+        node_id : int
+            ID ноды
+
+        Returns Node:
+        -------
+            Информация o ноде
+        """
+
+        if not isinstance(node_id, int):  # type: ignore
+            raise TypeError("Ожидался тип int в параметре node_id")
+
+        return await self._node_loader.load(node_id)
+
+    async def load_nodes(self, node_ids: Iterable[int]) -> list[Node]:
+        """Получить несколько нод через пакетный загрузчик
+
+        Параметры
+        ----------
+        node_ids : Iterable[int]
+            ID нод, могут повторяться
+
+        Returns List[Node]:
+        -------
+            Ноды в порядке переданных ID
+        """
+
+        return await asyncio.gather(*(self.load_node(i) for i in node_ids))
+
+    # ============================================================================
+    # PAGINATION
+    # ============================================================================
+
+    def iter_alerts(
+        self,
+        params: AlertsGetParams | None = None,
+        concurrency: int = 1,
+        ordered: bool = True,
+        fields: Projection | None = None,
+    ) -> AsyncIterator[UserAlert]:
+        """GET alerts/ - Перебрать оповещения всех страниц, начиная c params.page
+
+        Следующая страница запрашивается, пока обрабатывается текущая.
+        При concurrency > 1 после первой страницы остальные запрашиваются
+        параллельно (не больше concurrency одновременно, c учетом
+        ограничителя частоты запросов).
+
+        Параметры
+        ----------
+        params : AlertsGetParams, опционален
+            Фильтры, как в get_alerts
+        concurrency : int, опционален
+            Сколько страниц запрашивать одновременно, по умолчанию 1
+        ordered : bool, опционален
+            Страницы по порядку (True) или по мере получения (False)
+        fields : Iterable[str] | type[BaseModel] | type[tuple], опционален
+            Разобрать только эти поля элементов (вложенные через точку,
+            например "user.username"), разобрать элементы в свою модель
+            или в компактные записи (ThreadRecord, PostRecord и т.п.).
+            Остальные поля не разбираются, элементы - облегченные модели
+
+        Yields UserAlert:
+        -------
+            Оповещения в порядке страниц
+        """
+
+        if params is not None and not isinstance(params, AlertsGetParams):  # type: ignore
+            raise TypeError("Ожидался тип AlertsGetParams в параметре params")
+
+        base = params or AlertsGetParams()
+
+        model = self._list_model(AlertsGetResponse, "alerts", fields)
+
+        async def fetch(page: int) -> AlertsGetResponse:
+            payload = await self._http.get_alerts(
+                base.model_copy(update={"page": page})
+            )
+            return await self._parse(model, payload)
+
+        return paginate(
+            fetch, lambda r: r.alerts, base.page or 1, concurrency, ordered
+        )
+
+    def iter_conversations(
+        self,
+        params: ConversationsGetParams | None = None,
+        concurrency: int = 1,
+        ordered: bool = True,
+        fields: Projection | None = None,
+    ) -> AsyncIterator[Conversation]:
+        """GET conversations/ - Перебрать беседы всех страниц, начиная c params.page
+
+        Следующая страница запрашивается, пока обрабатывается текущая.
+        При concurrency > 1 после первой страницы остальные запрашиваются
+        параллельно (не больше concurrency одновременно, c учетом
+        ограничителя частоты запросов).
+
+        Параметры
+        ----------
+        params : ConversationsGetParams, опционален
+            Фильтры, как в get_conversations
+        concurrency : int, опционален
+            Сколько страниц запрашивать одновременно, по умолчанию 1
+        ordered : bool, опционален
+            Страницы по порядку (True) или по мере получения (False)
+        fields : Iterable[str] | type[BaseModel] | type[tuple], опционален
+            Разобрать только эти поля элементов (вложенные через точку,
+            например "user.username"), разобрать элементы в свою модель
+            или в компактные записи (ThreadRecord, PostRecord и т.п.).
+            Остальные поля не разбираются, элементы - облегченные модели
+
+        Yields Conversation:
+        -------
+            Беседы в порядке страниц
+        """
+
+        if params is not None and not isinstance(
+            params, ConversationsGetParams
+        ):  # type: ignore
+            raise TypeError(
+                "Ожидался тип ConversationsGetParams в параметре params"
+            )
+
+        base = params or ConversationsGetParams()
+
+        model = self._list_model(
+            ConversationsGetResponse, "conversations", fields
+        )
+
+        async def fetch(page: int) -> ConversationsGetResponse:
+            payload = await self._http.get_conversations(
+                base.model_copy(update={"page": page})
+            )
+            return await self._parse(model, payload)
+
+        return paginate(
+            fetch,
+            lambda r: r.conversations,
+            base.page or 1,
+            concurrency,
+            ordered,
+        )
+
+    def iter_conversation_messages(
+        self,
+        conversation_id: int,
+        page: int = 1,
+        concurrency: int = 1,
+        ordered: bool = True,
+        fields: Projection | None = None,
+    ) -> AsyncIterator[ConversationMessage]:
+        """GET conversations/{id}/messages - Перебрать сообщения беседы всех страниц
+
+        Следующая страница запрашивается, пока обрабатывается текущая.
+        При concurrency > 1 после первой страницы остальные запрашиваются
+        параллельно (не больше concurrency одновременно, c учетом
+        ограничителя частоты запросов).
+
+        Параметры
+        ----------
+        conversation_id : int
+            ID беседы
+        page : int, опционален
+            Первая страница, по умолчанию 1
+        concurrency : int, опционален
+            Сколько страниц запрашивать одновременно, по умолчанию 1
+        ordered : bool, опционален
+            Страницы по порядку (True) или по мере получения (False)
+        fields : Iterable[str] | type[BaseModel] | type[tuple], опционален
+            Разобрать только эти поля элементов (вложенные через точку,
+            например "user.username"), разобрать элементы в свою модель
+            или в компактные записи (ThreadRecord, PostRecord и т.п.).
+            Остальные поля не разбираются, элементы - облегченные модели
+
+        Yields ConversationMessage:
+        -------
+            Сообщения в порядке страниц
+        """
+
+        if not isinstance(conversation_id, int):  # type: ignore
+            raise TypeError("Ожидался тип int в параметре conversation_id")
+
+        if not isinstance(page, int):  # type: ignore
+            raise TypeError("Ожидался тип int в параметре page")
+
+        model = self._list_model(
+            ConversationMessagesGetResponse, "messages", fields
+        )
+
+        async def fetch(page: int) -> ConversationMessagesGetResponse:
+            payload = await self._http.get_conversation_messages(
+                conversation_id, ConversationGetMessagesParams(page=page)
+            )
+            return await self._parse(model, payload)
+
+        return paginate(
+            fetch, lambda r: r.messages, page, concurrency, ordered
+        )
+
+    def iter_forum_threads(
+        self,
+        forum_id: int,
+        params: ForumThreadsGetParams | None = None,
+        concurrency: int = 1,
+        ordered: bool = True,
+        fields: Projection | None = None,
+    ) -> AsyncIterator[Thread]:
+        """GET forums/{id}/threads - Перебрать ветки форума всех страниц, начиная c params.page
+
+        Следующая страница запрашивается, пока обрабатывается текущая.
+        При concurrency > 1 после первой страницы остальные запрашиваются
+        параллельно (не больше concurrency одновременно, c учетом
+        ограничителя частоты запросов).
+        Закрепленные ветки (sticky) не включаются.
+
+        Параметры
+        ----------
+        forum_id : int
+            ID форума
+        params : ForumThreadsGetParams, опционален
+            Фильтры, как в get_forum_threads
+        concurrency : int, опционален
+            Сколько страниц запрашивать одновременно, по умолчанию 1
+        ordered : bool, опционален
+            Страницы по порядку (True) или по мере получения (False)
+        fields : Iterable[str] | type[BaseModel] | type[tuple], опционален
+            Разобрать только эти поля элементов (вложенные через точку,
+            например "user.username"), разобрать элементы в свою модель
+            или в компактные записи (ThreadRecord, PostRecord и т.п.).
+            Остальные поля не разбираются, элементы - облегченные модели
+
+        Yields Thread:
+        -------
+            Ветки в порядке страниц
+        """
+
+        if not isinstance(forum_id, int):  # type: ignore
+            raise TypeError("Ожидался тип int в параметре forum_id")
+
+        if params is not None and not isinstance(
+            params, ForumThreadsGetParams
+        ):  # type: ignore
+            raise TypeError(
+                "Ожидался тип ForumThreadsGetParams в параметре params"
+            )
+
+        base = params or ForumThreadsGetParams()
+
+        model = self._list_model(ForumThreadsGetResponse, "threads", fields)
+
+        async def fetch(page: int) -> ForumThreadsGetResponse:
+            payload = await self._http.get_forum_threads(
+                forum_id, base.model_copy(update={"page": page})
+            )
+            return await self._parse(model, payload)
+
+        return paginate(
+            fetch, lambda r: r.threads, base.page or 1, concurrency, ordered
+        )
+
+    def iter_profile_post_comments(
+        self,
+        profile_post_id: int,
+        params: ProfilePostCommentsGetParams | None = None,
+        concurrency: int = 1,
+        ordered: bool = True,
+        fields: Projection | None = None,
+    ) -> AsyncIterator[ProfilePostComment]:
+        """GET profile-posts/{id}/comments - Перебрать комментарии всех страниц, начиная c params.page
+
+        Следующая страница запрашивается, пока обрабатывается текущая.
+        При concurrency > 1 после первой страницы остальные запрашиваются
+        параллельно (не больше concurrency одновременно, c учетом
+        ограничителя частоты запросов).
+
+        Параметры
+        ----------
+        profile_post_id : int
+            ID поста профиля
+        params : ProfilePostCommentsGetParams, опционален
+            Параметры, как в get_profile_post_comments
+        concurrency : int, опционален
+            Сколько страниц запрашивать одновременно, по умолчанию 1
+        ordered : bool, опционален
+            Страницы по порядку (True) или по мере получения (False)
+        fields : Iterable[str] | type[BaseModel] | type[tuple], опционален
+            Разобрать только эти поля элементов (вложенные через точку,
+            например "user.username"), разобрать элементы в свою модель
+            или в компактные записи (ThreadRecord, PostRecord и т.п.).
+            Остальные поля не разбираются, элементы - облегченные модели
+
+        Yields ProfilePostComment:
+        -------
+            Комментарии в порядке страниц
+        """
+
+        if not isinstance(profile_post_id, int):  # type: ignore
+            raise TypeError("Ожидался тип int в параметре profile_post_id")
+
+        if params is not None and not isinstance(
+            params, ProfilePostCommentsGetParams
+        ):  # type: ignore
+            raise TypeError(
+                "Ожидался тип ProfilePostCommentsGetParams в параметре params"
+            )
+
+        base = params or ProfilePostCommentsGetParams()
+
+        model = self._list_model(
+            ProfilePostCommentsGetResponse, "comments", fields
+        )
+
+        async def fetch(page: int) -> ProfilePostCommentsGetResponse:
+            payload = await self._http.get_profile_post_comments(
+                profile_post_id, base.model_copy(update={"page": page})
+            )
+            return await self._parse(model, payload)
+
+        return paginate(
+            fetch, lambda r: r.comments, base.page or 1, concurrency, ordered
+        )
+
+    def iter_threads(
+        self,
+        params: ThreadsGetParams | None = None,
+        concurrency: int = 1,
+        ordered: bool = True,
+        fields: Projection | None = None,
+    ) -> AsyncIterator[Thread]:
+        """GET threads/ - Перебрать ветки всех страниц, начиная c params.page
+
+        Следующая страница запрашивается, пока обрабатывается текущая.
+        При concurrency > 1 после первой страницы остальные запрашиваются
+        параллельно (не больше concurrency одновременно, c учетом
+        ограничителя частоты запросов).
+
+        Параметры
+        ----------
+        params : ThreadsGetParams, опционален
+            Фильтры, как в get_threads
+        concurrency : int, опционален
+            Сколько страниц запрашивать одновременно, по умолчанию 1
+        ordered : bool, опционален
+            Страницы по порядку (True) или по мере получения (False)
+        fields : Iterable[str] | type[BaseModel] | type[tuple], опционален
+            Разобрать только эти поля элементов (вложенные через точку,
+            например "user.username"), разобрать элементы в свою модель
+            или в компактные записи (ThreadRecord, PostRecord и т.п.).
+            Остальные поля не разбираются, элементы - облегченные модели
+
+        Yields Thread:
+        -------
+            Ветки в порядке страниц
+        """
+
+        if params is not None and not isinstance(params, ThreadsGetParams):  # type: ignore
+            raise TypeError("Ожидался тип ThreadsGetParams в параметре params")
+
+        base = params or ThreadsGetParams()
+
+        model = self._list_model(ThreadsGetResponse, "threads", fields)
+
+        async def fetch(page: int) -> ThreadsGetResponse:
+            payload = await self._http.get_threads(
+                base.model_copy(update={"page": page})
+            )
+            return await self._parse(model, payload)
+
+        return paginate(
+            fetch, lambda r: r.threads, base.page or 1, concurrency, ordered
+        )
+
+    def iter_thread_posts(
+        self,
+        thread_id: int,
+        params: ThreadPostsGetParams | None = None,
+        concurrency: int = 1,
+        ordered: bool = True,
+        fields: Projection | None = None,
+    ) -> AsyncIterator[Post]:
+        """GET threads/{id}/posts - Перебрать посты ветки всех страниц, начиная c params.page
+
+        Следующая страница запрашивается, пока обрабатывается текущая.
+        При concurrency > 1 после первой страницы остальные запрашиваются
+        параллельно (не больше concurrency одновременно, c учетом
+        ограничителя частоты запросов).
+
+        Параметры
+        ----------
+        thread_id : int
+            ID ветки
+        params : ThreadPostsGetParams, опционален
+            Параметры, как в get_thread_posts
+        concurrency : int, опционален
+            Сколько страниц запрашивать одновременно, по умолчанию 1
+        ordered : bool, опционален
+            Страницы по порядку (True) или по мере получения (False)
+        fields : Iterable[str] | type[BaseModel] | type[tuple], опционален
+            Разобрать только эти поля элементов (вложенные через точку,
+            например "user.username"), разобрать элементы в свою модель
+            или в компактные записи (ThreadRecord, PostRecord и т.п.).
+            Остальные поля не разбираются, элементы - облегченные модели
+
+        Yields Post:
+        -------
+            Посты в порядке страниц
+        """
+
+        if not isinstance(thread_id, int):  # type: ignore
+            raise TypeError("Ожидался тип int в параметре thread_id")
+
+        if params is not None and not isinstance(params, ThreadPostsGetParams):  # type: ignore
+            raise TypeError(
+                "Ожидался тип ThreadPostsGetParams в параметре params"
+            )
+
+        base = params or ThreadPostsGetParams()
+
+        model = self._list_model(ThreadPostsGetResponse, "posts", fields)
+
+        async def fetch(page: int) -> ThreadPostsGetResponse:
+            payload = await self._http.get_thread_posts(
+                thread_id, base.model_copy(update={"page": page})
+            )
+            return await self._parse(model, payload)
+
+        return paginate(
+            fetch, lambda r: r.posts, base.page or 1, concurrency, ordered
+        )
+
+    def iter_users(
+        self,
+        params: UsersGetParams | None = None,
+        concurrency: int = 1,
+        ordered: bool = True,
+        fields: Projection | None = None,
+    ) -> AsyncIterator[User]:
+        """GET users/ - Перебрать пользователей всех страниц, начиная c params.page
+
+        Следующая страница запрашивается, пока обрабатывается текущая.
+        При concurrency > 1 после первой страницы остальные запрашиваются
+        параллельно (не больше concurrency одновременно, c учетом
+        ограничителя частоты запросов).
+
+        Параметры
+        ----------
+        params : UsersGetParams, опционален
+            Параметры, как в get_users
+        concurrency : int, опционален
+            Сколько страниц запрашивать одновременно, по умолчанию 1
+        ordered : bool, опционален
+            Страницы по порядку (True) или по мере получения (False)
+        fields : Iterable[str] | type[BaseModel] | type[tuple], опционален
+            Разобрать только эти поля элементов (вложенные через точку,
+            например "user.username"), разобрать элементы в свою модель
+            или в компактные записи (ThreadRecord, PostRecord и т.п.).
+            Остальные поля не разбираются, элементы - облегченные модели
+
+        Yields User:
+        -------
+            Пользователи в порядке страниц
+        """
+
+        if params is not None and not isinstance(params, UsersGetParams):  # type: ignore
+            raise TypeError("Ожидался тип UsersGetParams в параметре params")
+
+        base = params or UsersGetParams()
+
+        model = self._list_model(UsersGetResponse, "users", fields)
+
+        async def fetch(page: int) -> UsersGetResponse:
+            payload = await self._http.get_users(
+                base.model_copy(update={"page": page})
+            )
+            return await self._parse(model, payload)
+
+        return paginate(
+            fetch, lambda r: r.users, base.page or 1, concurrency, ordered
+        )
+
+    def iter_user_profile_posts(
+        self,
+        user_id: int,
+        page: int = 1,
+        concurrency: int = 1,
+        ordered: bool = True,
+        fields: Projection | None = None,
+    ) -> AsyncIterator[ProfilePost]:
+        """GET users/{id}/profile-posts - Перебрать посты в профиле пользователя всех страниц
+
+        Следующая страница запрашивается, пока обрабатывается текущая.
+        При concurrency > 1 после первой страницы остальные запрашиваются
+        параллельно (не больше concurrency одновременно, c учетом
+        ограничителя частоты запросов).
+
+        Параметры
+        ----------
+        user_id : int
+            ID пользователя
+        page : int, опционален
+            Первая страница, по умолчанию 1
+        concurrency : int, опционален
+            Сколько страниц запрашивать одновременно, по умолчанию 1
+        ordered : bool, опционален
+            Страницы по порядку (True) или по мере получения (False)
+        fields : Iterable[str] | type[BaseModel] | type[tuple], опционален
+            Разобрать только эти поля элементов (вложенные через точку,
+            например "user.username"), разобрать элементы в свою модель
+            или в компактные записи (ThreadRecord, PostRecord и т.п.).
+            Остальные поля не разбираются, элементы - облегченные модели
+
+        Yields ProfilePost:
+        -------
+            Посты профиля в порядке страниц
+        """
+
+        if not isinstance(user_id, int):  # type: ignore
+            raise TypeError("Ожидался тип int в параметре user_id")
+
+        if not isinstance(page, int):  # type: ignore
+            raise TypeError("Ожидался тип int в параметре page")
+
+        model = self._list_model(
+            UserProfilePostsGetResponse, "profile_posts", fields
+        )
+
+        async def fetch(page: int) -> UserProfilePostsGetResponse:
+            payload = await self._http.get_user_profile_posts(
+                user_id, UserProfilePostsGetParams(page=page)
+            )
+            return await self._parse(model, payload)
+
+        return paginate(
+            fetch, lambda r: r.profile_posts, page, concurrency, ordered
+        )
+
+    # ============================================================================
+    # UPLOADS
+    # ============================================================================
+
+    async def upload_attachments(
+        self,
+        files: Iterable[FileSource],
+        params: AttachmentsCreateNewKeyParams | None = None,
+        key: str | None = None,
+    ) -> AttachmentUploadResult[None]:
+        """POST attachments/ - Загрузить несколько файлов в один ключ вложения
+
+        Если key не передан, ключ создается через create_attachment_key.
+        Файлы загружаются параллельно (не больше upload_data.concurrency
+        одновременно), временные ошибки повторяются. Ошибка одного файла не
+        прерывает загрузку остальных.
+
+        Параметры
+        ----------
+        files : Iterable[BinaryIO | str | PathLike | AsyncIterable[bytes]]
+            Файлы для загрузки
+        params : AttachmentsCreateNewKeyParams, опционален
+            Параметры нового ключа, обязательны если key не передан
+        key : str, опционален
+            Существующий ключ вложения, например key из прошлого результата
+            для повторной загрузки только неудачных файлов
+
+        Returns AttachmentUploadResult:
+        -------
+        key : str
+            Ключ вложения
+        files : List[FileUploadResult]
+            Результат каждого файла в порядке передачи: attachment или error
+        """
+
+        if key is None:
+            if not isinstance(params, AttachmentsCreateNewKeyParams):  # type: ignore
+                raise TypeError(
+                    "Ожидался тип AttachmentsCreateNewKeyParams в параметре params"
+                )
+
+            key = (await self.create_attachment_key(params)).key
+
+        return AttachmentUploadResult(
+            key, await self._upload_files(key, files)
+        )
+
+    async def create_thread_with_attachments(
+        self,
+        params: ThreadCreateParams,
+        files: Iterable[FileSource],
+        key: str | None = None,
+    ) -> AttachmentUploadResult[ThreadCreateResponse]:
+        """POST threads/ - Создать ветку c вложениями
+
+        Создает ключ вложения (если key не передан), параллельно загружает
+        файлы и создает ветку c этим ключом. Если хотя бы один файл не
+        загрузился, ветка не создается: повторите вызов c key из результата
+        и только неудачными файлами (result.failed).
+
+        Параметры
+        ----------
+        params : ThreadCreateParams
+            Параметры ветки, как в create_thread
+        files : Iterable[BinaryIO | str | PathLike | AsyncIterable[bytes]]
+            Файлы для загрузки
+        key : str, опционален
+            Существующий ключ вложения
+
+        Returns AttachmentUploadResult:
+        -------
+        key : str
+            Ключ вложения
+        files : List[FileUploadResult]
+            Результат каждого файла в порядке передачи
+        content : ThreadCreateResponse | None
+            Созданная ветка, None если какой-то файл не загрузился
+        """
+
+        if not isinstance(params, ThreadCreateParams):  # type: ignore
+            raise TypeError(
+                "Ожидался тип ThreadCreateParams в параметре params"
+            )
+
+        if key is None:
+            key = await self._new_attachment_key({"node_id": params.node_id})
+
+        result: AttachmentUploadResult[ThreadCreateResponse] = (
+            AttachmentUploadResult(key, await self._upload_files(key, files))
+        )
+        if result.ok:
+            result.content = await self.create_thread(
+                params.model_copy(update={"attachment_key": key})
+            )
+
+        return result
+
+    async def create_post_with_attachments(
+        self,
+        params: PostCreateParams,
+        files: Iterable[FileSource],
+        key: str | None = None,
+    ) -> AttachmentUploadResult[PostCreateResponse]:
+        """POST posts/ - Создать пост c вложениями
+
+        Создает ключ вложения (если key не передан), параллельно загружает
+        файлы и создает пост c этим ключом. Если хотя бы один файл не
+        загрузился, пост не создается: повторите вызов c key из результата
+        и только неудачными файлами (result.failed).
+
+        Параметры
+        ----------
+        params : PostCreateParams
+            Параметры поста, как в create_post
+        files : Iterable[BinaryIO | str | PathLike | AsyncIterable[bytes]]
+            Файлы для загрузки
+        key : str, опционален
+            Существующий ключ вложения
+
+        Returns AttachmentUploadResult:
+        -------
+        key : str
+            Ключ вложения
+        files : List[FileUploadResult]
+            Результат каждого файла в порядке передачи
+        content : PostCreateResponse | None
+            Созданный пост, None если какой-то файл не загрузился
+        """
+
+        if not isinstance(params, PostCreateParams):  # type: ignore
+            raise TypeError("Ожидался тип PostCreateParams в параметре params")
+
+        if key is None:
+            key = await self._new_attachment_key(
+                {"thread_id": params.thread_id}
+            )
+
+        result: AttachmentUploadResult[PostCreateResponse] = (
+            AttachmentUploadResult(key, await self._upload_files(key, files))
+        )
+        if result.ok:
+            result.content = await self.create_post(
+                params.model_copy(update={"attachment_key": key})
+            )
+
+        return result
+
+    async def _new_attachment_key(self, context: dict[str, Any]) -> str:
+        params = AttachmentsCreateNewKeyParams(
+            type=ContentTypeEnum.POST, context=context
+        )
+        return (await self.create_attachment_key(params)).key
+
+    async def _upload_files(
+        self, key: str, files: Iterable[FileSource]
+    ) -> list[FileUploadResult]:
+        async def upload(source: FileSource) -> Attachment:
+            return (await self.upload_attachment(key, source)).attachment
+
+        return await upload_files(upload, files, self._upload_data)
@@ -0,0 +1,59 @@
+"""JSON codecs used for response bodies."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, Callable
+
+__all__ = ("JSONCodec", "default_codec", "stdlib_codec")
+
+
+@dataclass(frozen=True)
+class JSONCodec:
+    """Pair of functions converting between JSON bytes and Python values.
+
+    Attributes:
+        name: Name of the library behind the codec.
+        loads: Decode a JSON document from bytes, raises ``ValueError`` on
+            invalid input.
+        dumps: Encode a value into JSON bytes.
+    """
+
+    name: str
+    loads: Callable[[bytes], Any]
+    dumps: Callable[[Any], bytes]
+
+
+def _stdlib_dumps(value: Any) -> bytes:
+    return json.dumps(
+        value, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+def stdlib_codec() -> JSONCodec:
+    """Codec built on the standard ``json`` module."""
+    return JSONCodec("json", json.loads, _stdlib_dumps)
+
+
+def default_codec() -> JSONCodec:
+    """Pick the fastest installed codec: orjson, ujson, then ``json``."""
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        return JSONCodec("orjson", orjson.loads, orjson.dumps)
+
+    try:
+        import ujson
+    except ImportError:
+        pass
+    else:
+
+        def ujson_dumps(value: Any) -> bytes:
+            return ujson.dumps(value, ensure_ascii=False).encode()
+
+        return JSONCodec("ujson", ujson.loads, ujson_dumps)
+
+    return stdlib_codec()
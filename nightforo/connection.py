@@ -0,0 +1,43 @@
+"""Connection pool settings for the HTTP client."""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import aiohttp
+
+__all__ = ("ConnectionData",)
+
+
+@dataclass
+class ConnectionData:
+    """Settings of the pooled connector used by ``HTTPClient``.
+
+    Attributes:
+        limit: Total number of simultaneous connections.
+        limit_per_host: Number of simultaneous connections to one host,
+            0 for no limit other than ``limit``. The client talks to a
+            single host, so by default ``limit`` applies alone.
+        keepalive_timeout: Seconds an idle connection is kept open.
+        ttl_dns_cache: Seconds resolved addresses are cached, ``None``
+            caches them forever.
+        warmup_connections: Number of connections opened up front when the
+            client is started.
+        close_timeout: Seconds ``close()`` waits for in-flight requests
+            before the session is closed anyway.
+    """
+
+    limit: int = 100
+    limit_per_host: int = 0
+    keepalive_timeout: float = 30.0
+    ttl_dns_cache: Optional[int] = 300
+    warmup_connections: int = 0
+    close_timeout: float = 10.0
+
+    def create_connector(self) -> aiohttp.TCPConnector:
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+            use_dns_cache=True,
+        )
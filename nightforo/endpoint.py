@@ -23,6 +23,21 @@ class Endpoint:
         self.url = url
         self.supported_methods = supported_methods
 
+    @property
+    def family(self) -> str:
+        """First path segment after the API root, e.g. ``"threads"``."""
+        path = self.url.split("/api/", 1)[-1]
+        return path.split("/", 1)[0]
+
+    @property
+    def route(self) -> str:
+        """Path after the API root with IDs replaced, e.g. ``"posts/{id}"``."""
+        path = self.url.split("/api/", 1)[-1]
+        return "/".join(
+            "{id}" if segment.isdigit() else segment
+            for segment in path.split("/")
+        )
+
     def __add__(self, other: Any):
         """Concatenate endpoint URL with a string.
 
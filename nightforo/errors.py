@@ -1,5 +1,7 @@
 """Custom exceptions for NightForo."""
 
+from __future__ import annotations
+
 
 class NightForoBaseError(Exception):
     """Base exception for NightForo."""
@@ -8,8 +10,26 @@ class NightForoBaseError(Exception):
 class XenForoError(Exception):
     """Exception raised for XenForo API errors."""
 
-    def __init__(self, msg: object) -> None:
+    def __init__(self, msg: object, status: int | None = None) -> None:
         super().__init__(msg)
+        self.errors = msg
+        self.status = status
+
+    @property
+    def codes(self) -> list[str]:
+        """Error codes reported by the API, e.g. ``["no_permission"]``."""
+        errors = self.errors
+        if not isinstance(errors, list):
+            errors = [errors]
+
+        codes: list[str] = []
+        for error in errors:  # type: ignore
+            if isinstance(error, dict) and "code" in error:
+                codes.append(str(error["code"]))  # type: ignore
+            elif isinstance(error, str):
+                codes.append(error)
+
+        return codes
 
 
 class UnsupportedEndpointMethodError(XenForoError):
@@ -18,3 +38,19 @@ class UnsupportedEndpointMethodError(XenForoError):
 
 class NoApiKeyProvidedError(NightForoBaseError):
     """Exception raised when no API key is provided."""
+
+
+class ClientClosedError(NightForoBaseError):
+    """Exception raised when a request is made while the client is closing."""
+
+
+class RateLimitedError(XenForoError):
+    """Exception raised when the API keeps rejecting requests with 429."""
+
+    def __init__(self, msg: object, retry_after: float | None = None) -> None:
+        super().__init__(msg, status=429)
+        self.retry_after = retry_after
+
+
+class DeadlineExceededError(NightForoBaseError, TimeoutError):
+    """Exception raised when the context deadline has passed."""
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING, BinaryIO
+import time
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
 
 import aiohttp
 
 from . import __version__
-from .endpoint import HTTPMethod
+from .cache import CacheData, ResponseCache, request_key
+from .codec import JSONCodec, default_codec
+from .connection import ConnectionData
+from .endpoint import HTTPMethod, create_endpoint
 from .endpoints import (
+    ENDPOINT_API,
     endpoint_alert,
     endpoint_alert_mark,
     endpoint_alerts,
@@ -74,11 +81,34 @@ from .endpoints import (
     endpoint_users_find_email,
     endpoint_users_find_name,
 )
-from .errors import UnsupportedEndpointMethodError, XenForoError
+from .errors import (
+    ClientClosedError,
+    DeadlineExceededError,
+    RateLimitedError,
+    UnsupportedEndpointMethodError,
+    XenForoError,
+)
+from .instrumentation import (
+    TRACE_KEY,
+    Instrumentation,
+    InstrumentationData,
+    RequestTiming,
+)
+from .ratelimit import RateLimitData, RateLimiter, parse_retry_after
+from .retry import RetryData
+from .singleflight import SingleFlight
+from .stream import DataStream
+from .timeouts import TimeoutData, current_timeout, remaining
 from .types.file import XenforoFile
 
 if TYPE_CHECKING:
-    from typing import Any
+    from typing import (
+        Any,
+        AsyncContextManager,
+        AsyncIterator,
+        Awaitable,
+        Sequence,
+    )
 
     from pydantic import BaseModel
 
@@ -115,6 +145,7 @@ if TYPE_CHECKING:
         ConversationMessageReplyParams,
         ConversationMessageUpdateParams,
     )
+    from .types.file import FileSource, UploadProgress
     from .types.forum.params import (
         ForumGetParams,
         ForumMarkReadParams,
@@ -179,6 +210,32 @@ if TYPE_CHECKING:
 _log = logging.getLogger(__name__)
 
 
+def _dump(params: BaseModel | dict[str, Any]) -> dict[str, Any]:
+    if isinstance(params, dict):
+        return {
+            key: value for key, value in params.items() if value is not None
+        }
+
+    return params.model_dump(by_alias=True, exclude_none=True)
+
+
+def _form_fields(
+    values: dict[str, Any], prefix: str = ""
+) -> list[tuple[str, Any]]:
+    """Flatten nested values into PHP style ``name[key]`` form fields."""
+    fields: list[tuple[str, Any]] = []
+    for key, value in values.items():
+        name = f"{prefix}[{key}]" if prefix else key
+        if isinstance(value, dict):
+            fields.extend(_form_fields(value, name))
+        elif isinstance(value, (list, tuple, set)):
+            fields.extend((f"{name}[]", item) for item in value)
+        elif value is not None:
+            fields.append((name, value))
+
+    return fields
+
+
 class HTTPClient:
     def __init__(
         self,
@@ -186,23 +243,103 @@ class HTTPClient:
         is_super_user: bool = False,
         xf_user_id: int | None = None,
         connector: aiohttp.BaseConnector | None = None,
+        connection_data: ConnectionData | None = None,
+        rate_limit_data: RateLimitData | None = None,
+        retry_data: RetryData | None = None,
+        timeout_data: TimeoutData | None = None,
+        cache_data: CacheData | None = None,
+        coalesce_requests: bool = True,
+        codec: JSONCodec | None = None,
+        instrumentation_data: InstrumentationData | None = None,
     ) -> None:
         self.api_key = api_key
         self.xf_user_id = xf_user_id
         self.is_super_user = is_super_user
-        self._session = aiohttp.ClientSession(connector=connector)
+        self.connection_data = connection_data or ConnectionData()
+        self.retry_data = retry_data or RetryData()
+        self.timeout_data = timeout_data or TimeoutData()
+        self.codec = codec or default_codec()
+        self._connector = connector
+        self._session: aiohttp.ClientSession | None = None
+        self._in_flight = 0
+        self._idle: asyncio.Event | None = None
+        self._closing = False
+        self._rate_limiter = (
+            RateLimiter(rate_limit_data) if rate_limit_data else None
+        )
+        self._cache = (
+            ResponseCache(cache_data, self.codec) if cache_data else None
+        )
+        self._single_flight = SingleFlight() if coalesce_requests else None
+        self._instrumentation = (
+            Instrumentation(instrumentation_data)
+            if instrumentation_data
+            else None
+        )
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        return self._cache
+
+    @property
+    def single_flight(self) -> SingleFlight | None:
+        return self._single_flight
+
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        return self._rate_limiter
+
+    @property
+    def instrumentation(self) -> Instrumentation | None:
+        return self._instrumentation
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def connections_in_use(self) -> int:
+        """Connections of the pool currently serving a request."""
+        if self._session is None or self._session.closed:
+            return 0
+
+        # aiohttp has no public counter of acquired connections
+        return len(getattr(self._session.connector, "_acquired", ()))
+
+    @property
+    def connection_limit(self) -> int:
+        """Size of the connection pool, 0 when it is unlimited."""
+        if self._session is not None and self._session.connector:
+            return self._session.connector.limit
+
+        return self.connection_data.limit
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._closing:
+            raise ClientClosedError("Client is closing")
+
+        if self._session is None or self._session.closed:
+            connector = self._connector
+            if connector is None or connector.closed:
+                connector = self.connection_data.create_connector()
+
+            trace_configs = None
+            if self._instrumentation is not None:
+                trace_configs = [self._instrumentation.trace_config()]
+
+            self._session = aiohttp.ClientSession(
+                connector=connector, trace_configs=trace_configs
+            )
+            self._idle = asyncio.Event()
+            self._idle.set()
 
-    async def _request(
-        self,
-        endpoint: Endpoint,
-        method: HTTPMethod,
-        body_params: BaseModel | None = None,
-        query_params: BaseModel | None = None,
-        file: XenforoFile | None = None,
-    ) -> Any:
-        if method not in endpoint.supported_methods:
-            raise UnsupportedEndpointMethodError(method)
+        return self._session
+
+    @property
+    def _acting_user(self) -> int | None:
+        return self.xf_user_id if self.is_super_user else None
 
+    def _headers(self) -> dict[str, str]:
         headers: dict[str, str] = {}
 
         headers["XF-Api-Key"] = self.api_key
@@ -212,28 +349,432 @@ class HTTPClient:
 
         headers["User-Agent"] = "Nightforo/" + __version__
 
+        return headers
+
+    async def start(self) -> None:
+        session = self._get_session()
+
+        count = self.connection_data.warmup_connections
+        if count <= 0:
+            return
+
+        results = await asyncio.gather(
+            *(self._warmup_connection(session) for _ in range(count)),
+            return_exceptions=True,
+        )
+        failed = sum(isinstance(result, Exception) for result in results)
+        _log.debug(
+            "Warmed up %s connections, %s failed", count - failed, failed
+        )
+
+    async def _warmup_connection(self, session: aiohttp.ClientSession) -> None:
+        async with session.head(
+            endpoint_index.url,
+            headers=self._headers(),
+            timeout=self.timeout_data.client_timeout(),
+        ) as response:
+            await response.read()
+
+    async def close(self) -> None:
+        if self._session is None:
+            return
+
+        self._closing = True
+        try:
+            if self._idle is not None and not self._idle.is_set():
+                try:
+                    await asyncio.wait_for(
+                        self._idle.wait(), self.connection_data.close_timeout
+                    )
+                except asyncio.TimeoutError:
+                    _log.warning(
+                        "Closing session with %s requests still in flight",
+                        self._in_flight,
+                    )
+
+            await self._session.close()
+            if self._instrumentation is not None:
+                await self._instrumentation.close()
+        finally:
+            self._session = None
+            self._idle = None
+            self._connector = None
+            self._closing = False
+
+    def _form_data(
+        self,
+        body_params: BaseModel | dict[str, Any] | None,
+        file: XenforoFile | None,
+    ) -> aiohttp.FormData | None:
         data = None
-        query = None
 
         if body_params is not None:
-            dump = body_params.model_dump(by_alias=True, exclude_none=True)
-            data = aiohttp.FormData(dump)
+            data = aiohttp.FormData(_form_fields(_dump(body_params)))
 
         if file is not None:
             if data is None:
                 data = aiohttp.FormData()
 
-            data.add_field(file.name, file.stream)
+            data.add_field(
+                file.name,
+                file.payload(),
+                filename=file.guess_filename(),
+                content_type=file.guess_content_type(),
+            )
+
+        return data
+
+    async def _request(
+        self,
+        endpoint: Endpoint,
+        method: HTTPMethod,
+        body_params: BaseModel | dict[str, Any] | None = None,
+        query_params: BaseModel | dict[str, Any] | None = None,
+        file: XenforoFile | None = None,
+        invalidates: Sequence[Endpoint] = (),
+    ) -> bytes:
+        if method not in endpoint.supported_methods:
+            raise UnsupportedEndpointMethodError(method)
+
+        instrumentation = self._instrumentation
+        if instrumentation is None:
+            return await self._perform(
+                endpoint, method, body_params, query_params, file, invalidates
+            )
+
+        # Finished by the caller once the body is parsed
+        timing = instrumentation.begin(method.value, endpoint.route)
+        try:
+            return await self._perform(
+                endpoint,
+                method,
+                body_params,
+                query_params,
+                file,
+                invalidates,
+                timing,
+            )
+        except BaseException as e:
+            instrumentation.finish(timing, e)
+            raise
+
+    async def _perform(
+        self,
+        endpoint: Endpoint,
+        method: HTTPMethod,
+        body_params: BaseModel | dict[str, Any] | None,
+        query_params: BaseModel | dict[str, Any] | None,
+        file: XenforoFile | None,
+        invalidates: Sequence[Endpoint],
+        timing: RequestTiming | None = None,
+    ) -> bytes:
+        session = self._get_session()
+        family = endpoint.family
+        query = None
 
         if query_params:
-            query = query_params.model_dump(by_alias=True, exclude_none=True)
+            query = _dump(query_params)
+
+        cache = self._cache
+        key = None
+        if method is HTTPMethod.GET:
+            key = request_key(endpoint.url, query, self._acting_user)
+
+            if cache is not None and cache.ttl_for(family) is not None:
+                cached = cache.get(key)
+                if cached is not None:
+                    if timing is not None:
+                        timing.cached = True
+                    return cached
+
+        def execute() -> Awaitable[bytes]:
+            return self._execute(
+                session, endpoint, method, body_params, query, file, timing
+            )
+
+        # Counted before coalescing, so close() waits for callers whose
+        # shared request has not started yet
+        self._begin_request()
+        try:
+            if key is not None and self._single_flight is not None:
+                payload = await self._single_flight.do(key, execute)
+            else:
+                payload = await execute()
+        finally:
+            self._end_request()
+
+        if timing is not None and timing.attempts == 0:
+            timing.coalesced = True
+
+        if cache is not None:
+            if key is not None:
+                cache.set(key, family, payload)
+
+            for changed in invalidates:
+                cache.invalidate(changed.url, payload)
+
+        return payload
+
+    async def _execute(
+        self,
+        session: aiohttp.ClientSession,
+        endpoint: Endpoint,
+        method: HTTPMethod,
+        body_params: BaseModel | dict[str, Any] | None,
+        query: dict[str, Any] | None,
+        file: XenforoFile | None,
+        timing: RequestTiming | None = None,
+    ) -> bytes:
+        family = endpoint.family
+
+        attempt = 0
+        resent = 0
+        started = time.monotonic()
+        while True:
+            queued = time.perf_counter()
+            await self._wait_rate_limit(family)
+            if timing is not None:
+                timing.queue += time.perf_counter() - queued
+                timing.attempts += 1
+
+            attempt += 1
+            timeout = self._timeout()
+            try:
+                payload = await self._send(
+                    session,
+                    endpoint,
+                    method,
+                    self._form_data(body_params, file),
+                    query,
+                    timeout,
+                    timing,
+                )
+            except RateLimitedError as e:
+                error: BaseException = e
+                if timing is not None:
+                    timing.rate_limited += 1
+                if self._rate_limiter is not None:
+                    self._rate_limiter.on_rate_limited(family, e.retry_after)
+
+                    # A consumed file stream can not be sent again
+                    if (file is None or file.reusable) and (
+                        resent < self._rate_limiter.data.max_retries
+                    ):
+                        resent += 1
+                        attempt -= 1
+                        _log.warning(
+                            "%s %s was rate limited, resending (%s/%s)",
+                            method,
+                            endpoint.url,
+                            resent,
+                            self._rate_limiter.data.max_retries,
+                        )
+                        continue
+
+                    # The rate limiter owns 429s, RetryData would only
+                    # send the request again past its max_retries
+                    raise
+            except (
+                XenForoError,
+                aiohttp.ClientError,
+                asyncio.TimeoutError,
+            ) as e:
+                error = e
+            else:
+                if self._rate_limiter is not None:
+                    self._rate_limiter.on_success(family)
+
+                return payload
+
+            left = remaining()
+            if (
+                left is not None
+                and left <= 0
+                and isinstance(error, asyncio.TimeoutError)
+            ):
+                raise DeadlineExceededError(
+                    f"{method.value} {endpoint.url} exceeded the deadline"
+                ) from error
+
+            delay = self.retry_data.next_delay(
+                method, error, attempt, time.monotonic() - started
+            )
+            if delay is None or (left is not None and delay >= left):
+                raise error
+
+            _log.warning(
+                "%s %s failed with %r, retrying in %.2fs (%s/%s)",
+                method,
+                endpoint.url,
+                error,
+                delay,
+                attempt,
+                self.retry_data.max_attempts,
+            )
+            await asyncio.sleep(delay)
+            if timing is not None:
+                timing.retries += 1
+                timing.backoff += delay
+
+    def _begin_request(self) -> None:
+        self._in_flight += 1
+        if self._idle is not None:
+            self._idle.clear()
+
+    def _end_request(self) -> None:
+        self._in_flight -= 1
+        if self._in_flight == 0 and self._idle is not None:
+            self._idle.set()
+
+    @asynccontextmanager
+    async def _stream(
+        self, endpoint: Endpoint, offset: int = 0
+    ) -> AsyncIterator[DataStream]:
+        # Streams are not retried, a broken transfer is resumed by the
+        # caller from the last received byte instead
+        session = self._get_session()
+        family = endpoint.family
+
+        instrumentation = self._instrumentation
+        timing = None
+        if instrumentation is not None:
+            timing = instrumentation.begin(
+                HTTPMethod.GET.value, endpoint.route
+            )
+
+        error = None
+        self._begin_request()
+        try:
+            queued = time.perf_counter()
+            await self._wait_rate_limit(family)
+            if timing is not None:
+                timing.queue += time.perf_counter() - queued
+                timing.attempts += 1
+
+            headers = self._headers()
+            if offset > 0:
+                headers["Range"] = f"bytes={offset}-"
+
+            left = remaining()
+            if left is not None and left <= 0:
+                raise DeadlineExceededError("Deadline exceeded")
+
+            timeout = current_timeout(self.timeout_data).stream_timeout(left)
+            async with session.get(
+                endpoint.url,
+                headers=headers,
+                timeout=timeout,
+                trace_request_ctx=None
+                if timing is None
+                else {TRACE_KEY: timing},
+            ) as response:
+                _log.debug(
+                    "GET %s from byte %s has returned %s",
+                    endpoint.url,
+                    offset,
+                    response.status,
+                )
+                if timing is not None:
+                    timing.status = response.status
+
+                if response.status >= 400 and not (
+                    response.status == 416 and offset > 0
+                ):
+                    await self._raise_for_status(response, family, timing)
+
+                if self._rate_limiter is not None:
+                    self._rate_limiter.on_success(family)
+
+                # The body is read by the caller, the whole time the stream
+                # stays open counts as reading
+                read = time.perf_counter()
+                try:
+                    yield DataStream(response, offset)
+                finally:
+                    if timing is not None:
+                        timing.read += time.perf_counter() - read
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._end_request()
+            if instrumentation is not None and timing is not None:
+                instrumentation.finish(timing, error)
+
+    async def _raise_for_status(
+        self,
+        response: aiohttp.ClientResponse,
+        family: str,
+        timing: RequestTiming | None = None,
+    ) -> None:
+        try:
+            payload = await response.json()
+        except (aiohttp.ContentTypeError, ValueError):
+            payload = None
+
+        errors = None
+        if isinstance(payload, dict):
+            errors = payload.get("errors", payload.get("error"))
+
+        if response.status == 429:
+            retry_after = parse_retry_after(
+                response.headers.get("Retry-After")
+            )
+            if timing is not None:
+                timing.rate_limited += 1
+            if self._rate_limiter is not None:
+                self._rate_limiter.on_rate_limited(family, retry_after)
+
+            raise RateLimitedError(errors or "Too many requests", retry_after)
+
+        raise XenForoError(
+            errors or f"Request failed. Status: {response.status}",
+            status=response.status,
+        )
 
-        async with self._session.request(
+    async def _wait_rate_limit(self, family: str) -> None:
+        if self._rate_limiter is None:
+            return
+
+        left = remaining()
+        if left is None:
+            await self._rate_limiter.acquire(family)
+            return
+
+        try:
+            await asyncio.wait_for(
+                self._rate_limiter.acquire(family), max(0.0, left)
+            )
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError(  # noqa: B904
+                "Deadline exceeded while waiting for the rate limiter"
+            )
+
+    def _timeout(self) -> aiohttp.ClientTimeout:
+        left = remaining()
+        if left is not None and left <= 0:
+            raise DeadlineExceededError("Deadline exceeded")
+
+        return current_timeout(self.timeout_data).client_timeout(left)
+
+    async def _send(
+        self,
+        session: aiohttp.ClientSession,
+        endpoint: Endpoint,
+        method: HTTPMethod,
+        data: aiohttp.FormData | None,
+        query: dict[str, Any] | None,
+        timeout: aiohttp.ClientTimeout,
+        timing: RequestTiming | None = None,
+    ) -> bytes:
+        async with session.request(
             method=method.value,
             url=endpoint.url,
             data=data,
-            headers=headers,
+            headers=self._headers(),
             params=query,
+            timeout=timeout,
+            trace_request_ctx=None if timing is None else {TRACE_KEY: timing},
         ) as response:
             _log.debug(
                 "%s %s with query=%s has returned %s",
@@ -243,20 +784,90 @@ class HTTPClient:
                 response.status,
             )
 
+            retry_after = None
+            if response.status == 429:
+                retry_after = parse_retry_after(
+                    response.headers.get("Retry-After")
+                )
+
+            read = time.perf_counter()
+            body = await response.read()
+            if timing is not None:
+                timing.status = response.status
+                timing.read += time.perf_counter() - read
+
+            # Bodies are validated straight from bytes by the caller, they
+            # are only decoded here when they may carry an error
+            if response.status < 400 and b'"error' not in body:
+                return body
+
             try:
-                payload = await response.json()
-            except aiohttp.ContentTypeError:
+                payload = self.codec.loads(body)
+            except ValueError:
+                if response.status == 429:
+                    raise RateLimitedError(  # noqa: B904
+                        "Too many requests", retry_after
+                    )
+
                 raise XenForoError(  # noqa: B904
-                    f"Response is not JSON. Status: {response.status}"
+                    f"Response is not JSON. Status: {response.status}",
+                    status=response.status,
                 )
 
-            if (errors := payload.get("errors", None)) is not None:
-                raise XenForoError(errors)
+            errors = None
+            if isinstance(payload, dict):
+                errors = payload.get("errors", None)
+                if errors is None:
+                    errors = payload.get("error", None)
 
-            if (errors := payload.get("error", None)) is not None:
-                raise XenForoError(errors)
+            if response.status == 429:
+                raise RateLimitedError(
+                    errors if errors is not None else payload, retry_after
+                )
+
+            if errors is not None:
+                raise XenForoError(errors, status=response.status)
 
-            return payload
+            if response.status >= 400:
+                raise XenForoError(payload, status=response.status)
+
+            return body
+
+    async def request(
+        self,
+        method: HTTPMethod,
+        path: str,
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+        raw: bool = False,
+    ) -> Any:
+        endpoint = create_endpoint(
+            ENDPOINT_API + "/" + path.strip("/"), method
+        )
+        body = await self._request(
+            endpoint=endpoint,
+            method=method,
+            body_params=data,
+            query_params=params,
+            invalidates=() if method is HTTPMethod.GET else (endpoint,),
+        )
+
+        instrumentation = self._instrumentation
+        if instrumentation is None:
+            return body if raw else self.codec.loads(body)
+
+        timing = instrumentation.pending()
+        result = body
+        if not raw:
+            decoding = time.perf_counter()
+            result = self.codec.loads(body)
+            if timing is not None:
+                timing.decode = time.perf_counter() - decoding
+
+        if timing is not None:
+            instrumentation.finish(timing)
+
+        return result
 
     # ============================================================================
     # ALERTS
@@ -281,6 +892,7 @@ class HTTPClient:
             endpoint=endpoint_alerts_mark_all,
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_alerts,),
         )
 
     async def get_alert(self, alert_id: int) -> Any:
@@ -293,6 +905,7 @@ class HTTPClient:
             endpoint=endpoint_alert_mark(alert_id),
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_alert(alert_id),),
         )
 
     # ============================================================================
@@ -307,22 +920,37 @@ class HTTPClient:
         )
 
     async def upload_attachment(
-        self, params: AttachmentUploadParams, attachment: BinaryIO
+        self,
+        params: AttachmentUploadParams,
+        attachment: FileSource,
+        filename: str | None = None,
+        content_type: str | None = None,
+        progress: UploadProgress | None = None,
     ) -> Any:
-        file = XenforoFile(attachment, "attachment")
+        file = XenforoFile(
+            attachment, "attachment", filename, content_type, progress
+        )
         return await self._request(
             endpoint=endpoint_attachments,
             method=HTTPMethod.POST,
             body_params=params,
             file=file,
+            invalidates=(endpoint_attachments,),
         )
 
     async def create_attachment_key(
         self,
         params: AttachmentsCreateNewKeyParams,
-        attachment: BinaryIO | None,
+        attachment: FileSource | None,
+        filename: str | None = None,
+        content_type: str | None = None,
+        progress: UploadProgress | None = None,
     ) -> Any:
-        file = XenforoFile(attachment, "attachment") if attachment else None
+        file = None
+        if attachment is not None:
+            file = XenforoFile(
+                attachment, "attachment", filename, content_type, progress
+            )
         return await self._request(
             endpoint=endpoint_attachments_new_key,
             method=HTTPMethod.POST,
@@ -339,13 +967,13 @@ class HTTPClient:
         return await self._request(
             endpoint=endpoint_attachment(attachment_id),
             method=HTTPMethod.DELETE,
+            invalidates=(endpoint_attachment(attachment_id),),
         )
 
-    async def get_attachment_data(self, attachment_id: int) -> Any:
-        return await self._request(
-            endpoint=endpoint_attachment_data(attachment_id),
-            method=HTTPMethod.GET,
-        )
+    def get_attachment_data(
+        self, attachment_id: int, offset: int = 0
+    ) -> AsyncContextManager[DataStream]:
+        return self._stream(endpoint_attachment_data(attachment_id), offset)
 
     async def get_attachment_thumbnail(self, attachment_id: int) -> Any:
         return await self._request(
@@ -402,6 +1030,7 @@ class HTTPClient:
             endpoint=endpoint_conversation_message(message_id),
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_conversation_message(message_id),),
         )
 
     async def react_conversation_message(
@@ -411,6 +1040,7 @@ class HTTPClient:
             endpoint=endpoint_conversation_message_react(message_id),
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_conversation_message(message_id),),
         )
 
     # ============================================================================
@@ -453,6 +1083,7 @@ class HTTPClient:
             endpoint=endpoint_conversation(conversation_id),
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_conversation(conversation_id),),
         )
 
     async def delete_conversation(
@@ -464,6 +1095,7 @@ class HTTPClient:
             endpoint=endpoint_conversation(conversation_id),
             method=HTTPMethod.DELETE,
             query_params=params,
+            invalidates=(endpoint_conversation(conversation_id),),
         )
 
     async def invite_conversation(
@@ -473,6 +1105,7 @@ class HTTPClient:
             endpoint=endpoint_conversation_invite(conversation_id),
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_conversation(conversation_id),),
         )
 
     async def mark_conversation_read(
@@ -484,12 +1117,14 @@ class HTTPClient:
             endpoint=endpoint_conversation_mark_read(conversation_id),
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_conversation(conversation_id),),
         )
 
     async def mark_conversation_unread(self, conversation_id: int) -> Any:
         return await self._request(
             endpoint=endpoint_conversation_mark_unread(conversation_id),
             method=HTTPMethod.POST,
+            invalidates=(endpoint_conversation(conversation_id),),
         )
 
     async def get_conversation_messages(
@@ -510,6 +1145,7 @@ class HTTPClient:
             endpoint=endpoint_conversation_star(conversation_id),
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_conversation(conversation_id),),
         )
 
     # ============================================================================
@@ -532,6 +1168,7 @@ class HTTPClient:
             endpoint=endpoint_forum_mark_read(forum_id),
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_forum(forum_id),),
         )
 
     async def get_forum_threads(
@@ -561,20 +1198,32 @@ class HTTPClient:
 
     async def update_me(self, params: MeUpdateParams) -> Any:
         return await self._request(
-            endpoint=endpoint_me, method=HTTPMethod.POST, body_params=params
+            endpoint=endpoint_me,
+            method=HTTPMethod.POST,
+            body_params=params,
+            invalidates=(endpoint_me,),
         )
 
-    async def update_my_avatar(self, avatar: BinaryIO) -> Any:
-        file = XenforoFile(avatar, "avatar")
+    async def update_my_avatar(
+        self,
+        avatar: FileSource,
+        filename: str | None = None,
+        content_type: str | None = None,
+        progress: UploadProgress | None = None,
+    ) -> Any:
+        file = XenforoFile(avatar, "avatar", filename, content_type, progress)
         return await self._request(
             endpoint=endpoint_me_avatar,
             method=HTTPMethod.POST,
             file=file,
+            invalidates=(endpoint_me,),
         )
 
     async def delete_my_avatar(self) -> Any:
         return await self._request(
-            endpoint=endpoint_me_avatar, method=HTTPMethod.DELETE
+            endpoint=endpoint_me_avatar,
+            method=HTTPMethod.DELETE,
+            invalidates=(endpoint_me,),
         )
 
     async def update_my_email(self, params: MeEmailUpdateParams) -> Any:
@@ -582,6 +1231,7 @@ class HTTPClient:
             endpoint=endpoint_me_email,
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_me,),
         )
 
     async def update_my_password(self, params: MePasswordUpdateParams) -> Any:
@@ -589,6 +1239,7 @@ class HTTPClient:
             endpoint=endpoint_me_password,
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_me,),
         )
 
     # ============================================================================
@@ -605,6 +1256,7 @@ class HTTPClient:
             endpoint=endpoint_nodes,
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_nodes,),
         )
 
     async def get_nodes_flattened(self) -> Any:
@@ -622,6 +1274,7 @@ class HTTPClient:
             endpoint=endpoint_node(node_id),
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_node(node_id),),
         )
 
     async def delete_node(
@@ -631,6 +1284,7 @@ class HTTPClient:
             endpoint=endpoint_node(node_id),
             method=HTTPMethod.DELETE,
             query_params=params,
+            invalidates=(endpoint_node(node_id),),
         )
 
     # ============================================================================
@@ -654,6 +1308,7 @@ class HTTPClient:
             endpoint=endpoint_post(post_id),
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_post(post_id),),
         )
 
     async def delete_post(
@@ -663,12 +1318,14 @@ class HTTPClient:
             endpoint=endpoint_post(post_id),
             method=HTTPMethod.DELETE,
             query_params=params,
+            invalidates=(endpoint_post(post_id),),
         )
 
     async def mark_post_solution(self, post_id: int) -> Any:
         return await self._request(
             endpoint=endpoint_post_mark_solution(post_id),
             method=HTTPMethod.POST,
+            invalidates=(endpoint_post(post_id),),
         )
 
     async def react_post(self, post_id: int, params: PostReactParams) -> Any:
@@ -676,6 +1333,7 @@ class HTTPClient:
             endpoint=endpoint_post_react(post_id),
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_post(post_id),),
         )
 
     async def vote_post(self, post_id: int, params: PostVoteParams) -> Any:
@@ -683,6 +1341,7 @@ class HTTPClient:
             endpoint=endpoint_post_vote(post_id),
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_post(post_id),),
         )
 
     # ============================================================================
@@ -711,6 +1370,7 @@ class HTTPClient:
             endpoint=endpoint_profile_post_comment(comment_id),
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_profile_post_comment(comment_id),),
         )
 
     async def delete_profile_post_comment(
@@ -722,6 +1382,7 @@ class HTTPClient:
             endpoint=endpoint_profile_post_comment(comment_id),
             method=HTTPMethod.DELETE,
             query_params=params,
+            invalidates=(endpoint_profile_post_comment(comment_id),),
         )
 
     async def react_profile_post_comment(
@@ -731,6 +1392,7 @@ class HTTPClient:
             endpoint=endpoint_profile_post_comment_react(comment_id),
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_profile_post_comment(comment_id),),
         )
 
     # ============================================================================
@@ -764,6 +1426,7 @@ class HTTPClient:
             endpoint=endpoint_profile_post(profile_post_id),
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_profile_post(profile_post_id),),
         )
 
     async def delete_profile_post(
@@ -775,6 +1438,7 @@ class HTTPClient:
             endpoint=endpoint_profile_post(profile_post_id),
             method=HTTPMethod.DELETE,
             query_params=params,
+            invalidates=(endpoint_profile_post(profile_post_id),),
         )
 
     async def get_profile_post_comments(
@@ -795,6 +1459,7 @@ class HTTPClient:
             endpoint=endpoint_profile_post_react(profile_post_id),
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_profile_post(profile_post_id),),
         )
 
     # ============================================================================
@@ -840,6 +1505,7 @@ class HTTPClient:
             endpoint=endpoint_thread(thread_id),
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_thread(thread_id),),
         )
 
     async def delete_thread(
@@ -849,6 +1515,7 @@ class HTTPClient:
             endpoint=endpoint_thread(thread_id),
             method=HTTPMethod.DELETE,
             query_params=params,
+            invalidates=(endpoint_thread(thread_id),),
         )
 
     async def change_thread_type(
@@ -858,6 +1525,7 @@ class HTTPClient:
             endpoint=endpoint_thread_change_type(thread_id),
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_thread(thread_id),),
         )
 
     async def mark_thread_read(
@@ -867,6 +1535,7 @@ class HTTPClient:
             endpoint=endpoint_thread_mark_read(thread_id),
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_thread(thread_id),),
         )
 
     async def move_thread(
@@ -876,6 +1545,7 @@ class HTTPClient:
             endpoint=endpoint_thread_move(thread_id),
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_thread(thread_id),),
         )
 
     async def get_thread_posts(
@@ -894,6 +1564,7 @@ class HTTPClient:
             endpoint=endpoint_thread_vote(thread_id),
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_thread(thread_id),),
         )
 
     # ============================================================================
@@ -938,6 +1609,7 @@ class HTTPClient:
             endpoint=endpoint_user(user_id),
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_user(user_id),),
         )
 
     async def delete_user(
@@ -947,19 +1619,30 @@ class HTTPClient:
             endpoint=endpoint_user(user_id),
             method=HTTPMethod.DELETE,
             query_params=params,
+            invalidates=(endpoint_user(user_id),),
         )
 
-    async def update_user_avatar(self, user_id: int, avatar: BinaryIO) -> Any:
-        file = XenforoFile(avatar, "avatar")
+    async def update_user_avatar(
+        self,
+        user_id: int,
+        avatar: FileSource,
+        filename: str | None = None,
+        content_type: str | None = None,
+        progress: UploadProgress | None = None,
+    ) -> Any:
+        file = XenforoFile(avatar, "avatar", filename, content_type, progress)
         return await self._request(
             endpoint=endpoint_user_avatar(user_id),
             method=HTTPMethod.POST,
             file=file,
+            invalidates=(endpoint_user(user_id),),
         )
 
     async def delete_user_avatar(self, user_id: int) -> Any:
         return await self._request(
-            endpoint=endpoint_user_avatar(user_id), method=HTTPMethod.DELETE
+            endpoint=endpoint_user_avatar(user_id),
+            method=HTTPMethod.DELETE,
+            invalidates=(endpoint_user(user_id),),
         )
 
     async def get_user_profile_posts(
@@ -985,6 +1668,7 @@ class HTTPClient:
             endpoint=endpoint_demote_user(user_id),
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_user(user_id),),
         )
 
     async def get_promote_groups(self) -> Any:
@@ -999,4 +1683,5 @@ class HTTPClient:
             endpoint=endpoint_promote_user(user_id),
             method=HTTPMethod.POST,
             body_params=params,
+            invalidates=(endpoint_user(user_id),),
         )
@@ -0,0 +1,180 @@
+"""Sharing of repeated model instances between and within responses."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Hashable
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    create_model,
+    model_validator,
+)
+
+from .parsing import M
+from .projection import _copy, _replace
+from .types.base import model_fields
+from .types.user import User
+
+__all__ = ("IdentityData", "IdentityMap", "IdentityScope", "identity_model")
+
+CONTEXT_KEY = "nightforo_identity_map"
+
+
+class IdentityScope(Enum):
+    """How long shared instances live.
+
+    Attributes:
+        RESPONSE: Instances are shared within one response, e.g. between
+            the posts of a page written by the same user.
+        SESSION: Instances are shared between all responses of a client.
+    """
+
+    RESPONSE = "response"
+    SESSION = "session"
+
+
+@dataclass
+class IdentityData:
+    """Settings of the identity map.
+
+    Attributes:
+        scope: How long shared instances live.
+        maxsize: Maximum number of instances kept with the session scope,
+            the least recently used ones are dropped first.
+    """
+
+    scope: IdentityScope = IdentityScope.RESPONSE
+    maxsize: int = 10000
+
+
+class IdentityMap:
+    """Instances of models already built, by model and key.
+
+    Shared instances are returned to every place they occur in, so they
+    are frozen: assigning to their fields raises ``ValidationError``. Use
+    ``model_copy()`` to get an instance which can be changed. The map can
+    be used from several threads, e.g. by parses running in an executor.
+
+    Args:
+        maxsize: Maximum number of instances, ``None`` for no limit.
+    """
+
+    def __init__(self, maxsize: int | None = None) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._instances: OrderedDict[Hashable, BaseModel] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of instances kept."""
+        return len(self._instances)
+
+    def get(self, key: Hashable) -> BaseModel | None:
+        with self._lock:
+            instance = self._instances.get(key)
+            if instance is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            if self.maxsize is not None:
+                self._instances.move_to_end(key)
+
+            return instance
+
+    def put(self, key: Hashable, instance: BaseModel) -> None:
+        with self._lock:
+            self._instances[key] = instance
+            if (
+                self.maxsize is not None
+                and len(self._instances) > self.maxsize
+            ):
+                self._instances.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._instances.clear()
+
+
+def identity_model(model: type[M]) -> type[M]:
+    """Return a subclass of ``model`` sharing its nested users.
+
+    Users are identified by ``user_id``, ``last_activity`` and the number
+    of fields, so the same user returned by endpoints with different field
+    sets is not mixed up. Shared users are frozen, see ``IdentityMap``.
+    The subclass is only used to parse with an
+    identity map in the validation context, so plain parsing does not pay
+    for the extra validator.
+
+    Args:
+        model: Response model.
+    """
+    return _identity_model(model)  # type: ignore
+
+
+class _SharedUser(User):
+    # One instance stands for every occurrence of the user, a change made
+    # through one of them would show up in all the others
+    model_config = ConfigDict(frozen=True)
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def share_instance(
+        cls,
+        data: Any,
+        handler: ValidatorFunctionWrapHandler,
+        info: ValidationInfo,
+    ) -> Any:
+        identity: IdentityMap | None = (info.context or {}).get(CONTEXT_KEY)
+        if identity is None or not isinstance(data, dict):
+            return handler(data)
+
+        user_id = data.get("user_id")
+        if user_id is None:
+            return handler(data)
+
+        key = (user_id, data.get("last_activity"), len(data))
+        instance = identity.get(key)
+        if instance is None:
+            instance = handler(data)
+            identity.put(key, instance)
+
+        return instance
+
+
+_SharedUser.__name__ = _SharedUser.__qualname__ = User.__name__
+
+_models: dict[type[BaseModel], type[BaseModel]] = {User: _SharedUser}
+
+
+def _identity_model(model: type[BaseModel]) -> type[BaseModel]:
+    shared = _models.get(model)
+    if shared is not None:
+        return shared
+
+    # Models referring to themselves are kept as they are
+    _models[model] = model
+
+    definitions: dict[str, Any] = {}
+    for name, field in model_fields(model).items():
+        annotation = _replace(field.annotation, _identity_model)
+        if annotation is not field.annotation:
+            definitions[name] = (annotation, _copy(field))
+
+    if definitions:
+        _models[model] = create_model(  # type: ignore
+            model.__name__,
+            __base__=model,
+            __module__=model.__module__,
+            **definitions,
+        )
+
+    return _models[model]
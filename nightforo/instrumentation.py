@@ -0,0 +1,317 @@
+"""Per-phase timings of requests."""
+
+from __future__ import annotations
+
+import copy
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Callable
+
+import aiohttp
+
+from .errors import XenForoError
+from .utils.loop_lag import LoopLagMonitor, LoopLagStats
+
+__all__ = (
+    "Instrumentation",
+    "InstrumentationData",
+    "RequestTiming",
+    "RouteStats",
+)
+
+_log = logging.getLogger(__name__)
+
+# Requests traced with a timing carry it under this key of their
+# ``trace_request_ctx``
+TRACE_KEY = "timing"
+
+# Timing of the last request of the current task, kept until the response
+# is parsed
+_pending: ContextVar[RequestTiming | None] = ContextVar(
+    "nightforo_pending_timing", default=None
+)
+
+
+@dataclass
+class InstrumentationData:
+    """Settings of request instrumentation.
+
+    Attributes:
+        callback: Called with every finished ``RequestTiming``. Exceptions
+            raised by it are logged and ignored.
+        loop_lag_interval: Seconds between measurements of the event loop
+            lag, ``None`` disables them.
+    """
+
+    callback: Callable[[RequestTiming], Any] | None = None
+    loop_lag_interval: float | None = 0.1
+
+
+@dataclass
+class RequestTiming:
+    """Time spent in each phase of one request, in seconds.
+
+    Phases of retried requests are summed over all attempts. With
+    ``ValidationMode.VALIDATE`` the body is decoded and validated in one
+    step, which is counted as ``validate``.
+
+    Attributes:
+        method: HTTP method.
+        route: Endpoint route, e.g. ``"threads/{id}/posts"``.
+        status: Status of the last response, ``None`` if there was none.
+        attempts: Number of requests sent, 0 for cached or coalesced ones.
+        cached: Whether the body came from the response cache.
+        coalesced: Whether the body came from an identical request
+            already in flight.
+        error: Name of the exception the request failed with.
+        error_codes: Error codes reported by the API, e.g.
+            ``["no_permission"]``.
+        rate_limited: Number of responses with status 429.
+        retries: Number of attempts made after a failed one.
+        queue: Waiting for the rate limiter.
+        backoff: Waiting between retries.
+        connect: Acquiring a connection from the pool or opening one.
+        ttfb: Sending the request until the response headers arrived.
+        read: Reading the response body. For downloads, the whole time the
+            stream stays open.
+        decode: Decoding JSON.
+        validate: Building the response model.
+        total: Whole request, from the call until the model was built.
+    """
+
+    method: str
+    route: str
+    status: int | None = None
+    attempts: int = 0
+    cached: bool = False
+    coalesced: bool = False
+    error: str | None = None
+    error_codes: list[str] = field(default_factory=list)
+    rate_limited: int = 0
+    retries: int = 0
+    queue: float = 0.0
+    backoff: float = 0.0
+    connect: float = 0.0
+    ttfb: float = 0.0
+    read: float = 0.0
+    decode: float = 0.0
+    validate: float = 0.0
+    total: float = 0.0
+    started: float = field(default_factory=time.perf_counter, repr=False)
+
+    @property
+    def network(self) -> float:
+        """Time spent waiting for the server."""
+        return self.connect + self.ttfb + self.read
+
+    @property
+    def cpu(self) -> float:
+        """Time spent turning the body into a model."""
+        return self.decode + self.validate
+
+
+@dataclass
+class RouteStats:
+    """Sums of the timings of all requests to one route.
+
+    Attributes:
+        requests: Number of finished requests.
+        errors: Number of requests which raised.
+        cached: Number of requests served from the response cache.
+        coalesced: Number of requests sharing another one in flight.
+        attempts: Number of requests sent to the server.
+        max_total: Longest request.
+    """
+
+    requests: int = 0
+    errors: int = 0
+    cached: int = 0
+    coalesced: int = 0
+    attempts: int = 0
+    queue: float = 0.0
+    backoff: float = 0.0
+    connect: float = 0.0
+    ttfb: float = 0.0
+    read: float = 0.0
+    decode: float = 0.0
+    validate: float = 0.0
+    total: float = 0.0
+    max_total: float = 0.0
+
+    @property
+    def network(self) -> float:
+        """Time spent waiting for the server."""
+        return self.connect + self.ttfb + self.read
+
+    @property
+    def cpu(self) -> float:
+        """Time spent turning bodies into models."""
+        return self.decode + self.validate
+
+    def mean(self, phase: str) -> float:
+        """Average time of ``phase`` per request, e.g. ``"ttfb"``."""
+        return getattr(self, phase) / self.requests if self.requests else 0.0
+
+    def add(self, timing: RequestTiming) -> None:
+        self.requests += 1
+        self.errors += timing.error is not None
+        self.cached += timing.cached
+        self.coalesced += timing.coalesced
+        self.attempts += timing.attempts
+        for phase in _PHASES:
+            setattr(self, phase, getattr(self, phase) + getattr(timing, phase))
+        self.max_total = max(self.max_total, timing.total)
+
+
+_PHASES = (
+    "queue",
+    "backoff",
+    "connect",
+    "ttfb",
+    "read",
+    "decode",
+    "validate",
+    "total",
+)
+
+
+class Instrumentation:
+    """Collects timings of requests per route.
+
+    A timing is started by the HTTP client and finished once the response
+    is parsed, then added to ``stats`` and passed to the callback.
+
+    Args:
+        data: Instrumentation settings.
+    """
+
+    def __init__(self, data: InstrumentationData) -> None:
+        self.data = data
+        self._routes: dict[str, RouteStats] = {}
+        self._listeners: list[Callable[[RequestTiming], Any]] = []
+        if data.callback is not None:
+            self._listeners.append(data.callback)
+        self._monitor = (
+            LoopLagMonitor(data.loop_lag_interval)
+            if data.loop_lag_interval is not None
+            else None
+        )
+
+    @property
+    def stats(self) -> dict[str, RouteStats]:
+        """Copy of the stats by ``"METHOD route"``."""
+        return {name: copy.copy(stats) for name, stats in self._routes.items()}
+
+    @property
+    def loop_lag(self) -> LoopLagStats | None:
+        """Lag of the event loop measured since the first request."""
+        if self._monitor is None:
+            return None
+
+        return copy.copy(self._monitor.stats)
+
+    def add_listener(self, callback: Callable[[RequestTiming], Any]) -> None:
+        """Call ``callback`` with every finished timing as well."""
+        self._listeners.append(callback)
+
+    def reset(self) -> None:
+        """Forget the collected stats."""
+        self._routes.clear()
+        if self._monitor is not None:
+            self._monitor.reset()
+
+    def begin(self, method: str, route: str) -> RequestTiming:
+        """Start the timing of a request made by the current task."""
+        if self._monitor is not None:
+            self._monitor.start()
+
+        # A body nobody parsed, e.g. of a request made straight through
+        # the HTTP client, is finished as it is
+        stale = _pending.get()
+        if stale is not None:
+            self.finish(stale)
+
+        timing = RequestTiming(method, route)
+        _pending.set(timing)
+        return timing
+
+    def pending(self) -> RequestTiming | None:
+        """Take the timing of the last request of the current task."""
+        timing = _pending.get()
+        if timing is not None:
+            _pending.set(None)
+
+        return timing
+
+    def finish(
+        self, timing: RequestTiming, error: BaseException | None = None
+    ) -> None:
+        """Record a finished request."""
+        if _pending.get() is timing:
+            _pending.set(None)
+
+        timing.total = time.perf_counter() - timing.started
+        if error is not None:
+            timing.error = type(error).__name__
+            if isinstance(error, XenForoError):
+                timing.error_codes = error.codes
+
+        name = f"{timing.method} {timing.route}"
+        stats = self._routes.get(name)
+        if stats is None:
+            stats = self._routes[name] = RouteStats()
+        stats.add(timing)
+
+        for callback in self._listeners:
+            try:
+                callback(timing)
+            except Exception:
+                _log.exception("Instrumentation callback failed")
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """Trace config measuring connection and response phases."""
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(_on_request_start)
+        trace_config.on_connection_reuseconn.append(_on_connection_ready)
+        trace_config.on_connection_create_end.append(_on_connection_ready)
+        trace_config.on_request_end.append(_on_request_end)
+        return trace_config
+
+    async def close(self) -> None:
+        """Stop measuring the event loop lag."""
+        if self._monitor is not None:
+            await self._monitor.stop()
+
+
+async def _on_request_start(
+    session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+) -> None:
+    context.started = context.ready = time.perf_counter()
+
+
+async def _on_connection_ready(
+    session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+) -> None:
+    timing = _traced(context)
+    if timing is not None and hasattr(context, "started"):
+        context.ready = time.perf_counter()
+        timing.connect += context.ready - context.started
+
+
+async def _on_request_end(
+    session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+) -> None:
+    timing = _traced(context)
+    if timing is not None and hasattr(context, "ready"):
+        timing.ttfb += time.perf_counter() - context.ready
+
+
+def _traced(context: SimpleNamespace) -> RequestTiming | None:
+    request_context = context.trace_request_ctx
+    if not request_context:
+        return None
+
+    return request_context.get(TRACE_KEY)
@@ -0,0 +1,169 @@
+"""Response views converting fields on first access."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Generic, Iterator, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+
+from .parsing import _MAPPING_TYPES, _SEQUENCE_TYPES, _UNION_TYPES, M
+from .types.base import model_fields
+
+__all__ = ("LazyView", "lazy_view")
+
+_Converter = Callable[[Any], Any]
+_MISSING = object()
+
+
+class LazyView(Generic[M]):
+    """Read-only view of a decoded response with the attributes of a model.
+
+    Nothing is validated up front. A field is converted the first time it
+    is read and cached: plain values are validated against the annotation
+    of the field, nested models become views of their own, lists and dicts
+    of models become lists and dicts of views. Models with custom
+    validators are validated whole when they are reached.
+
+    Views are not instances of the model, use ``to_model`` where a real
+    model is needed.
+
+    Args:
+        model: Model the view stands for.
+        data: Decoded JSON object, must not be changed afterwards.
+    """
+
+    __slots__ = ("__dict__", "_data", "_model")
+
+    def __init__(self, model: type[M], data: dict[str, Any]) -> None:
+        self._model = model
+        self._data = data
+
+    def __getattr__(self, name: str) -> Any:
+        """Convert the field ``name`` and cache it on the view."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        try:
+            key, convert = _plan(self._model)[name]
+        except KeyError:
+            raise AttributeError(
+                f"{self._model.__name__!r} object has no attribute {name!r}"
+            ) from None
+
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING:
+            field = self._model.model_fields[name]
+            if field.is_required():
+                raise AttributeError(
+                    f"Field {name!r} of {self._model.__name__} is missing "
+                    "in the response"
+                )
+
+            value = field.get_default(call_default_factory=True)
+        else:
+            value = convert(value)
+
+        self.__dict__[name] = value
+        return value
+
+    def __dir__(self) -> Iterator[str]:
+        """List the fields of the model along with the usual attributes."""
+        return iter({*super().__dir__(), *self._model.model_fields})
+
+    def __repr__(self) -> str:
+        """Show the model and the fields converted so far."""
+        loaded = ", ".join(
+            f"{name}={value!r}" for name, value in self.__dict__.items()
+        )
+        return f"LazyView[{self._model.__name__}]({loaded})"
+
+    def to_model(self) -> M:
+        """Validate the whole response into the model."""
+        return self._model.model_validate(self._data)
+
+
+def lazy_view(model: type[M], data: dict[str, Any]) -> M:
+    """Wrap decoded JSON into a view typed as ``model``.
+
+    Models with custom validators are validated right away.
+
+    Args:
+        model: Response model the view stands for.
+        data: Decoded JSON object.
+    """
+    return _model_converter(model)(data)
+
+
+_plans: dict[type[BaseModel], dict[str, tuple[str, _Converter]]] = {}
+
+
+def _plan(model: type[BaseModel]) -> dict[str, tuple[str, _Converter]]:
+    plan = _plans.get(model)
+    if plan is None:
+        plan = _plans[model] = {
+            name: (field.alias or name, _Deferred(field.annotation))
+            for name, field in model_fields(model).items()
+        }
+
+    return plan
+
+
+class _Deferred:
+    """Converter of a field, built the first time the field is read."""
+
+    __slots__ = ("_annotation", "_convert")
+
+    def __init__(self, annotation: Any) -> None:
+        self._annotation = annotation
+        self._convert: _Converter | None = None
+
+    def __call__(self, value: Any) -> Any:
+        if self._convert is None:
+            self._convert = _converter(self._annotation)
+
+        return self._convert(value)
+
+
+def _model_converter(model: type[BaseModel]) -> _Converter:
+    decorators = model.__pydantic_decorators__
+    if decorators.field_validators or decorators.model_validators:
+        return model.model_validate
+
+    def convert(value: Any) -> Any:
+        if isinstance(value, dict):
+            return LazyView(model, value)
+
+        return model.model_validate(value)
+
+    return convert
+
+
+def _converter(annotation: Any) -> _Converter:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _model_converter(annotation)
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin in _UNION_TYPES:
+        options = [arg for arg in args if arg is not type(None)]
+        if len(options) == 1 and _has_model(options[0]):
+            convert = _converter(options[0])
+            return lambda value: None if value is None else convert(value)
+
+    elif origin in _SEQUENCE_TYPES and len(args) == 1 and _has_model(args[0]):
+        item = _converter(args[0])
+        return lambda value: [item(element) for element in value]
+
+    elif origin in _MAPPING_TYPES and len(args) == 2 and _has_model(args[1]):
+        key = TypeAdapter(args[0]).validate_python
+        item = _converter(args[1])
+        return lambda value: {key(k): item(v) for k, v in value.items()}
+
+    return TypeAdapter(annotation).validate_python
+
+
+def _has_model(annotation: Any) -> bool:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+
+    return any(_has_model(arg) for arg in get_args(annotation))
@@ -0,0 +1,114 @@
+"""Batched, deduplicated entity lookups."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from functools import partial
+from typing import Awaitable, Callable, Generic, Hashable, Iterable, TypeVar
+
+__all__ = ("DataLoader", "LoaderData")
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class LoaderData:
+    """Settings of entity loaders.
+
+    Attributes:
+        window: Seconds during which requested keys are collected into one
+            batch, 0 collects the keys requested in one loop iteration.
+        max_concurrency: Maximum number of lookups of one loader running
+            at the same time.
+    """
+
+    window: float = 0.0
+    max_concurrency: int = 10
+
+
+class DataLoader(Generic[K, V]):
+    """Collect keys requested close together and fetch each one once.
+
+    Keys requested within one batch are deduplicated, every unique key is
+    fetched with bounded concurrency and all callers waiting for it get
+    the same result.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[K], Awaitable[V]],
+        data: LoaderData | None = None,
+    ) -> None:
+        self.data = data or LoaderData()
+        self._fetch = fetch
+        self._pending: dict[K, asyncio.Future[V]] = {}
+        self._scheduled = False
+        self._semaphore: asyncio.Semaphore | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, key: K) -> V:
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            self._schedule(loop)
+
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[K]) -> list[V]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _schedule(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._scheduled:
+            return
+
+        self._scheduled = True
+        if self.data.window > 0:
+            loop.call_later(self.data.window, self._dispatch)
+        else:
+            loop.call_soon(self._dispatch)
+
+    def _dispatch(self) -> None:
+        batch, self._pending = self._pending, {}
+        self._scheduled = False
+
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        task.add_done_callback(partial(_cancel_unresolved, batch))
+
+    async def _run(self, batch: dict[K, asyncio.Future[V]]) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.data.max_concurrency)
+
+        await asyncio.gather(
+            *(self._resolve(key, future) for key, future in batch.items())
+        )
+
+    async def _resolve(self, key: K, future: asyncio.Future[V]) -> None:
+        assert self._semaphore is not None
+        async with self._semaphore:
+            try:
+                result = await self._fetch(key)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+
+
+def _cancel_unresolved(
+    batch: dict[K, asyncio.Future[V]], task: asyncio.Task[None]
+) -> None:
+    """Cancel the futures of a batch whose task stopped before them.
+
+    A batch task cancelled mid-fetch, or before it even started, would
+    otherwise leave every caller of ``load`` waiting forever.
+    """
+    for future in batch.values():
+        if not future.done():
+            future.cancel()
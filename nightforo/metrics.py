@@ -0,0 +1,532 @@
+"""Request metrics in the Prometheus text format."""
+
+from __future__ import annotations
+
+import bisect
+import math
+import weakref
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Sequence, Tuple
+
+from .instrumentation import RequestTiming
+
+if TYPE_CHECKING:
+    from aiohttp import web
+
+    from .http import HTTPClient
+
+__all__ = (
+    "ClientMetrics",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsData",
+    "MetricsRegistry",
+    "metrics_handler",
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+Labels = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+
+    return repr(value)
+
+
+def _series(
+    name: str,
+    names: Sequence[str],
+    values: Labels,
+    value: float,
+    extra: str = "",
+) -> str:
+    pairs = [
+        f'{label}="{_escape(label_value)}"'
+        for label, label_value in zip(names, values)
+    ]
+    if extra:
+        pairs.append(extra)
+
+    labels = "{" + ",".join(pairs) + "}" if pairs else ""
+    return f"{name}{labels} {_format_value(value)}"
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _check(self, labels: Labels) -> None:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {labels}"
+            )
+
+    @abstractmethod
+    def samples(self) -> list[str]:
+        """Render the series of the metric, without the header."""
+
+    def render(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.kind}",
+            *self.samples(),
+        ]
+
+
+class Counter(_Metric):
+    """Value which only goes up, e.g. a number of requests."""
+
+    kind = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only be increased")
+
+        value = self._values.get(labels)
+        if value is None:
+            self._check(labels)
+            value = 0.0
+
+        self._values[labels] = value + amount
+
+    def mirror(self, value: float, labels: Labels = ()) -> None:
+        """Take the value of a count kept elsewhere which only goes up."""
+        if labels not in self._values:
+            self._check(labels)
+
+        self._values[labels] = value
+
+    def get(self, labels: Labels = ()) -> float:
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> list[str]:
+        return [
+            _series(self.name, self.labelnames, labels, value)
+            for labels, value in self._values.items()
+        ]
+
+
+class Gauge(_Metric):
+    """Value which goes up and down, e.g. connections in use."""
+
+    kind = "gauge"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[Labels, float] = {}
+
+    def set(self, value: float, labels: Labels = ()) -> None:
+        if labels not in self._values:
+            self._check(labels)
+
+        self._values[labels] = value
+
+    def get(self, labels: Labels = ()) -> float:
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> list[str]:
+        return [
+            _series(self.name, self.labelnames, labels, value)
+            for labels, value in self._values.items()
+        ]
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per labels: observations per bucket, with one more for +Inf, and
+        # the sum of the observations
+        self._values: dict[Labels, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        entry = self._values.get(labels)
+        if entry is None:
+            self._check(labels)
+            entry = self._values[labels] = (
+                [0] * (len(self.buckets) + 1),
+                [0.0],
+            )
+
+        counts, total = entry
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def samples(self) -> list[str]:
+        lines = []
+        names = self.labelnames
+        for labels, (counts, total) in self._values.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                lines.append(
+                    _series(
+                        f"{self.name}_bucket",
+                        names,
+                        labels,
+                        cumulative,
+                        f'le="{_format_value(bound)}"',
+                    )
+                )
+            lines.append(
+                _series(f"{self.name}_count", names, labels, cumulative)
+            )
+            lines.append(_series(f"{self.name}_sum", names, labels, total[0]))
+
+        return lines
+
+
+class MetricsRegistry:
+    """Metrics kept in memory and rendered in the Prometheus text format.
+
+    Metrics are created once per name, asking for an existing name returns
+    the same metric, so several clients can share one registry. Collectors
+    are called before rendering to refresh gauges, they are held weakly
+    when they are bound methods.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], Callable[[], Any] | None]] = []
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        return self._get(Counter, name, documentation, labelnames)
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        return self._get(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get(
+            Histogram, name, documentation, labelnames, buckets=buckets
+        )
+
+    def add_collector(self, collector: Callable[[], Any]) -> None:
+        """Call ``collector`` before every rendering."""
+        if hasattr(collector, "__self__"):
+            self._collectors.append(weakref.WeakMethod(collector))  # type: ignore
+        else:
+            self._collectors.append(lambda: collector)
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format."""
+        alive = []
+        for reference in self._collectors:
+            collector = reference()
+            if collector is not None:
+                collector()
+                alive.append(reference)
+        self._collectors = alive
+
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+
+        return "\n".join(lines) + "\n"
+
+    def _get(
+        self,
+        kind: type[Any],
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        **options: Any,
+    ) -> Any:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = kind(
+                name, documentation, labelnames, **options
+            )
+        elif type(metric) is not kind or metric.labelnames != tuple(
+            labelnames
+        ):
+            raise ValueError(f"Metric {name} is already registered")
+
+        return metric
+
+
+@dataclass
+class MetricsData:
+    """Settings of client metrics.
+
+    Attributes:
+        registry: Registry the metrics are kept in, a new one by default.
+            Pass the same registry to several clients to serve them
+            together, they are told apart by ``name``.
+        name: Value of the ``client`` label of every metric.
+        namespace: Prefix of the metric names.
+        buckets: Upper bounds of the latency histogram buckets, seconds.
+    """
+
+    registry: MetricsRegistry | None = None
+    name: str = "default"
+    namespace: str = "nightforo"
+    buckets: Sequence[float] = DEFAULT_BUCKETS
+
+
+_PHASES = ("queue", "backoff", "connect", "ttfb", "read", "decode", "validate")
+
+
+class ClientMetrics:
+    """Metrics of the requests of one client.
+
+    Counters and the latency histogram are updated with every timing of
+    the client instrumentation, cache and connection pool gauges are read
+    when the registry is rendered.
+
+    Args:
+        http: HTTP client whose requests are measured.
+        data: Metrics settings.
+    """
+
+    def __init__(self, http: HTTPClient, data: MetricsData) -> None:
+        self.data = data
+        self.registry = data.registry or MetricsRegistry()
+        self._http = http
+        self._client = (data.name,)
+
+        prefix = data.namespace + "_"
+        route = ("client", "method", "route")
+        registry = self.registry
+        self.requests = registry.counter(
+            prefix + "requests_total",
+            "Finished requests.",
+            (*route, "status"),
+        )
+        self.latency = registry.histogram(
+            prefix + "request_duration_seconds",
+            "Time from the call until the response model was built.",
+            route,
+            data.buckets,
+        )
+        self.phases = registry.counter(
+            prefix + "request_phase_seconds_total",
+            "Time spent in each phase of requests.",
+            (*route, "phase"),
+        )
+        self.errors = registry.counter(
+            prefix + "errors_total",
+            "Failed requests by API error code or exception name.",
+            (*route, "code"),
+        )
+        self.retries = registry.counter(
+            prefix + "retries_total",
+            "Requests sent again after a failed attempt.",
+            route,
+        )
+        self.rate_limited = registry.counter(
+            prefix + "rate_limited_total",
+            "Responses with status 429.",
+            route,
+        )
+        self.rate_limit_wait = registry.counter(
+            prefix + "rate_limit_wait_seconds_total",
+            "Time spent waiting for the rate limiter.",
+            route,
+        )
+        self.cached = registry.counter(
+            prefix + "cached_requests_total",
+            "Requests served from the response cache.",
+            route,
+        )
+        self.coalesced = registry.counter(
+            prefix + "coalesced_requests_total",
+            "Requests sharing an identical request in flight.",
+            route,
+        )
+        client = ("client",)
+        self.cache_events = {
+            event: registry.counter(
+                f"{prefix}cache_{event}_total", documentation, client
+            )
+            for event, documentation in (
+                ("hits", "Cache lookups which found a fresh response."),
+                ("misses", "Cache lookups which found no fresh response."),
+                ("evictions", "Responses dropped to make room."),
+                ("expirations", "Responses dropped after their TTL."),
+                ("invalidations", "Responses dropped by a write request."),
+                ("refreshes", "Responses updated by a write request."),
+            )
+        }
+        self.cache_size = registry.gauge(
+            prefix + "cache_size", "Responses in the cache.", client
+        )
+        self.cache_hit_ratio = registry.gauge(
+            prefix + "cache_hit_ratio",
+            "Share of cache lookups which found a response.",
+            client,
+        )
+        self.in_flight = registry.gauge(
+            prefix + "requests_in_flight",
+            "Requests started and not finished yet.",
+            client,
+        )
+        self.connections = registry.gauge(
+            prefix + "connections_in_use",
+            "Connections of the pool serving a request.",
+            client,
+        )
+        self.connection_limit = registry.gauge(
+            prefix + "connection_limit",
+            "Size of the connection pool, 0 when unlimited.",
+            client,
+        )
+        self.pool_saturation = registry.gauge(
+            prefix + "connection_pool_saturation",
+            "Share of the connection pool in use.",
+            client,
+        )
+        self.loop_lag = registry.gauge(
+            prefix + "event_loop_lag_seconds",
+            "Lag of the event loop measured by the instrumentation.",
+            (*client, "stat"),
+        )
+        registry.add_collector(self.collect)
+
+    def observe(self, timing: RequestTiming) -> None:
+        """Update the request metrics with a finished timing."""
+        route = (*self._client, timing.method, timing.route)
+
+        if timing.status is not None:
+            status = str(timing.status)
+        elif timing.cached:
+            status = "cached"
+        elif timing.coalesced:
+            status = "coalesced"
+        else:
+            status = "error"
+        self.requests.inc((*route, status))
+        self.latency.observe(timing.total, route)
+
+        for phase in _PHASES:
+            value = getattr(timing, phase)
+            if value:
+                self.phases.inc((*route, phase), value)
+
+        if timing.error is not None:
+            for code in timing.error_codes or [timing.error]:
+                self.errors.inc((*route, code))
+
+        if timing.retries:
+            self.retries.inc(route, timing.retries)
+        if timing.rate_limited:
+            self.rate_limited.inc(route, timing.rate_limited)
+        if timing.queue:
+            self.rate_limit_wait.inc(route, timing.queue)
+        if timing.cached:
+            self.cached.inc(route)
+        if timing.coalesced:
+            self.coalesced.inc(route)
+
+    def collect(self) -> None:
+        """Read the cache, pool and event loop gauges."""
+        client = self._client
+        http = self._http
+
+        cache = http.cache
+        if cache is not None:
+            stats = cache.stats
+            for event, counter in self.cache_events.items():
+                counter.mirror(getattr(stats, event), client)
+            self.cache_size.set(stats.size, client)
+            self.cache_hit_ratio.set(stats.hit_ratio, client)
+
+        in_use = http.connections_in_use
+        limit = http.connection_limit
+        self.in_flight.set(http.in_flight, client)
+        self.connections.set(in_use, client)
+        self.connection_limit.set(limit, client)
+        self.pool_saturation.set(in_use / limit if limit else 0.0, client)
+
+        instrumentation = http.instrumentation
+        lag = instrumentation.loop_lag if instrumentation else None
+        if lag is not None:
+            self.loop_lag.set(lag.last, (*client, "last"))
+            self.loop_lag.set(lag.mean, (*client, "mean"))
+            self.loop_lag.set(lag.max, (*client, "max"))
+
+    def render(self) -> str:
+        """Render the registry in the Prometheus text format."""
+        return self.registry.render()
+
+
+def metrics_handler(
+    registry: MetricsRegistry,
+) -> Callable[[web.Request], Any]:
+    """Create an aiohttp handler serving ``registry``.
+
+    Example::
+
+        app.router.add_get("/metrics", metrics_handler(client.metrics.registry))
+
+    Args:
+        registry: Registry to render on every request.
+    """
+    from aiohttp import web
+
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(
+            body=registry.render().encode(),
+            headers={"Content-Type": CONTENT_TYPE},
+        )
+
+    return handler
@@ -0,0 +1,133 @@
+"""Parsing of large response bodies outside the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from dataclasses import dataclass
+from enum import Enum
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+from pydantic import BaseModel
+
+from .parsing import parse
+
+__all__ = ("OffloadData", "OffloadExecutor", "ParseOffloader")
+
+T = TypeVar("T")
+
+
+class OffloadExecutor(Enum):
+    """Where large bodies are parsed.
+
+    Attributes:
+        THREAD: In a thread pool. Validation still holds the GIL, but the
+            interpreter switches back to the event loop every few
+            milliseconds, so other coroutines are delayed instead of
+            stalled for the whole parse.
+        PROCESS: In a process pool. The event loop is not slowed down at
+            all, at the cost of pickling the body and the parsed model.
+            Meant for bulk crawls with many large pages.
+    """
+
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+@dataclass
+class OffloadData:
+    """Settings of parsing outside the event loop.
+
+    Attributes:
+        threshold: Size of a body in bytes from which it is parsed in the
+            executor, smaller bodies are parsed in the event loop where
+            handing them over would cost more than parsing.
+        executor: Kind of executor large bodies are parsed in.
+        max_workers: Number of workers of the executor, ``None`` for the
+            default of ``concurrent.futures``.
+    """
+
+    threshold: int = 64 * 1024
+    executor: OffloadExecutor = OffloadExecutor.THREAD
+    max_workers: int | None = None
+
+
+class ParseOffloader:
+    """Runs parsing of large bodies in an executor.
+
+    The executor is created on first use and shut down by ``close``.
+    Models which cannot be sent to another process, such as projections
+    or models parsed with an identity map, are parsed in a thread even
+    with ``OffloadExecutor.PROCESS``.
+
+    Args:
+        data: Offload settings.
+    """
+
+    def __init__(self, data: OffloadData) -> None:
+        self.data = data
+        self._threads: ThreadPoolExecutor | None = None
+        self._processes: ProcessPoolExecutor | None = None
+
+    def should_offload(self, payload: bytes) -> bool:
+        """Whether ``payload`` is large enough to leave the event loop."""
+        return len(payload) >= self.data.threshold
+
+    async def parse(self, model: type[BaseModel], payload: bytes) -> Any:
+        """Validate ``payload`` into ``model`` in the configured executor.
+
+        Args:
+            model: Response model to build.
+            payload: Raw response body.
+        """
+        if self.data.executor is OffloadExecutor.PROCESS and _importable(
+            model
+        ):
+            return await self._run(
+                self._process_pool(), partial(parse, model, payload)
+            )
+
+        return await self.run(partial(parse, model, payload))
+
+    async def run(self, function: Callable[[], T]) -> T:
+        """Run ``function`` in the thread pool."""
+        return await self._run(self._thread_pool(), function)
+
+    def close(self) -> None:
+        """Shut the executors down without waiting for running parses."""
+        for executor in (self._threads, self._processes):
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+        self._threads = None
+        self._processes = None
+
+    async def _run(self, executor: Executor, function: Callable[[], T]) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, function)
+
+    def _thread_pool(self) -> ThreadPoolExecutor:
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(
+                self.data.max_workers, thread_name_prefix="nightforo-parse"
+            )
+
+        return self._threads
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        if self._processes is None:
+            self._processes = ProcessPoolExecutor(self.data.max_workers)
+
+        return self._processes
+
+
+def _importable(model: type) -> bool:
+    """Whether ``model`` can be pickled by reference."""
+    module = sys.modules.get(model.__module__)
+    return getattr(module, model.__qualname__, None) is model
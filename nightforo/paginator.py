@@ -0,0 +1,155 @@
+"""Async iteration over paged XenForo API responses."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Sequence,
+    TypeVar,
+)
+
+from .timeouts import deadline, share
+
+if TYPE_CHECKING:
+    from typing import Protocol
+
+    from .types.pagination import Pagination
+
+    class Page(Protocol):
+        @property
+        def pagination(self) -> Pagination: ...
+
+
+__all__ = ("paginate",)
+
+P = TypeVar("P", bound="Page")
+T = TypeVar("T")
+
+
+async def _fetch_page(
+    fetch: Callable[[int], Awaitable[P]], page: int, pages_left: int
+) -> P:
+    # Give every remaining page an equal share of the context deadline
+    with deadline(share(pages_left)):
+        return await fetch(page)
+
+
+async def paginate(
+    fetch: Callable[[int], Awaitable[P]],
+    items: Callable[[P], Sequence[T]],
+    start: int = 1,
+    concurrency: int = 1,
+    ordered: bool = True,
+) -> AsyncIterator[T]:
+    """Yield items of every page starting from ``start``.
+
+    With ``concurrency`` of 1 page N+1 is requested as soon as page N
+    arrives, so its latency is hidden behind the caller consuming page N.
+    With a higher value the first page is fetched to learn
+    ``Pagination.last_page``, then the remaining pages are requested
+    concurrently, at most ``concurrency`` at a time.
+
+    Args:
+        fetch: Coroutine function returning the response for a page number.
+        items: Function picking the items out of a page response.
+        start: First page to fetch.
+        concurrency: Maximum number of pages requested at the same time.
+        ordered: Yield pages in page order, otherwise in arrival order.
+            Only used when ``concurrency`` is greater than 1.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    # The number of pages is only known once the first one arrives, until
+    # then at least one more page is assumed, so the first page can not
+    # use up the whole context deadline
+    response = await _fetch_page(fetch, start, 2)
+
+    if concurrency > 1:
+        async for item in _fan_out(
+            fetch, items, response, concurrency, ordered
+        ):
+            yield item
+        return
+
+    while True:
+        pagination = response.pagination
+        current = pagination.current_page
+        pages_left = pagination.last_page - current
+
+        next_page = None
+        if pages_left > 0:
+            next_page = asyncio.ensure_future(
+                _fetch_page(fetch, current + 1, pages_left)
+            )
+
+        try:
+            for item in items(response):
+                yield item
+        except BaseException:
+            # The caller stopped iterating, the prefetched page is not needed
+            if next_page is not None:
+                next_page.cancel()
+            raise
+
+        if next_page is None:
+            return
+
+        response = await next_page
+
+
+async def _fan_out(
+    fetch: Callable[[int], Awaitable[P]],
+    items: Callable[[P], Sequence[T]],
+    first: P,
+    concurrency: int,
+    ordered: bool,
+) -> AsyncIterator[T]:
+    pagination = first.pagination
+    last_page = pagination.last_page
+    pages = iter(range(pagination.current_page + 1, last_page + 1))
+    pending: deque[asyncio.Future[P]] = deque()
+
+    def schedule() -> None:
+        page = next(pages, None)
+        if page is not None:
+            # Pages are fetched in waves of `concurrency`, each page gets an
+            # equal share of the deadline left between the waves still to
+            # come, counted from this page on
+            waves = math.ceil((last_page - page + 1) / concurrency)
+            pending.append(
+                asyncio.ensure_future(_fetch_page(fetch, page, waves))
+            )
+
+    for item in items(first):
+        yield item
+
+    for _ in range(concurrency):
+        schedule()
+
+    try:
+        while pending:
+            if ordered:
+                response = await pending.popleft()
+            else:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                task = done.pop()
+                pending.remove(task)
+                response = task.result()
+
+            schedule()
+
+            for item in items(response):
+                yield item
+    except BaseException:
+        for task in pending:
+            task.cancel()
+        raise
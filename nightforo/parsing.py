@@ -0,0 +1,67 @@
+"""Validation of response bodies into models."""
+
+from __future__ import annotations
+
+import collections.abc
+import sys
+from enum import Enum
+from typing import Any, TypeVar, Union
+
+from pydantic import BaseModel
+
+__all__ = ("ValidationMode", "parse")
+
+M = TypeVar("M", bound=BaseModel)
+
+if sys.version_info >= (3, 10):
+    from types import UnionType
+
+    _UNION_TYPES: tuple[Any, ...] = (Union, UnionType)
+else:
+    _UNION_TYPES = (Union,)
+
+_SEQUENCE_TYPES = (
+    list,
+    tuple,
+    set,
+    frozenset,
+    collections.abc.Sequence,
+    collections.abc.Set,
+)
+_MAPPING_TYPES = (dict, collections.abc.Mapping)
+
+
+class ValidationMode(Enum):
+    """How response bodies are turned into models.
+
+    Attributes:
+        VALIDATE: Every field is validated by pydantic.
+        LAZY: Responses are wrapped into ``LazyView`` objects with the
+            attributes of the model, a field is validated the first time
+            it is read.
+    """
+
+    VALIDATE = "validate"
+    LAZY = "lazy"
+
+
+def parse(
+    model: type[M],
+    payload: bytes | str | dict[str, Any],
+    context: dict[str, Any] | None = None,
+) -> M:
+    """Validate a response into ``model``.
+
+    Bodies are fed to the pydantic-core JSON parser directly, so no
+    intermediate dict is built. Already decoded payloads are validated as
+    Python objects.
+
+    Args:
+        model: Response model to build.
+        payload: Raw response body or decoded JSON.
+        context: Validation context passed to validators.
+    """
+    if isinstance(payload, (bytes, bytearray, str)):
+        return model.model_validate_json(payload, context=context)
+
+    return model.model_validate(payload, context=context)
@@ -0,0 +1,223 @@
+"""Slim models holding only some fields of response models."""
+
+from __future__ import annotations
+
+from functools import lru_cache, partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, Field, create_model, field_validator
+from pydantic.fields import FieldInfo
+
+from .parsing import _MAPPING_TYPES, _SEQUENCE_TYPES, _UNION_TYPES
+from .types.base import model_fields
+
+__all__ = ("Projection", "project", "project_list")
+
+Projection = Union[Iterable[str], "type[BaseModel]", "type[tuple]"]
+
+
+def project(model: type[BaseModel], fields: Iterable[str]) -> type[BaseModel]:
+    """Create a model with only ``fields`` of ``model``.
+
+    Other keys of the response are skipped by the JSON parser, so nested
+    models which are not selected are never built. Dotted names select
+    fields of nested models, e.g. ``"user.username"``; a nested field named
+    without a dot is kept whole. Models are cached, so the same projection
+    is created once.
+
+    Args:
+        model: Model to take the fields from.
+        fields: Names of the fields to keep.
+
+    Raises:
+        ValueError: ``model`` has no such field.
+    """
+    return _project(model, frozenset(fields))
+
+
+def project_list(
+    model: type[BaseModel], key: str, items: Projection
+) -> type[BaseModel]:
+    """Create a slim model of a list response.
+
+    The projection keeps ``pagination`` of the response and replaces the
+    items under ``key`` with a projection of their fields, a user-defined
+    model or records such as ``ThreadRecord``. Records are built from a
+    projection holding only their fields.
+
+    Args:
+        model: List response model, e.g. ``ThreadsGetResponse``.
+        key: Field holding the list of items.
+        items: Names of the item fields to keep, a model or a record type
+            to turn the items into.
+
+    Raises:
+        ValueError: ``model`` has no such field.
+    """
+    if not (
+        isinstance(items, type)
+        and (issubclass(items, BaseModel) or _is_record(items))
+    ):
+        items = frozenset(items)
+
+    return _project_list(model, key, items)
+
+
+@lru_cache(maxsize=None)
+def _project(
+    model: type[BaseModel], fields: frozenset[str]
+) -> type[BaseModel]:
+    nested: dict[str, set[str]] = {}
+    for path in fields:
+        name, _, rest = path.partition(".")
+        selected = nested.setdefault(name, set())
+        if rest:
+            selected.add(rest)
+
+    definitions: dict[str, Any] = {}
+    for name, selected in nested.items():
+        field = _field(model, name)
+        annotation = field.annotation
+        if selected:
+            annotation = _replace(
+                annotation, partial(_project, fields=frozenset(selected))
+            )
+            if annotation is field.annotation:
+                raise ValueError(
+                    f"{model.__name__}.{name} is not a nested model"
+                )
+
+        definitions[name] = (annotation, _copy(field))
+
+    return _create(model, definitions)
+
+
+@lru_cache(maxsize=None)
+def _project_list(
+    model: type[BaseModel],
+    key: str,
+    items: frozenset[str] | type[BaseModel] | type[tuple],
+) -> type[BaseModel]:
+    field = _field(model, key)
+    validators: dict[str, Any] = {}
+    if isinstance(items, frozenset):
+        annotation = _replace(
+            field.annotation, partial(_project, fields=items)
+        )
+    elif _is_record(items):
+        fields = frozenset(items._fields)  # type: ignore
+        annotation = List[_project(items.model, fields)]  # type: ignore
+        validators["to_records"] = field_validator(key)(
+            classmethod(partial(_to_records, items))
+        )
+    else:
+        annotation = List[items]  # type: ignore
+
+    definitions: dict[str, Any] = {key: (annotation, _copy(field))}
+    fields = model_fields(model)
+    if "pagination" in fields:
+        pagination = fields["pagination"]
+        definitions["pagination"] = (pagination.annotation, _copy(pagination))
+
+    return _create(model, definitions, validators)
+
+
+def _is_record(value: Any) -> bool:
+    return (
+        isinstance(value, type)
+        and issubclass(value, tuple)
+        and hasattr(value, "model")
+        and hasattr(value, "from_model")
+    )
+
+
+def _to_records(
+    record: Any, cls: type[BaseModel], items: list[BaseModel]
+) -> list[tuple]:
+    return [record.from_model(item) for item in items]
+
+
+def _field(model: type[BaseModel], name: str) -> FieldInfo:
+    try:
+        return model_fields(model)[name]
+    except KeyError:
+        raise ValueError(f"{model.__name__} has no field {name!r}") from None
+
+
+def _copy(field: FieldInfo) -> FieldInfo:
+    """Keep the alias and default of ``field``, but not its annotation."""
+    if field.default_factory is not None:
+        return Field(default_factory=field.default_factory, alias=field.alias)
+
+    if field.is_required():
+        return Field(alias=field.alias)
+
+    return Field(default=field.default, alias=field.alias)
+
+
+def _create(
+    model: type[BaseModel],
+    definitions: dict[str, Any],
+    validators: dict[str, Any] | None = None,
+) -> type[BaseModel]:
+    # Validators of the kept fields still apply to the projection
+    validators = dict(validators or {})
+    for (
+        name,
+        decorator,
+    ) in model.__pydantic_decorators__.field_validators.items():
+        fields = [
+            field for field in decorator.info.fields if field in definitions
+        ]
+        if fields:
+            validators[name] = field_validator(
+                *fields, mode=decorator.info.mode
+            )(classmethod(decorator.func.__func__))  # type: ignore
+
+    return create_model(  # type: ignore
+        f"{model.__name__}Projection",
+        __module__=model.__module__,
+        __validators__=validators,
+        **definitions,
+    )
+
+
+def _replace(
+    annotation: Any, replace: Callable[[type[BaseModel]], type[BaseModel]]
+) -> Any:
+    """Return ``annotation`` with the models in it passed to ``replace``."""
+    origin = get_origin(annotation)
+    if origin is None:
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return replace(annotation)
+
+        return annotation
+
+    args = get_args(annotation)
+    replaced = tuple(_replace(arg, replace) for arg in args)
+    if replaced == args:
+        return annotation
+
+    if origin in _UNION_TYPES:
+        return Union[replaced]  # type: ignore
+
+    if origin in _SEQUENCE_TYPES:
+        if origin is tuple:
+            return Tuple[replaced]  # type: ignore
+
+        return List[replaced[0]]  # type: ignore
+
+    if origin in _MAPPING_TYPES:
+        return Dict[replaced]  # type: ignore
+
+    return annotation
@@ -0,0 +1,215 @@
+"""Client-side rate limiting for the XenForo API."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+__all__ = ("RateLimit", "RateLimitData", "RateLimiter", "TokenBucket")
+
+
+@dataclass
+class RateLimit:
+    """Token bucket settings.
+
+    Attributes:
+        rate: Requests per second refilled into the bucket.
+        burst: Maximum number of requests that can be sent at once.
+    """
+
+    rate: float = 10.0
+    burst: int = 10
+
+
+@dataclass
+class RateLimitData:
+    """Settings of the client-side rate limiter.
+
+    Attributes:
+        limit: Limit shared by all requests.
+        families: Extra limits per endpoint family, keyed by the first
+            path segment of the endpoint (``"threads"``, ``"posts"``,
+            ``"users"``, ``"alerts"`` and so on).
+        backoff_factor: Multiplier applied to the rate after a 429 response.
+        min_rate: Rate the limiter never goes below.
+        recovery: Share of the configured rate regained after every
+            successful request.
+        max_retries: How many times a request rejected with 429 is sent
+            again before ``RateLimitedError`` is raised. These resends
+            replace the retries of ``RetryData`` for 429.
+    """
+
+    limit: RateLimit = field(default_factory=RateLimit)
+    families: dict[str, RateLimit] = field(default_factory=dict)
+    backoff_factor: float = 0.5
+    min_rate: float = 0.2
+    recovery: float = 0.05
+    max_retries: int = 3
+
+
+class TokenBucket:
+    """Async token bucket with adaptive rate.
+
+    The rate is cut by ``backoff_factor`` every time the server rejects a
+    request, once per rejection window, and grows back linearly with every
+    successful one, so the bucket settles just below the rate the server
+    accepts.
+    """
+
+    def __init__(
+        self,
+        limit: RateLimit,
+        backoff_factor: float = 0.5,
+        min_rate: float = 0.2,
+        recovery: float = 0.05,
+    ) -> None:
+        self.max_rate = limit.rate
+        self.rate = limit.rate
+        self.capacity = float(limit.burst)
+        self.backoff_factor = backoff_factor
+        self.min_rate = min(min_rate, limit.rate)
+        self.recovery = recovery
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(
+                self.capacity, self._tokens + elapsed * self.rate
+            )
+            self._updated = now
+
+    async def acquire(self) -> float:
+        """Wait for a token.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            now = time.monotonic()
+            self._refill(now)
+
+            if now < self._blocked_until:
+                delay = self._blocked_until - now
+            elif self._tokens >= 1:
+                self._tokens -= 1
+                return waited
+            else:
+                delay = (1 - self._tokens) / self.rate
+
+            await asyncio.sleep(delay)
+            waited += delay
+
+    def penalize(self, retry_after: float | None = None) -> None:
+        """Slow down after the server rejected a request.
+
+        Requests sent together are often rejected together. Rejections
+        arriving while the bucket is still blocked by an earlier one only
+        extend the block, so a burst of them cuts the rate once.
+
+        Args:
+            retry_after: Seconds the server asked to wait, if any.
+        """
+        now = time.monotonic()
+        self._refill(now)
+        if now >= self._blocked_until:
+            self.rate = max(self.min_rate, self.rate * self.backoff_factor)
+        self._tokens = 0.0
+
+        delay = retry_after if retry_after is not None else 1 / self.rate
+        self._blocked_until = max(self._blocked_until, now + delay)
+
+    def reward(self) -> None:
+        """Speed back up after a successful request."""
+        if self.rate < self.max_rate:
+            self.rate = min(
+                self.max_rate, self.rate + self.max_rate * self.recovery
+            )
+
+
+class RateLimiter:
+    """Global token bucket plus optional buckets per endpoint family."""
+
+    def __init__(self, data: RateLimitData) -> None:
+        self.data = data
+        self.waited = 0.0
+        self.rate_limited = 0
+        self._global = self._bucket(data.limit)
+        self._families = {
+            family: self._bucket(limit)
+            for family, limit in data.families.items()
+        }
+
+    def _bucket(self, limit: RateLimit) -> TokenBucket:
+        return TokenBucket(
+            limit,
+            backoff_factor=self.data.backoff_factor,
+            min_rate=self.data.min_rate,
+            recovery=self.data.recovery,
+        )
+
+    async def acquire(self, family: str) -> float:
+        """Wait until a request of the given family may be sent.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        waited = 0.0
+        bucket = self._families.get(family)
+        if bucket is not None:
+            waited += await bucket.acquire()
+
+        waited += await self._global.acquire()
+        self.waited += waited
+        return waited
+
+    def on_rate_limited(
+        self, family: str, retry_after: float | None = None
+    ) -> None:
+        self.rate_limited += 1
+        self._global.penalize(retry_after)
+
+        bucket = self._families.get(family)
+        if bucket is not None:
+            bucket.penalize(retry_after)
+
+    def on_success(self, family: str) -> None:
+        self._global.reward()
+
+        bucket = self._families.get(family)
+        if bucket is not None:
+            bucket.reward()
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header into seconds.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date.
+
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed.
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,181 @@
+"""Compact tuple records of the core fields of common models.
+
+A record type is a ``NamedTuple`` with a ``model`` attribute naming the
+model its fields come from and a ``from_model`` class method. Paginators
+accept any such type, so own records can be declared the same way.
+"""
+
+from __future__ import annotations
+
+from enum import Enum
+from typing import Any, Callable, NamedTuple, TypeVar, get_args
+
+from pydantic import BaseModel
+
+from .types.alert import AlertActionTypeEnum, UserAlert
+from .types.base import model_fields
+from .types.content_type import ContentTypeEnum
+from .types.conversation import Conversation
+from .types.discussion_state import DiscussionStateEnum
+from .types.node import Node
+from .types.node_type import NodeTypeEnum
+from .types.post import Post
+from .types.thread import Thread
+from .types.user import User
+
+__all__ = (
+    "ConversationRecord",
+    "NodeRecord",
+    "PostRecord",
+    "ThreadRecord",
+    "UserAlertRecord",
+    "UserRecord",
+)
+
+R = TypeVar("R", bound=tuple)
+
+
+def _from_model(cls: type[R], model: BaseModel) -> R:
+    """Take the fields of the record from a parsed model."""
+    return cls._make([getattr(model, name) for name in cls._fields])  # type: ignore
+
+
+def _from_dict(cls: type[R], data: dict[str, Any]) -> R:
+    """Take the fields of the record from decoded JSON without validation.
+
+    Enum fields are converted, missing fields are ``None``.
+    """
+    values = [data.get(name) for name in cls._fields]  # type: ignore
+    for index, convert in _enum_fields(cls):
+        if values[index] is not None:
+            values[index] = convert(values[index])
+
+    return cls._make(values)  # type: ignore
+
+
+class ThreadRecord(NamedTuple):
+    """Core fields of a ``Thread``."""
+
+    thread_id: int
+    node_id: int
+    title: str
+    user_id: int
+    username: str
+    prefix_id: int
+    reply_count: int
+    view_count: int
+    post_date: int
+    last_post_date: int
+    last_post_id: int
+    first_post_id: int
+    sticky: bool
+    discussion_open: bool
+    discussion_state: DiscussionStateEnum
+
+    model = Thread
+    from_model = classmethod(_from_model)
+    from_dict = classmethod(_from_dict)
+
+
+class PostRecord(NamedTuple):
+    """Core fields of a ``Post``."""
+
+    post_id: int
+    thread_id: int
+    user_id: int
+    username: str
+    message: str
+    post_date: int
+    position: int
+    reaction_score: int
+    last_edit_date: int
+    is_first_post: bool
+
+    model = Post
+    from_model = classmethod(_from_model)
+    from_dict = classmethod(_from_dict)
+
+
+class UserRecord(NamedTuple):
+    """Core fields of a ``User``."""
+
+    user_id: int
+    username: str
+    register_date: int
+    last_activity: int | None
+    message_count: int
+    reaction_score: int
+    trophy_points: int
+    is_staff: bool
+
+    model = User
+    from_model = classmethod(_from_model)
+    from_dict = classmethod(_from_dict)
+
+
+class NodeRecord(NamedTuple):
+    """Core fields of a ``Node``."""
+
+    node_id: int
+    title: str
+    node_type_id: NodeTypeEnum
+    parent_node_id: int
+    display_order: int
+
+    model = Node
+    from_model = classmethod(_from_model)
+    from_dict = classmethod(_from_dict)
+
+
+class ConversationRecord(NamedTuple):
+    """Core fields of a ``Conversation``."""
+
+    conversation_id: int
+    title: str
+    user_id: int
+    username: str
+    start_date: int
+    reply_count: int
+    recipient_count: int
+    last_message_date: int
+    last_message_id: int
+
+    model = Conversation
+    from_model = classmethod(_from_model)
+    from_dict = classmethod(_from_dict)
+
+
+class UserAlertRecord(NamedTuple):
+    """Core fields of a ``UserAlert``."""
+
+    alert_id: int
+    alerted_user_id: int
+    user_id: int
+    username: str
+    action: AlertActionTypeEnum
+    content_type: ContentTypeEnum
+    content_id: int
+    event_date: int
+    read_date: int
+
+    model = UserAlert
+    from_model = classmethod(_from_model)
+    from_dict = classmethod(_from_dict)
+
+
+_enums: dict[type, list[tuple[int, Callable[[Any], Any]]]] = {}
+
+
+def _enum_fields(record: type) -> list[tuple[int, Callable[[Any], Any]]]:
+    fields = _enums.get(record)
+    if fields is None:
+        fields = _enums[record] = []
+        source = model_fields(record.model)  # type: ignore
+        for index, name in enumerate(record._fields):  # type: ignore
+            annotation = source[name].annotation
+            for enum in (annotation, *get_args(annotation)):
+                if isinstance(enum, type) and issubclass(enum, Enum):
+                    fields.append((index, enum))
+                    break
+
+    return fields
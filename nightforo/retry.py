@@ -0,0 +1,116 @@
+"""Retry policy for idempotent XenForo API requests."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from dataclasses import dataclass, field
+
+import aiohttp
+
+from .endpoint import HTTPMethod
+from .errors import RateLimitedError, XenForoError
+
+__all__ = ("RetryData",)
+
+
+def _default_methods() -> set[HTTPMethod]:
+    return {HTTPMethod.GET, HTTPMethod.HEAD, HTTPMethod.OPTIONS}
+
+
+def _default_statuses() -> set[int]:
+    return {429, 500, 502, 503, 504}
+
+
+def _default_fatal_codes() -> set[str]:
+    return {
+        "no_permission",
+        "do_not_have_permission",
+        "not_found",
+        "requested_page_not_found",
+        "api_key_not_found",
+        "api_key_inactive",
+        "api_scope_not_allowed",
+    }
+
+
+@dataclass
+class RetryData:
+    """Retry settings for safe requests.
+
+    Failed attempts are retried after a random delay between zero and
+    ``base_delay * 2 ** attempt`` capped by ``max_delay`` (full jitter).
+
+    Attributes:
+        max_attempts: Total number of attempts, 1 disables retries.
+        base_delay: Delay cap of the first retry in seconds.
+        max_delay: Upper bound of a single delay in seconds.
+        deadline: Seconds after the first attempt when no more retries are
+            scheduled, ``None`` for no limit.
+        methods: Methods that are safe to send again.
+        statuses: Response statuses treated as transient. 429 is left to
+            the rate limiter when one is configured, see
+            ``RateLimitData.max_retries``.
+        fatal_codes: XenForo error codes that are never retried even when
+            the status is transient.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+    deadline: float | None = 30.0
+    methods: set[HTTPMethod] = field(default_factory=_default_methods)
+    statuses: set[int] = field(default_factory=_default_statuses)
+    fatal_codes: set[str] = field(default_factory=_default_fatal_codes)
+
+    def is_transient(self, error: BaseException) -> bool:
+        """Check whether a failed attempt may succeed if sent again."""
+        if isinstance(error, XenForoError):
+            if error.status not in self.statuses:
+                return False
+
+            return not any(code in self.fatal_codes for code in error.codes)
+
+        return isinstance(
+            error,
+            (
+                aiohttp.ClientConnectionError,
+                aiohttp.ClientPayloadError,
+                asyncio.TimeoutError,
+            ),
+        )
+
+    def next_delay(
+        self,
+        method: HTTPMethod,
+        error: BaseException,
+        attempt: int,
+        elapsed: float,
+    ) -> float | None:
+        """Compute the delay before the next attempt.
+
+        Args:
+            method: Method of the failed request.
+            error: Error raised by the failed attempt.
+            attempt: Number of attempts made so far.
+            elapsed: Seconds since the first attempt.
+
+        Returns:
+            Seconds to sleep, or None if the error must be raised.
+        """
+        if method not in self.methods or attempt >= self.max_attempts:
+            return None
+
+        if not self.is_transient(error):
+            return None
+
+        cap = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        delay = random.uniform(0, cap)
+
+        if isinstance(error, RateLimitedError) and error.retry_after:
+            delay = max(delay, error.retry_after)
+
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            return None
+
+        return delay
@@ -0,0 +1,87 @@
+"""Coalescing of concurrent identical requests."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable
+
+from .errors import DeadlineExceededError
+from .timeouts import _deadline, override_key, remaining
+
+__all__ = ("SingleFlight", "SingleFlightStats")
+
+
+@dataclass
+class SingleFlightStats:
+    executed: int = 0
+    coalesced: int = 0
+    in_flight: int = 0
+
+
+class SingleFlight:
+    """Share one in-flight call between concurrent callers with one key.
+
+    The first caller starts the call in a separate task, callers arriving
+    before it finishes wait for the same task and get a deep copy of its
+    result. Cancelling one caller does not cancel the call for the others.
+
+    The shared call runs without the deadline of the caller which started
+    it. Every caller waits for it only until its own deadline and then
+    fails with ``DeadlineExceededError``, leaving the call to the others.
+    Only callers with the same ``request_timeout`` override share a call.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Future[Any]] = {}
+        self._stats = SingleFlightStats()
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        self._stats.in_flight = len(self._calls)
+        return copy.copy(self._stats)
+
+    async def do(
+        self, key: Hashable, factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        left = remaining()
+        if left is not None and left <= 0:
+            raise DeadlineExceededError("Deadline exceeded")
+
+        key = (key, override_key())
+        call = self._calls.get(key)
+        leader = call is None
+
+        if call is None:
+            call = asyncio.ensure_future(_without_deadline(factory))
+            self._calls[key] = call
+            call.add_done_callback(lambda done: self._forget(key, done))
+            self._stats.executed += 1
+        else:
+            self._stats.coalesced += 1
+
+        # Waiting does not cancel the call, unlike wait_for
+        done, _ = await asyncio.wait((call,), timeout=left)
+        if not done:
+            raise DeadlineExceededError(
+                "Deadline exceeded while waiting for a shared request"
+            )
+
+        result = call.result()
+        return result if leader else copy.deepcopy(result)
+
+    def _forget(self, key: Hashable, call: asyncio.Future[Any]) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+        # Every caller may have given up on the call already
+        if not call.cancelled():
+            call.exception()
+
+
+async def _without_deadline(factory: Callable[[], Awaitable[Any]]) -> Any:
+    # The task runs in a copy of the leader's context, so this does not
+    # change the deadline of the leader itself
+    _deadline.set(None)
+    return await factory()
@@ -0,0 +1,76 @@
+"""Streamed response bodies."""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import AsyncIterator
+
+    import aiohttp
+
+__all__ = ("DataStream",)
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+
+class DataStream:
+    """Body of a binary response read in chunks.
+
+    Attributes:
+        offset: Byte position in the file the stream starts at.
+        total: Full size of the file in bytes, ``None`` if unknown.
+        content_type: Content type reported by the server.
+    """
+
+    def __init__(self, response: aiohttp.ClientResponse, offset: int) -> None:
+        self._response: aiohttp.ClientResponse | None = response
+        self._skip = 0
+        self.offset = offset
+        self.content_type = response.content_type
+        self.total: int | None = None
+
+        length = response.content_length
+        if response.status == 416:
+            # Range starts at or after the end, the file is already complete
+            self._response = None
+            self.total = offset
+            return
+
+        if response.status == 206:
+            match = _CONTENT_RANGE.match(
+                response.headers.get("Content-Range", "")
+            )
+            if match is not None:
+                self.offset = int(match.group(1))
+                if match.group(3) != "*":
+                    self.total = int(match.group(3))
+            if self.total is None and length is not None:
+                self.total = self.offset + length
+        else:
+            # The server ignored the Range header and sent the whole file
+            self._skip = offset
+            self.total = length
+
+    async def iter_chunks(
+        self, chunk_size: int = 65536
+    ) -> AsyncIterator[bytes]:
+        """Yield the body in chunks of at most ``chunk_size`` bytes."""
+        if self._response is None:
+            return
+
+        skip = self._skip
+        async for chunk in self._response.content.iter_chunked(chunk_size):
+            if skip:
+                if len(chunk) <= skip:
+                    skip -= len(chunk)
+                    continue
+                chunk = chunk[skip:]
+                skip = 0
+
+            yield chunk
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        """Iterate the body in chunks of the default size."""
+        return self.iter_chunks()
@@ -0,0 +1,166 @@
+"""Request timeouts and context-local deadlines."""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from typing import Iterator
+
+import aiohttp
+
+__all__ = ("TimeoutData", "deadline", "remaining", "request_timeout")
+
+_timeout_override: ContextVar[dict[str, float] | None] = ContextVar(
+    "nightforo_timeout_override", default=None
+)
+_deadline: ContextVar[float | None] = ContextVar(
+    "nightforo_deadline", default=None
+)
+
+
+@dataclass(frozen=True)
+class TimeoutData:
+    """Timeouts of a single request attempt.
+
+    Attributes:
+        total: Seconds for the whole attempt including reading the body.
+        connect: Seconds to acquire a connection and connect the socket.
+        read: Seconds between two reads from the socket.
+    """
+
+    total: float | None = 60.0
+    connect: float | None = 10.0
+    read: float | None = 30.0
+
+    def client_timeout(
+        self, remaining: float | None = None
+    ) -> aiohttp.ClientTimeout:
+        """Build an aiohttp timeout capped by the remaining deadline."""
+        total = self.total
+        if remaining is not None:
+            total = remaining if total is None else min(total, remaining)
+
+        return aiohttp.ClientTimeout(
+            total=total, sock_connect=self.connect, sock_read=self.read
+        )
+
+    def stream_timeout(
+        self, remaining: float | None = None
+    ) -> aiohttp.ClientTimeout:
+        """Build an aiohttp timeout for a streamed body.
+
+        ``total`` is not applied since large bodies may take longer to read,
+        only the remaining deadline bounds the whole transfer.
+        """
+        return aiohttp.ClientTimeout(
+            total=remaining, sock_connect=self.connect, sock_read=self.read
+        )
+
+
+def current_timeout(default: TimeoutData) -> TimeoutData:
+    """Apply the timeout override of the current context, if any."""
+    override = _timeout_override.get()
+    if not override:
+        return default
+
+    return replace(default, **override)
+
+
+@contextmanager
+def request_timeout(
+    total: float | None = None,
+    connect: float | None = None,
+    read: float | None = None,
+) -> Iterator[None]:
+    """Override client timeouts for requests made inside the block.
+
+    Only the given values are overridden, the rest is taken from the
+    client settings::
+
+        with request_timeout(total=5):
+            await client.get_thread(thread_id)
+
+    Args:
+        total: Seconds for a whole attempt.
+        connect: Seconds to connect.
+        read: Seconds between two socket reads.
+    """
+    changes = {
+        name: value
+        for name, value in (
+            ("total", total),
+            ("connect", connect),
+            ("read", read),
+        )
+        if value is not None
+    }
+    parent = _timeout_override.get() or {}
+    token = _timeout_override.set({**parent, **changes})
+    try:
+        yield
+    finally:
+        _timeout_override.reset(token)
+
+
+def override_key() -> tuple[tuple[str, float], ...]:
+    """Return the timeout override of the current context as a hashable."""
+    return tuple(sorted((_timeout_override.get() or {}).items()))
+
+
+def remaining() -> float | None:
+    """Return seconds left until the context deadline, or None."""
+    at = _deadline.get()
+    if at is None:
+        return None
+
+    return at - time.monotonic()
+
+
+@contextmanager
+def deadline(seconds: float | None) -> Iterator[None]:
+    """Bound everything done inside the block by a deadline.
+
+    Requests, retries and rate limiter waits inside the block fail with
+    ``DeadlineExceededError`` once the deadline passes. Nested deadlines
+    can only shorten the outer one::
+
+        with deadline(10):
+            async for thread in client.iter_threads():
+                ...
+
+    Args:
+        seconds: Seconds from now, ``None`` keeps the current deadline.
+    """
+    if seconds is None:
+        yield
+        return
+
+    at = time.monotonic() + seconds
+    parent = _deadline.get()
+    if parent is not None:
+        at = min(at, parent)
+
+    token = _deadline.set(at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def share(parts: int) -> float | None:
+    """Split the remaining deadline evenly between sub-requests.
+
+    Args:
+        parts: Number of sub-requests still to be made.
+
+    Returns:
+        Seconds available to the next sub-request, or None if there is no
+        deadline.
+    """
+    left = remaining()
+    if left is None:
+        return None
+
+    return max(0.0, left) / max(1, parts)
@@ -1,8 +1,7 @@
 from enum import Enum
 
-from pydantic import BaseModel
-
 from ...types.content_type import ContentTypeEnum
+from ..base import BaseModel
 from ..user import User
 
 __all__ = ("AlertActionTypeEnum", "UserAlert")
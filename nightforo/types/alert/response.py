@@ -1,7 +1,6 @@
 from typing import List
 
-from pydantic import BaseModel
-
+from ..base import BaseModel
 from ..pagination import Pagination
 from .alert import UserAlert
 
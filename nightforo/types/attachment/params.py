@@ -1,9 +1,11 @@
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, field_serializer
+from pydantic import field_serializer
 
 from nightforo.types.content_type import ContentTypeEnum
 
+from ..base import BaseModel
+
 __all__ = (
     "AttachmentUploadParams",
     "AttachmentsCreateNewKeyParams",
@@ -1,7 +1,8 @@
 from typing import BinaryIO, List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import ConfigDict
 
+from ..base import BaseModel
 from .attachment import Attachment
 
 __all__ = (
@@ -1,6 +1,8 @@
 from typing import Optional
 
-from pydantic import BaseModel, field_serializer
+from pydantic import field_serializer
+
+from ..base import BaseModel
 
 __all__ = ("AuthFromSessionParams", "AuthLoginTokenParams", "AuthTestParams")
 
@@ -1,7 +1,6 @@
 from typing import Optional
 
-from pydantic import BaseModel
-
+from ..base import BaseModel
 from ..user import User
 
 __all__ = (
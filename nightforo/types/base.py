@@ -0,0 +1,99 @@
+"""Base of the API models."""
+
+from __future__ import annotations
+
+import importlib
+import threading
+from typing import Any
+
+from pydantic import BaseModel as PydanticModel
+from pydantic import ConfigDict
+from pydantic.fields import FieldInfo
+
+__all__ = ("BaseModel", "model_fields")
+
+# Names the models import only for type checking, to avoid import cycles,
+# by the module using them and the module defining them
+_FORWARD_REFS = {
+    "nightforo.types.conversation.response": {
+        "ConversationMessage": "nightforo.types.conversation_message",
+    },
+    "nightforo.types.forum.response": {"Node": "nightforo.types.node"},
+    "nightforo.types.post.post": {"Thread": "nightforo.types.thread"},
+    "nightforo.types.thread.thread": {"Node": "nightforo.types.node"},
+    "nightforo.types.profile_post.profile_post": {
+        "ProfilePostComment": "nightforo.types.profile_post_comment",
+        "User": "nightforo.types.user",
+    },
+    "nightforo.types.profile_post_comment.profile_post_comment": {
+        "ProfilePost": "nightforo.types.profile_post",
+        "User": "nightforo.types.user",
+    },
+}
+_resolved = False
+# Models are built on first use in the event loop and by the warm-up
+# thread at the same time. Reentrant, since building a model may build
+# the models of its fields.
+_build_lock = threading.RLock()
+
+
+def _resolve_forward_refs() -> None:
+    """Put the names imported for type checking into the module globals.
+
+    Called before the first model is built, once every module can be
+    imported without running into a cycle.
+    """
+    global _resolved
+    with _build_lock:
+        if _resolved:
+            return
+
+        for module_name, names in _FORWARD_REFS.items():
+            module = importlib.import_module(module_name)
+            for name, source in names.items():
+                value = getattr(importlib.import_module(source), name)
+                setattr(module, name, value)
+
+        _resolved = True
+
+
+class BaseModel(PydanticModel):
+    """Model whose validator is built the first time it is used.
+
+    Building validators of every API model at import is most of the import
+    time of the package, so it is deferred until a model validates or
+    serializes something.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+    @classmethod
+    def model_rebuild(
+        cls,
+        *,
+        force: bool = False,
+        raise_errors: bool = True,
+        _parent_namespace_depth: int = 2,
+        _types_namespace: Any = None,
+    ) -> bool | None:
+        """Resolve forward references and build the model."""
+        with _build_lock:
+            _resolve_forward_refs()
+            return super().model_rebuild(
+                force=force,
+                raise_errors=raise_errors,
+                _parent_namespace_depth=_parent_namespace_depth + 1,
+                _types_namespace=_types_namespace,
+            )
+
+
+def model_fields(model: type[PydanticModel]) -> dict[str, FieldInfo]:
+    """Return the fields of ``model`` with forward references resolved."""
+    # Older pydantic versions only tell whether the whole model is built
+    complete = getattr(
+        model, "__pydantic_fields_complete__", model.__pydantic_complete__
+    )
+    if not complete:
+        model.model_rebuild()
+
+    return model.model_fields
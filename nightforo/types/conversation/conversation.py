@@ -1,7 +1,8 @@
 from typing import Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ..base import BaseModel
 from ..user import User
 
 __all__ = ("Conversation",)
@@ -1,11 +1,14 @@
-from typing import List, Optional
+from __future__ import annotations
 
-from pydantic import BaseModel
+from typing import TYPE_CHECKING
 
-from ..conversation_message import ConversationMessage
+from ..base import BaseModel
 from ..pagination import Pagination
 from .conversation import Conversation
 
+if TYPE_CHECKING:
+    from ..conversation_message import ConversationMessage
+
 __all__ = (
     "ConversationCreateResponse",
     "ConversationDeleteResponse",
@@ -21,7 +24,7 @@ __all__ = (
 
 
 class ConversationsGetResponse(BaseModel):
-    conversations: List[Conversation]
+    conversations: list[Conversation]
     pagination: Pagination
 
 
@@ -32,8 +35,8 @@ class ConversationCreateResponse(BaseModel):
 
 class ConversationGetResponse(BaseModel):
     conversation: Conversation
-    messages: Optional[List[ConversationMessage]] = None
-    pagination: Optional[Pagination] = None
+    messages: list[ConversationMessage] | None = None
+    pagination: Pagination | None = None
 
 
 class ConversationUpdateResponse(BaseModel):
@@ -58,7 +61,7 @@ class ConversationMarkUnreadResponse(BaseModel):
 
 
 class ConversationMessagesGetResponse(BaseModel):
-    messages: List[ConversationMessage]
+    messages: list[ConversationMessage]
     pagination: Pagination
 
 
@@ -1,9 +1,10 @@
 from enum import Enum
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
 from ..attachment import Attachment
+from ..base import BaseModel
 from ..conversation import Conversation
 from ..user import User
 
@@ -1,6 +1,6 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from ..base import BaseModel
 
 __all__ = (
     "ConversationMessageReactParams",
@@ -1,5 +1,4 @@
-from pydantic import BaseModel
-
+from ..base import BaseModel
 from .conversation_message import ConversationMessage
 
 __all__ = (
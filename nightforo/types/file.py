@@ -1,10 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import mimetypes
+import os
 from dataclasses import dataclass
-from typing import BinaryIO
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Union,
+)
+
+__all__ = ("FileSource", "UploadProgress", "XenforoFile")
 
-__all__ = ("XenforoFile",)
+FileSource = Union[BinaryIO, str, "os.PathLike[str]", AsyncIterable[bytes]]
+UploadProgress = Callable[[int, Union[int, None]], Any]
 
 
 @dataclass
 class XenforoFile:
-    stream: BinaryIO
+    """File sent as a field of a multipart request.
+
+    Attributes:
+        stream: Open binary file, path on disk or async iterable of chunks.
+        name: Name of the form field.
+        filename: File name sent to the server, guessed from the path or
+            the file object when not given.
+        content_type: Content type, guessed from the file name when not
+            given.
+        progress: Called with the number of bytes sent and the total size
+            (``None`` if unknown) after every chunk.
+        chunk_size: Size of chunks read from disk.
+    """
+
+    stream: FileSource
     name: str
+    filename: str | None = None
+    content_type: str | None = None
+    progress: UploadProgress | None = None
+    chunk_size: int = 65536
+
+    @property
+    def reusable(self) -> bool:
+        """Whether the body can be built again to resend the request."""
+        return isinstance(self.stream, (str, os.PathLike))
+
+    def guess_filename(self) -> str:
+        if self.filename:
+            return self.filename
+
+        source = self.stream
+        if isinstance(source, (str, os.PathLike)):
+            path = os.fspath(source)
+        else:
+            path = getattr(source, "name", None)
+
+        if isinstance(path, str) and path:
+            return os.path.basename(path)
+
+        # Without a file name the server does not treat the part as a file
+        return self.name
+
+    def guess_content_type(self) -> str:
+        if self.content_type:
+            return self.content_type
+
+        guessed, _ = mimetypes.guess_type(self.guess_filename())
+        return guessed or "application/octet-stream"
+
+    def payload(self) -> BinaryIO | AsyncIterable[bytes]:
+        """Return the body of the field, read from disk in chunks."""
+        source = self.stream
+        if isinstance(source, (str, os.PathLike)):
+            return self._read_path(source)
+
+        if hasattr(source, "__aiter__"):
+            if self.progress is None:
+                return source  # type: ignore
+
+            return self._report(source, None)  # type: ignore
+
+        if self.progress is None:
+            return source  # type: ignore
+
+        return self._read(source, _size(source))  # type: ignore
+
+    async def _read_path(
+        self, path: str | os.PathLike[str]
+    ) -> AsyncIterator[bytes]:
+        with open(path, "rb") as file:
+            total = os.fstat(file.fileno()).st_size
+            async for chunk in self._read(file, total):
+                yield chunk
+
+    async def _read(
+        self, file: BinaryIO, total: int | None
+    ) -> AsyncIterator[bytes]:
+        loop = asyncio.get_running_loop()
+        sent = 0
+        while True:
+            chunk = await loop.run_in_executor(
+                None, file.read, self.chunk_size
+            )
+            if not chunk:
+                break
+
+            yield chunk
+
+            sent += len(chunk)
+            if self.progress is not None:
+                self.progress(sent, total)
+
+    async def _report(
+        self, chunks: AsyncIterable[bytes], total: int | None
+    ) -> AsyncIterator[bytes]:
+        sent = 0
+        async for chunk in chunks:
+            yield chunk
+
+            sent += len(chunk)
+            if self.progress is not None:
+                self.progress(sent, total)
+
+
+def _size(file: BinaryIO) -> int | None:
+    try:
+        position = file.tell()
+        end = file.seek(0, os.SEEK_END)
+        file.seek(position)
+    except (OSError, ValueError):
+        return None
+
+    return end - position
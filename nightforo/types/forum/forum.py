@@ -1,6 +1,8 @@
 from typing import Any, Dict, List, Union
 
-from pydantic import BaseModel, field_validator
+from pydantic import field_validator
+
+from ..base import BaseModel
 
 __all__ = (
     "ForumTypeData",
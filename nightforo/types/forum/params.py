@@ -1,10 +1,11 @@
 from enum import Enum
 from typing import Optional, Union
 
-from pydantic import BaseModel, field_serializer
+from pydantic import field_serializer
 
 from ...types.direction import DirectionTypeEnum
 from ...types.thread_type import ThreadTypeEnum
+from ..base import BaseModel
 
 __all__ = (
     "ForumGetParams",
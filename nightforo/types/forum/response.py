@@ -1,11 +1,14 @@
-from typing import List, Optional
+from __future__ import annotations
 
-from pydantic import BaseModel
+from typing import TYPE_CHECKING
 
-from ..node import Node
+from ..base import BaseModel
 from ..pagination import Pagination
 from ..thread import Thread
 
+if TYPE_CHECKING:
+    from ..node import Node
+
 __all__ = (
     "ForumGetResponse",
     "ForumMarkReadResponse",
@@ -15,9 +18,9 @@ __all__ = (
 
 class ForumGetResponse(BaseModel):
     forum: Node
-    threads: Optional[List[Thread]] = None
-    pagination: Optional[Pagination] = None
-    sticky: Optional[List[Thread]] = None
+    threads: list[Thread] | None = None
+    pagination: Pagination | None = None
+    sticky: list[Thread] | None = None
 
 
 class ForumMarkReadResponse(BaseModel):
@@ -25,6 +28,6 @@ class ForumMarkReadResponse(BaseModel):
 
 
 class ForumThreadsGetResponse(BaseModel):
-    threads: List[Thread]
+    threads: list[Thread]
     pagination: Pagination
-    sticky: Optional[List[Thread]] = None
+    sticky: list[Thread] | None = None
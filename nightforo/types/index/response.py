@@ -1,9 +1,10 @@
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, field_validator
+from pydantic import field_validator
 
 from ...types.api_key_type import ApiKeyTypeEnum
 from ...types.api_scopes import APIScopeIdsEnum
+from ..base import BaseModel
 
 __all__ = ("ApiKey", "IndexGetResponse")
 
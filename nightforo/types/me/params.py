@@ -1,7 +1,8 @@
 from typing import Dict, Optional
 
-from pydantic import BaseModel, ConfigDict, field_serializer
+from pydantic import ConfigDict, field_serializer
 
+from ..base import BaseModel
 from ..user import Option, Privacy, Profile
 
 __all__ = (
@@ -1,5 +1,4 @@
-from pydantic import BaseModel
-
+from ..base import BaseModel
 from ..user import User
 
 __all__ = (
@@ -1,7 +1,5 @@
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel
-
 from nightforo.types.forum.forum import LinkForumTypeData
 
 from ...types.forum import (
@@ -10,6 +8,7 @@ from ...types.forum import (
 )
 from ...types.node_type import NodeTypeEnum
 from ...types.page import PageTypeData
+from ..base import BaseModel
 
 AnyNodeTypeData = Union[
     ForumTypeData,
@@ -1,6 +1,6 @@
 from typing import Literal, Optional, TypeVar, Union
 
-from pydantic import BaseModel, field_serializer
+from pydantic import field_serializer
 
 from ...types.forum.forum import (
     ForumTypeData,
@@ -10,6 +10,7 @@ from ...types.forum.forum import (
 from ...types.node.node import AnyNodeTypeData
 from ...types.node_type import NodeTypeEnum
 from ...types.page.page import PageTypeData
+from ..base import BaseModel
 
 __all__ = (
     "AnyNodeCreateParams",
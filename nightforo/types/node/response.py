@@ -1,7 +1,6 @@
 from typing import Dict, List
 
-from pydantic import BaseModel
-
+from ..base import BaseModel
 from .node import Node
 
 __all__ = (
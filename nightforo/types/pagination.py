@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from .base import BaseModel
 
 __all__ = ("Pagination",)
 
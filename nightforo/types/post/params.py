@@ -1,7 +1,8 @@
 from typing import Optional
 
-from pydantic import BaseModel, field_serializer
+from pydantic import field_serializer
 
+from ..base import BaseModel
 from ..vote_type import VoteTypeEnum
 
 __all__ = (
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
 from ...types.discussion_state import DiscussionStateEnum
 from ..attachment import Attachment
+from ..base import BaseModel
 from ..user import User
 
 if TYPE_CHECKING:
@@ -1,8 +1,7 @@
 from typing import Optional
 
-from pydantic import BaseModel
-
 from ...types.post_react_state import PostReactStateEnum
+from ..base import BaseModel
 from .post import Post
 
 __all__ = (
@@ -1,8 +1,9 @@
 from typing import Optional
 
-from pydantic import BaseModel, field_serializer
+from pydantic import field_serializer
 
 from ...types.direction import DirectionTypeEnum
+from ..base import BaseModel
 
 __all__ = (
     "ProfilePostCreateParams",
@@ -1,8 +1,7 @@
 from typing import List, Optional
 
-from pydantic import BaseModel
-
 from ...types.post_react_state import PostReactStateEnum
+from ..base import BaseModel
 from ..pagination import Pagination
 from ..profile_post_comment import ProfilePostComment
 from .profile_post import ProfilePost
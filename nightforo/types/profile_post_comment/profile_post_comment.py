@@ -1,8 +1,9 @@
 from typing import TYPE_CHECKING, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
 from ..attachment import Attachment
+from ..base import BaseModel
 
 if TYPE_CHECKING:
     from ..profile_post import ProfilePost
@@ -1,6 +1,5 @@
-from pydantic import BaseModel
-
 from ...types.post_react_state import PostReactStateEnum
+from ..base import BaseModel
 from . import ProfilePostComment
 
 __all__ = (
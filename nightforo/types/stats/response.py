@@ -1,5 +1,4 @@
-from pydantic import BaseModel
-
+from ..base import BaseModel
 from .stats import LatestUser, Online, Totals
 
 __all__ = ("StatsResponse",)
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
 from ...types.discussion_state import DiscussionStateEnum
+from ..base import BaseModel
 from ..user import User
 from ..vote_type import VoteTypeEnum
 
@@ -1,7 +1,8 @@
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, field_serializer
+from pydantic import field_serializer
 
+from ..base import BaseModel
 from ..groups import ArzGuardGroupsIdsEnum
 from .user import DateOfBirth, Option, Privacy, Profile
 
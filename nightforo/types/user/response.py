@@ -1,7 +1,8 @@
 from typing import Dict, List, Optional, Union
 
-from pydantic import BaseModel, field_validator
+from pydantic import field_validator
 
+from ..base import BaseModel
 from ..groups import ArzGuardGroupsIdsEnum, ArzGuardGroupsNamesEnum
 from ..pagination import Pagination
 from ..profile_post import ProfilePost
@@ -1,9 +1,10 @@
 from enum import Enum
 from typing import List, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
 from ...types.groups import ArzGuardGroupsIdsEnum
+from ..base import BaseModel
 
 __all__ = (
     "DateOfBirth",
@@ -0,0 +1,186 @@
+"""Concurrent upload of several files to one attachment key."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    TypeVar,
+)
+
+import aiohttp
+
+from .endpoint import HTTPMethod
+from .errors import DeadlineExceededError, XenForoError
+from .retry import RetryData
+
+if TYPE_CHECKING:
+    from .types.attachment import Attachment
+    from .types.file import FileSource
+
+__all__ = ("AttachmentUploadResult", "FileUploadResult", "UploadData")
+
+C = TypeVar("C")
+
+
+def _default_retry_data() -> RetryData:
+    return RetryData(methods={HTTPMethod.POST})
+
+
+@dataclass
+class UploadData:
+    """Settings of multi-file attachment uploads.
+
+    Attributes:
+        concurrency: Maximum number of files uploaded at the same time.
+        retry_data: Retry policy of a single file. Unlike plain requests
+            uploads are retried on transient failures by default, files
+            given as async iterables are never sent twice.
+    """
+
+    concurrency: int = 4
+    retry_data: RetryData = field(default_factory=_default_retry_data)
+
+
+@dataclass
+class FileUploadResult:
+    """Outcome of uploading one file.
+
+    Attributes:
+        source: File as it was passed in.
+        attachment: Uploaded attachment, ``None`` if the upload failed.
+        error: Error of the last attempt, ``None`` on success.
+        attempts: Number of attempts made.
+    """
+
+    source: FileSource
+    attachment: Attachment | None = None
+    error: BaseException | None = None
+    attempts: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.attachment is not None
+
+
+@dataclass
+class AttachmentUploadResult(Generic[C]):
+    """Outcome of uploading files to one attachment key.
+
+    Attributes:
+        key: Attachment key the files were uploaded to. Pass it back
+            together with the failed sources to upload only those again.
+        files: Result of every file, in the order they were passed.
+        content: Content created with the key, ``None`` if some file
+            failed or no content was requested.
+    """
+
+    key: str
+    files: list[FileUploadResult]
+    content: C | None = None
+
+    @property
+    def ok(self) -> bool:
+        return all(result.ok for result in self.files)
+
+    @property
+    def failed(self) -> list[FileUploadResult]:
+        return [result for result in self.files if not result.ok]
+
+
+async def upload_files(
+    upload: Callable[[FileSource], Awaitable[Attachment]],
+    sources: Iterable[FileSource],
+    data: UploadData,
+) -> list[FileUploadResult]:
+    """Upload files concurrently and collect the result of each one.
+
+    Failures are recorded in the results instead of being raised, so one
+    broken file does not abort the others.
+
+    Args:
+        upload: Coroutine function uploading one file to the key.
+        sources: Files to upload.
+        data: Concurrency and retry settings.
+    """
+    semaphore = asyncio.Semaphore(data.concurrency)
+    results = [FileUploadResult(source) for source in sources]
+
+    await asyncio.gather(
+        *(
+            _upload(upload, result, semaphore, data.retry_data)
+            for result in results
+        )
+    )
+    return results
+
+
+async def _upload(
+    upload: Callable[[FileSource], Awaitable[Attachment]],
+    result: FileUploadResult,
+    semaphore: asyncio.Semaphore,
+    retry_data: RetryData,
+) -> None:
+    source = result.source
+
+    async with semaphore:
+        position = _position(source)
+        started = time.monotonic()
+        while True:
+            result.attempts += 1
+            try:
+                result.attachment = await upload(source)
+            except DeadlineExceededError as e:
+                result.error = e
+                return
+            except (
+                XenForoError,
+                aiohttp.ClientError,
+                asyncio.TimeoutError,
+            ) as e:
+                result.error = e
+            else:
+                result.error = None
+                return
+
+            if position is None:
+                return
+
+            delay = retry_data.next_delay(
+                HTTPMethod.POST,
+                result.error,
+                result.attempts,
+                time.monotonic() - started,
+            )
+            if delay is None:
+                return
+
+            await asyncio.sleep(delay)
+
+            if position >= 0:
+                source.seek(position)  # type: ignore
+
+
+def _position(source: FileSource) -> int | None:
+    """Return where to rewind the source before a retry.
+
+    -1 means the source is read from the start every time, ``None`` means
+    it can not be sent again.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return -1
+
+    if hasattr(source, "__aiter__"):
+        return None
+
+    try:
+        return source.tell()  # type: ignore
+    except (OSError, ValueError):
+        return None
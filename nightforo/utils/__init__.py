@@ -1 +1,2 @@
 from .logger import *  # noqa: F403
+from .loop_lag import *  # noqa: F403
@@ -0,0 +1,94 @@
+"""Measurement of how late the event loop runs scheduled callbacks."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from dataclasses import dataclass
+
+__all__ = ("LoopLagMonitor", "LoopLagStats")
+
+
+@dataclass
+class LoopLagStats:
+    """Lag of the event loop seen by a monitor, in seconds.
+
+    Attributes:
+        samples: Number of measurements taken.
+        last: Lag of the latest measurement.
+        max: Largest lag measured.
+        total: Sum of all measured lags.
+    """
+
+    samples: int = 0
+    last: float = 0.0
+    max: float = 0.0
+    total: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        """Average lag of all measurements."""
+        return self.total / self.samples if self.samples else 0.0
+
+
+class LoopLagMonitor:
+    """Wakes up every ``interval`` seconds and records how late it woke.
+
+    A late wake-up means something held the event loop, e.g. parsing a
+    large response, and every other coroutine was delayed as much. Can be
+    used as an async context manager::
+
+        async with LoopLagMonitor() as monitor:
+            await client.get_thread(1)
+        print(monitor.stats.max)
+
+    Args:
+        interval: Seconds between measurements.
+    """
+
+    def __init__(self, interval: float = 0.01) -> None:
+        self.interval = interval
+        self.stats = LoopLagStats()
+        self._task: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> LoopLagMonitor:
+        """Start measuring."""
+        self.start()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Stop measuring."""
+        await self.stop()
+
+    def start(self) -> None:
+        """Start measuring in a task of the running loop."""
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._measure())
+
+    async def stop(self) -> None:
+        """Stop measuring, the collected stats are kept."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    def reset(self) -> None:
+        """Forget the collected stats."""
+        self.stats = LoopLagStats()
+
+    async def _measure(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(time.perf_counter() - expected, 0.0)
+
+            stats = self.stats
+            stats.samples += 1
+            stats.last = lag
+            stats.total += lag
+            if lag > stats.max:
+                stats.max = lag
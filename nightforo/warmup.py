@@ -0,0 +1,119 @@
+"""Building model validators ahead of the first request."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Sequence
+
+from pydantic import BaseModel
+
+__all__ = ("SchemaWarmUp", "WarmUpData")
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass
+class WarmUpData:
+    """Settings of the schema warm-up.
+
+    Attributes:
+        models: Models to build, every response model by default.
+        background: Build the models in a daemon thread. When false the
+            client is only created once every model is built.
+    """
+
+    models: Sequence[type[BaseModel]] | None = None
+    background: bool = True
+
+
+def _response_models() -> list[type[BaseModel]]:
+    """Return every response model of the package."""
+    import nightforo
+
+    models = []
+    for name in nightforo.__all__:
+        if name.endswith("Response"):
+            value = getattr(nightforo, name)
+            if isinstance(value, type) and issubclass(value, BaseModel):
+                models.append(value)
+
+    return models
+
+
+class SchemaWarmUp:
+    """Builds the validators of models so the first requests do not.
+
+    Models are built one by one, the time each one took is available in
+    ``timings`` while the warm-up runs. Models already built by a request
+    are skipped. Builds share one lock with the builds made on first use,
+    so a request needing a model waits for at most the model being built.
+
+    Args:
+        data: Warm-up settings.
+    """
+
+    def __init__(self, data: WarmUpData) -> None:
+        self._data = data
+        self.timings: dict[str, float] = {}
+        self.total: float | None = None
+        self._done = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def done(self) -> bool:
+        """Whether every model is built."""
+        return self._done.is_set()
+
+    def start(self) -> None:
+        """Run the warm-up, in a background thread if configured."""
+        if not self._data.background:
+            self._run()
+            return
+
+        self._thread = threading.Thread(
+            target=self._run, name="nightforo-warm-up", daemon=True
+        )
+        self._thread.start()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the warm-up is finished.
+
+        Returns:
+            Whether the warm-up finished within ``timeout``.
+        """
+        return self._done.wait(timeout)
+
+    def _run(self) -> None:
+        started = time.perf_counter()
+        try:
+            models = self._data.models
+            if models is None:
+                models = _response_models()
+
+            for model in models:
+                if model.__pydantic_complete__:
+                    continue
+
+                model_started = time.perf_counter()
+                model.model_rebuild()
+                elapsed = time.perf_counter() - model_started
+                self.timings[model.__name__] = elapsed
+                _log.debug(
+                    "Built %s validator in %.1f ms",
+                    model.__name__,
+                    elapsed * 1000,
+                )
+        except Exception:
+            _log.exception("Schema warm-up failed")
+        finally:
+            self.total = time.perf_counter() - started
+            self._done.set()
+
+        _log.info(
+            "Schema warm-up built %d models in %.1f ms",
+            len(self.timings),
+            self.total * 1000,
+        )
@@ -0,0 +1,119 @@
+"""Tests of the response cache."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from nightforo import cache as cache_module
+from nightforo.cache import CacheData, ResponseCache, request_key
+
+URL = "https://forum.example/api/users/1"
+
+
+def make_cache() -> ResponseCache:
+    return ResponseCache(CacheData(ttl={"users": 60.0}))
+
+
+def body(document: object) -> bytes:
+    return json.dumps(document).encode()
+
+
+def test_write_response_refreshes_the_cached_read() -> None:
+    cache = make_cache()
+    key = request_key(URL, None, None)
+    cache.set(key, "users", body({"user": {"user_id": 1, "title": "Old"}}))
+
+    cache.invalidate(
+        URL, body({"success": True, "user": {"user_id": 1, "title": "New"}})
+    )
+
+    cached = cache.get(key)
+    assert cached is not None
+    assert json.loads(cached) == {"user": {"user_id": 1, "title": "New"}}
+    assert cache.stats.refreshes == 1
+
+
+def test_null_in_write_response_evicts_the_cached_read() -> None:
+    cache = make_cache()
+    key = request_key(URL, None, None)
+    cache.set(key, "users", body({"user": {"user_id": 1, "title": "Old"}}))
+
+    cache.invalidate(URL, body({"success": True, "user": None}))
+
+    assert cache.get(key) is None
+    assert cache.stats.refreshes == 0
+    assert cache.stats.invalidations == 1
+
+
+def test_fresh_response_is_a_hit() -> None:
+    cache = make_cache()
+    key = request_key(URL, {"page": 1}, None)
+
+    assert cache.get(key) is None
+    cache.set(key, "users", b"{}")
+
+    assert cache.get(key) == b"{}"
+    assert cache.get(request_key(URL, {"page": 2}, None)) is None
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.size) == (1, 2, 1)
+
+
+def test_response_expires_after_its_ttl(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = make_cache()
+    key = request_key(URL, None, None)
+    cache.set(key, "users", b"{}")
+
+    now[0] += 59.0
+    assert cache.get(key) == b"{}"
+
+    now[0] += 1.0
+    assert cache.get(key) is None
+    assert cache.stats.expirations == 1
+    assert cache.stats.size == 0
+
+
+def test_families_without_ttl_are_not_cached() -> None:
+    cache = make_cache()
+    key = request_key(URL, None, None)
+
+    cache.set(key, "threads", b"{}")
+
+    assert cache.get(key) is None
+
+
+def test_write_evicts_the_entity_and_urls_below_it() -> None:
+    cache = make_cache()
+    entity = request_key(URL, None, None)
+    below = request_key(URL + "/profile-posts", None, None)
+    other = request_key(URL + "0", None, None)
+    for key in (entity, below, other):
+        cache.set(key, "users", body({"user": {"user_id": 1}}))
+
+    cache.invalidate(URL)
+
+    assert cache.get(entity) is None
+    assert cache.get(below) is None
+    assert cache.get(other) is not None
+    assert cache.stats.invalidations == 2
+
+
+def test_least_recently_used_response_is_evicted() -> None:
+    cache = ResponseCache(CacheData(max_size=2, ttl={"users": 60.0}))
+    first, second, third = (
+        request_key(f"{URL}{n}", None, None) for n in range(3)
+    )
+    cache.set(first, "users", b"1")
+    cache.set(second, "users", b"2")
+    cache.get(first)
+
+    cache.set(third, "users", b"3")
+
+    assert cache.get(second) is None
+    assert cache.get(first) == b"1"
+    assert cache.stats.evictions == 1
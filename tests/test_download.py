@@ -0,0 +1,59 @@
+"""Tests of attachment downloads."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import threading
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any, AsyncIterator
+
+from nightforo import Client
+
+CHUNKS = [b"a" * 10, b"b" * 10, b"c" * 5]
+
+
+class RecordingFile(io.BytesIO):
+    """In-memory file remembering the threads it was written from."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.threads: set[threading.Thread] = set()
+
+    def write(self, data: Any) -> int:
+        self.threads.add(threading.current_thread())
+        return super().write(data)
+
+
+def test_chunks_are_written_outside_the_event_loop() -> None:
+    client = Client("key")
+
+    async def iter_chunks(chunk_size: int) -> AsyncIterator[bytes]:
+        for chunk in CHUNKS:
+            yield chunk
+
+    @asynccontextmanager
+    async def get_attachment_data(
+        attachment_id: int, offset: int = 0
+    ) -> AsyncIterator[SimpleNamespace]:
+        yield SimpleNamespace(offset=0, total=25, iter_chunks=iter_chunks)
+
+    client._http.get_attachment_data = get_attachment_data  # type: ignore
+    file = RecordingFile()
+    progress: list[tuple[int, int | None]] = []
+
+    async def main() -> int:
+        try:
+            return await client.download_attachment(
+                1,
+                file,
+                progress=lambda done, total: progress.append((done, total)),
+            )
+        finally:
+            await client.close()
+
+    assert asyncio.run(main()) == 25
+    assert file.getvalue() == b"".join(CHUNKS)
+    assert progress == [(10, 25), (20, 25), (25, 25)]
+    assert threading.main_thread() not in file.threads
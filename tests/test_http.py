@@ -0,0 +1,96 @@
+"""Tests of the request loop of the HTTP client."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from nightforo.cache import CacheData
+from nightforo.endpoint import HTTPMethod
+from nightforo.errors import RateLimitedError
+from nightforo.http import HTTPClient
+from nightforo.ratelimit import RateLimit, RateLimitData
+from nightforo.retry import RetryData
+
+
+def always_rate_limited(client: HTTPClient) -> list[str]:
+    """Make every request of ``client`` fail with 429."""
+    sent: list[str] = []
+
+    async def send(
+        session: Any, endpoint: Any, *args: Any, **kw: Any
+    ) -> bytes:
+        sent.append(endpoint.url)
+        raise RateLimitedError("Too many requests", retry_after=0.001)
+
+    client._send = send  # type: ignore[method-assign]
+    return sent
+
+
+def request(client: HTTPClient) -> None:
+    async def main() -> None:
+        try:
+            await client.request(HTTPMethod.GET, "threads/1")
+        finally:
+            await client.close()
+
+    with pytest.raises(RateLimitedError):
+        asyncio.run(main())
+
+
+def test_rate_limiter_owns_429_when_configured() -> None:
+    client = HTTPClient(
+        "key",
+        rate_limit_data=RateLimitData(
+            limit=RateLimit(rate=1000, burst=1000), max_retries=3
+        ),
+        retry_data=RetryData(max_attempts=3, base_delay=0.001),
+    )
+    sent = always_rate_limited(client)
+
+    request(client)
+
+    # The first attempt and 3 resends, no retries on top of them
+    assert len(sent) == 4
+
+
+def test_429_is_retried_without_a_rate_limiter() -> None:
+    client = HTTPClient(
+        "key", retry_data=RetryData(max_attempts=3, base_delay=0.001)
+    )
+    sent = always_rate_limited(client)
+
+    request(client)
+
+    assert len(sent) == 3
+
+
+def test_cached_get_is_not_sent_again_until_a_write() -> None:
+    client = HTTPClient("key", cache_data=CacheData(ttl={"threads": 60.0}))
+    sent: list[str] = []
+
+    async def send(
+        session: Any, endpoint: Any, method: HTTPMethod, *args: Any, **kw: Any
+    ) -> bytes:
+        sent.append(method.value)
+        if method is HTTPMethod.DELETE:
+            return b'{"success": true}'
+
+        return b'{"thread": {"thread_id": 1}}'
+
+    client._send = send  # type: ignore[method-assign]
+
+    async def main() -> None:
+        try:
+            await client.request(HTTPMethod.GET, "threads/1")
+            await client.request(HTTPMethod.GET, "threads/1")
+            await client.request(HTTPMethod.DELETE, "threads/1")
+            await client.request(HTTPMethod.GET, "threads/1")
+        finally:
+            await client.close()
+
+    asyncio.run(main())
+
+    assert sent == ["GET", "DELETE", "GET"]
@@ -0,0 +1,83 @@
+"""Tests of the identity map."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from nightforo.identity import CONTEXT_KEY, IdentityMap, identity_model
+from nightforo.parsing import parse
+from nightforo.types.user import User
+
+USER = {
+    "user_id": 1,
+    "username": "author",
+    "last_activity": 100,
+    "view_url": "https://forum.example/members/1",
+    "is_staff": False,
+    **dict.fromkeys(
+        (
+            "can_ban",
+            "can_converse",
+            "can_edit",
+            "can_follow",
+            "can_ignore",
+            "can_post_profile",
+            "can_view_profile",
+            "can_view_profile_posts",
+            "can_warn",
+        ),
+        True,
+    ),
+    **dict.fromkeys(
+        (
+            "message_count",
+            "question_solution_count",
+            "register_date",
+            "reaction_score",
+            "trophy_points",
+            "vote_score",
+        ),
+        1,
+    ),
+}
+
+
+def test_map_is_consistent_between_threads() -> None:
+    identity = IdentityMap(maxsize=50)
+
+    def work(offset: int) -> None:
+        for key in range(offset, offset + 2000):
+            identity.put(key % 200, object())  # type: ignore
+            identity.get((key * 7) % 200)
+
+    threads = [
+        threading.Thread(target=work, args=(offset,)) for offset in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(identity) == 50
+    assert identity.hits + identity.misses == 8 * 2000
+
+
+class Pair(BaseModel):
+    first: User
+    second: User
+
+
+def test_shared_users_are_frozen() -> None:
+    payload = {"first": USER, "second": dict(USER)}
+    pair = parse(identity_model(Pair), payload, {CONTEXT_KEY: IdentityMap()})
+
+    assert pair.first is pair.second
+    with pytest.raises(ValidationError):
+        pair.first.username = "changed"
+
+    copy = pair.first.model_copy(update={"username": "changed"})
+    assert copy.username == "changed"
+    assert pair.second.username == "author"
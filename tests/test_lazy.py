@@ -0,0 +1,67 @@
+"""Tests of lazy response views."""
+
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from nightforo import ThreadsGetResponse
+from nightforo.lazy import LazyView, lazy_view
+
+
+def page() -> dict[str, object]:
+    return {
+        "threads": [
+            {
+                "thread_id": "1",
+                "title": "First",
+                "reply_count": "not a number",
+                "User": {"user_id": 7, "username": "author"},
+            }
+        ],
+        "pagination": {"current_page": 1},
+    }
+
+
+def test_fields_are_validated_on_first_access() -> None:
+    view = lazy_view(ThreadsGetResponse, page())
+
+    (item,) = view.threads
+    assert isinstance(item, LazyView)
+    # Coerced like a validated model would be
+    assert item.thread_id == 1
+    assert item.title == "First"
+    with pytest.raises(ValidationError):
+        _ = item.reply_count
+
+
+def test_converted_fields_are_cached() -> None:
+    view = lazy_view(ThreadsGetResponse, page())
+
+    assert view.threads is view.threads
+    assert "thread_id" not in view.threads[0].__dict__
+    assert view.threads[0].thread_id == 1
+    assert view.threads[0].__dict__["thread_id"] == 1
+
+
+def test_nested_models_become_views() -> None:
+    (item,) = lazy_view(ThreadsGetResponse, page()).threads
+
+    assert isinstance(item.user, LazyView)
+    assert item.user.username == "author"
+
+
+def test_missing_required_field_raises_attribute_error() -> None:
+    (item,) = lazy_view(ThreadsGetResponse, page()).threads
+
+    with pytest.raises(AttributeError):
+        _ = item.node_id
+    with pytest.raises(AttributeError):
+        _ = item.no_such_field
+
+
+def test_whole_view_is_validated_by_to_model() -> None:
+    (item,) = lazy_view(ThreadsGetResponse, page()).threads
+
+    with pytest.raises(ValidationError):
+        item.to_model()
@@ -0,0 +1,55 @@
+"""Tests of batched entity loaders."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from nightforo.loader import DataLoader
+
+
+def test_keys_of_one_batch_are_fetched_once() -> None:
+    fetched: list[int] = []
+
+    async def fetch(key: int) -> int:
+        fetched.append(key)
+        await asyncio.sleep(0)
+        return key * 10
+
+    async def main() -> list[int]:
+        loader: DataLoader[int, int] = DataLoader(fetch)
+        return await loader.load_many([1, 2, 1, 3, 2])
+
+    assert asyncio.run(main()) == [10, 20, 10, 30, 20]
+    assert sorted(fetched) == [1, 2, 3]
+
+
+@pytest.mark.parametrize("started", [True, False])
+def test_cancelled_batch_releases_its_callers(started: bool) -> None:
+    async def main() -> list[BaseException | int]:
+        in_fetch = asyncio.Event()
+
+        async def fetch(key: int) -> int:
+            in_fetch.set()
+            await asyncio.sleep(10)
+            return key
+
+        loader: DataLoader[int, int] = DataLoader(fetch)
+        callers = [asyncio.ensure_future(loader.load(key)) for key in (1, 2)]
+        while not loader._tasks:
+            await asyncio.sleep(0)
+        if started:
+            await in_fetch.wait()
+
+        (task,) = loader._tasks
+        task.cancel()
+        assert in_fetch.is_set() is started
+
+        return await asyncio.wait_for(
+            asyncio.gather(*callers, return_exceptions=True), timeout=1
+        )
+
+    results = asyncio.run(main())
+
+    assert all(isinstance(r, asyncio.CancelledError) for r in results)
@@ -0,0 +1,62 @@
+"""Tests of the Prometheus metrics."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from nightforo.endpoint import HTTPMethod, create_endpoint
+from nightforo.http import HTTPClient
+from nightforo.instrumentation import InstrumentationData
+from nightforo.metrics import ClientMetrics, MetricsData, _Metric
+
+BODY = b"x" * 100_000
+
+
+def test_metric_without_samples_can_not_be_created() -> None:
+    with pytest.raises(TypeError):
+        _Metric("nightforo_broken", "No samples.")  # type: ignore[abstract]
+
+
+def test_downloads_are_measured() -> None:
+    async def data(request: web.Request) -> web.Response:
+        return web.Response(body=BODY, content_type="image/png")
+
+    async def main() -> str:
+        app = web.Application()
+        app.router.add_get("/api/attachments/{id}/data", data)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+
+        http = HTTPClient(
+            "key",
+            instrumentation_data=InstrumentationData(loop_lag_interval=None),
+        )
+        assert http.instrumentation is not None
+        metrics = ClientMetrics(http, MetricsData())
+        http.instrumentation.add_listener(metrics.observe)
+
+        endpoint = create_endpoint(
+            f"http://127.0.0.1:{port}/api/attachments/1/data", HTTPMethod.GET
+        )
+        try:
+            async with http._stream(endpoint) as stream:
+                received = b"".join([chunk async for chunk in stream])
+        finally:
+            await http.close()
+            await runner.cleanup()
+
+        assert received == BODY
+        return metrics.render()
+
+    rendered = asyncio.run(main())
+
+    route = 'client="default",method="GET",route="attachments/{id}/data"'
+    assert f'nightforo_requests_total{{{route},status="200"}} 1' in rendered
+    assert f"nightforo_request_duration_seconds_count{{{route}}} 1" in rendered
+    assert f'{route},phase="read"}}' in rendered
@@ -0,0 +1,137 @@
+"""Tests of the page iteration."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from types import SimpleNamespace
+
+import pytest
+
+from nightforo import timeouts
+from nightforo.errors import DeadlineExceededError
+from nightforo.paginator import paginate
+from nightforo.timeouts import deadline, remaining
+
+LAST_PAGE = 21
+PER_PAGE = 3
+# Deadline a fetch needs to succeed, the clock does not move
+LATENCY = 1.0
+
+
+@pytest.fixture(autouse=True)
+def frozen_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Freeze the deadline clock, so deadline shares are exact."""
+    monkeypatch.setattr(
+        timeouts, "time", SimpleNamespace(monotonic=lambda: 0.0)
+    )
+
+
+class FakeAPI:
+    """Paged endpoint recording how it is called."""
+
+    def __init__(self) -> None:
+        self.started: list[int] = []
+        self.budgets: dict[int, float | None] = {}
+        self.active = 0
+        self.peak = 0
+
+    async def fetch(self, page: int) -> SimpleNamespace:
+        self.started.append(page)
+        left = self.budgets[page] = remaining()
+        if left is not None and left < LATENCY:
+            raise DeadlineExceededError("Deadline exceeded")
+
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            # Stay in flight for a few loop iterations, later pages first
+            for _ in range(LAST_PAGE - page + 2):
+                await asyncio.sleep(0)
+        finally:
+            self.active -= 1
+
+        return SimpleNamespace(
+            pagination=SimpleNamespace(current_page=page, last_page=LAST_PAGE),
+            items=[(page, index) for index in range(PER_PAGE)],
+        )
+
+
+def crawl(
+    api: FakeAPI,
+    concurrency: int,
+    seconds: float | None = None,
+    ordered: bool = True,
+) -> list[tuple[int, int]]:
+    async def main() -> list[tuple[int, int]]:
+        with deadline(seconds):
+            return [
+                item
+                async for item in paginate(
+                    api.fetch,
+                    lambda response: response.items,
+                    concurrency=concurrency,
+                    ordered=ordered,
+                )
+            ]
+
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize("concurrency", [1, 2, 4])
+def test_pages_are_requested_in_order_with_bounded_concurrency(
+    concurrency: int,
+) -> None:
+    api = FakeAPI()
+
+    items = crawl(api, concurrency)
+
+    assert items == [
+        (page, index)
+        for page in range(1, LAST_PAGE + 1)
+        for index in range(PER_PAGE)
+    ]
+    assert api.started == list(range(1, LAST_PAGE + 1))
+    assert api.peak == concurrency
+
+
+def test_unordered_pages_are_yielded_as_they_arrive() -> None:
+    api = FakeAPI()
+
+    items = crawl(api, 4, ordered=False)
+
+    pages = [page for page, index in items if index == 0]
+    assert sorted(pages) == list(range(1, LAST_PAGE + 1))
+    assert pages != sorted(pages)
+    assert api.peak == 4
+
+
+@pytest.mark.parametrize("concurrency", [1, 2, 4])
+def test_deadline_is_shared_between_the_waves_left(concurrency: int) -> None:
+    api = FakeAPI()
+
+    crawl(api, concurrency, seconds=100.0)
+
+    # The first page assumes at least one more page to come
+    assert api.budgets[1] == 50.0
+    for page in range(2, LAST_PAGE + 1):
+        waves = math.ceil((LAST_PAGE - page + 1) / concurrency)
+        assert api.budgets[page] == pytest.approx(100.0 / waves)
+
+
+@pytest.mark.parametrize("concurrency", [1, 2, 4])
+def test_tight_deadline_is_enough(concurrency: int) -> None:
+    # The second page shares the deadline between the most waves
+    seconds = LATENCY * math.ceil((LAST_PAGE - 1) / concurrency)
+
+    items = crawl(FakeAPI(), concurrency, seconds)
+
+    assert len(items) == LAST_PAGE * PER_PAGE
+
+
+@pytest.mark.parametrize("concurrency", [1, 2, 4])
+def test_shorter_deadline_fails(concurrency: int) -> None:
+    seconds = LATENCY * math.ceil((LAST_PAGE - 1) / concurrency) * 0.9
+
+    with pytest.raises(DeadlineExceededError):
+        crawl(FakeAPI(), concurrency, seconds)
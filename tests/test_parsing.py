@@ -0,0 +1,83 @@
+"""Tests of response validation."""
+
+from __future__ import annotations
+
+import json
+from enum import Enum
+from typing import Any, Union, get_args, get_origin
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from nightforo import (
+    ThreadPostsGetResponse,
+    ThreadsGetResponse,
+    UserGetResponse,
+)
+from nightforo.parsing import parse
+from nightforo.types.base import model_fields
+
+MODELS = (ThreadsGetResponse, ThreadPostsGetResponse, UserGetResponse)
+
+
+def sample(annotation: Any, seen: tuple[type, ...]) -> Any:
+    """Build a JSON value of ``annotation`` with every field filled in."""
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Union or (origin is not None and type(None) in args):
+        return sample(next(a for a in args if a is not type(None)), seen)
+    if origin in (list, tuple, set):
+        return [sample(args[0], seen), sample(args[0], seen)] if args else []
+    if origin is dict:
+        return {"1": sample(args[1], seen)} if args else {}
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            if annotation in seen:
+                return None
+            return {
+                field.alias or name: sample(
+                    field.annotation, (*seen, annotation)
+                )
+                for name, field in model_fields(annotation).items()
+            }
+        if issubclass(annotation, Enum):
+            return next(iter(annotation)).value
+        if issubclass(annotation, bool):
+            return True
+        if issubclass(annotation, (int, float)):
+            return 42
+        if issubclass(annotation, str):
+            return "text"
+
+    return None
+
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda m: m.__name__)
+def test_bytes_and_decoded_payloads_give_the_same_model(
+    model: type[BaseModel],
+) -> None:
+    body = json.dumps(sample(model, ())).encode()
+
+    from_bytes = parse(model, body)
+    from_dict = model.model_validate(json.loads(body))
+
+    assert type(from_bytes) is model
+    assert from_bytes == from_dict
+    assert from_bytes.model_dump() == from_dict.model_dump()
+
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda m: m.__name__)
+def test_bytes_and_decoded_payloads_fail_alike(
+    model: type[BaseModel],
+) -> None:
+    # Every response has models or lists of them at the top level
+    body = json.dumps(dict.fromkeys(sample(model, ()), "text")).encode()
+
+    with pytest.raises(ValidationError) as from_bytes:
+        parse(model, body)
+    with pytest.raises(ValidationError) as from_dict:
+        model.model_validate(json.loads(body))
+
+    assert [e["loc"] for e in from_bytes.value.errors()] == [
+        e["loc"] for e in from_dict.value.errors()
+    ]
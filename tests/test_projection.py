@@ -0,0 +1,90 @@
+"""Tests of field projections."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from nightforo import Thread, ThreadsGetResponse, User
+from nightforo.parsing import parse
+from nightforo.projection import project, project_list
+from nightforo.types.base import model_fields
+
+PAGINATION = {
+    "current_page": 1,
+    "last_page": 1,
+    "per_page": 20,
+    "shown": 2,
+    "total": 2,
+}
+
+
+def thread(thread_id: int) -> dict[str, object]:
+    # Only the selected fields need to be valid, the rest is skipped
+    return {
+        "thread_id": thread_id,
+        "title": f"Thread {thread_id}",
+        "reply_count": "not validated",
+        "User": {"user_id": 7, "username": "author", "is_staff": None},
+        "Forum": None,
+    }
+
+
+def test_projection_keeps_only_the_selected_fields() -> None:
+    slim = project(Thread, {"thread_id", "title"})
+
+    assert set(model_fields(slim)) == {"thread_id", "title"}
+    parsed = parse(slim, json.dumps(thread(1)).encode())
+    assert (parsed.thread_id, parsed.title) == (1, "Thread 1")
+    assert not hasattr(parsed, "reply_count")
+
+
+def test_selected_fields_are_still_validated() -> None:
+    slim = project(Thread, {"thread_id", "reply_count"})
+
+    with pytest.raises(ValidationError):
+        parse(slim, json.dumps(thread(1)).encode())
+
+
+def test_dotted_names_project_nested_models() -> None:
+    slim = project(Thread, {"thread_id", "user.username"})
+
+    parsed = parse(slim, json.dumps(thread(1)).encode())
+
+    assert set(model_fields(type(parsed.user))) == {"username"}
+    assert parsed.user.username == "author"
+
+
+def test_projections_are_cached() -> None:
+    assert project(Thread, ["title", "thread_id"]) is project(
+        Thread, {"thread_id", "title"}
+    )
+
+
+def test_unknown_field_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        project(Thread, {"thread_id", "no_such_field"})
+
+    with pytest.raises(ValueError):
+        project(Thread, {"title.length"})
+
+
+def test_list_projection_keeps_pagination() -> None:
+    slim = project_list(ThreadsGetResponse, "threads", {"thread_id"})
+    body = json.dumps(
+        {"threads": [thread(1), thread(2)], "pagination": PAGINATION}
+    ).encode()
+
+    parsed = parse(slim, body)
+
+    assert [item.thread_id for item in parsed.threads] == [1, 2]
+    assert parsed.pagination.last_page == 1
+    assert set(model_fields(type(parsed.threads[0]))) == {"thread_id"}
+
+
+def test_user_projection_ignores_other_required_fields() -> None:
+    slim = project(User, {"user_id"})
+
+    assert parse(slim, b'{"user_id": 3, "username": null}').user_id == 3
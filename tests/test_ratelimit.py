@@ -0,0 +1,43 @@
+"""Tests of the adaptive rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+
+from nightforo.ratelimit import RateLimit, RateLimitData, RateLimiter
+
+
+def test_burst_of_rejections_cuts_the_rate_once() -> None:
+    limiter = RateLimiter(
+        RateLimitData(
+            limit=RateLimit(rate=10, burst=10),
+            families={"threads": RateLimit(rate=5, burst=10)},
+        )
+    )
+
+    async def rejected_request() -> None:
+        await limiter.acquire("threads")
+        # The response arrives while the other requests are in flight
+        await asyncio.sleep(0.01)
+        limiter.on_rate_limited("threads", retry_after=1.0)
+
+    async def burst() -> None:
+        await asyncio.gather(*(rejected_request() for _ in range(10)))
+
+    asyncio.run(burst())
+
+    factor = limiter.data.backoff_factor
+    assert limiter.rate_limited == 10
+    assert limiter._global.rate == 10 * factor
+    assert limiter._families["threads"].rate == 5 * factor
+
+
+def test_rejection_after_the_window_cuts_the_rate_again() -> None:
+    limiter = RateLimiter(RateLimitData(limit=RateLimit(rate=10, burst=10)))
+
+    limiter.on_rate_limited("threads", retry_after=1.0)
+    # The window has passed
+    limiter._global._blocked_until = 0.0
+    limiter.on_rate_limited("threads", retry_after=1.0)
+
+    assert limiter._global.rate == 10 * limiter.data.backoff_factor**2
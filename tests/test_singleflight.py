@@ -0,0 +1,80 @@
+"""Tests of request coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from nightforo.errors import DeadlineExceededError
+from nightforo.singleflight import SingleFlight
+from nightforo.timeouts import deadline, remaining, request_timeout
+
+
+def test_followers_do_not_inherit_the_leader_deadline() -> None:
+    flight = SingleFlight()
+    seen: list[float | None] = []
+
+    async def call() -> str:
+        seen.append(remaining())
+        await asyncio.sleep(0.2)
+        return "body"
+
+    async def leader() -> str:
+        with deadline(0.05):
+            return await flight.do("key", call)
+
+    async def follower() -> str:
+        await asyncio.sleep(0)
+        return await flight.do("key", call)
+
+    async def main() -> list[object]:
+        return await asyncio.gather(
+            leader(), follower(), return_exceptions=True
+        )
+
+    first, second = asyncio.run(main())
+
+    assert isinstance(first, DeadlineExceededError)
+    assert second == "body"
+    assert seen == [None]
+    assert flight.stats.executed == 1
+    assert flight.stats.coalesced == 1
+
+
+def test_expired_deadline_does_not_start_a_call() -> None:
+    flight = SingleFlight()
+    started: list[bool] = []
+
+    async def call() -> str:
+        started.append(True)
+        return "body"
+
+    async def main() -> str:
+        with deadline(0):
+            return await flight.do("key", call)
+
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(main())
+
+    assert not started
+
+
+def test_callers_with_other_timeouts_are_not_coalesced() -> None:
+    flight = SingleFlight()
+
+    async def call() -> str:
+        await asyncio.sleep(0.01)
+        return "body"
+
+    async def shorter() -> str:
+        with request_timeout(total=1):
+            return await flight.do("key", call)
+
+    async def main() -> None:
+        await asyncio.gather(flight.do("key", call), shorter())
+
+    asyncio.run(main())
+
+    assert flight.stats.executed == 2
+    assert flight.stats.coalesced == 0